@@ -0,0 +1,55 @@
+"""Add timestamp indexes to message, transaction and vertex_build
+
+Revision ID: 93e2705fa8d6
+Revises: 4522eb831f5c
+Create Date: 2024-08-27 10:12:31.482913
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision: str = "93e2705fa8d6"
+down_revision: Union[str, None] = "4522eb831f5c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "message": {
+        "ix_message_session_id_timestamp": ["session_id", "timestamp"],
+        "ix_message_flow_id_session_id_timestamp": ["flow_id", "session_id", "timestamp"],
+    },
+    "transaction": {"ix_transaction_flow_id_timestamp": ["flow_id", "timestamp"]},
+    "vertex_build": {"ix_vertex_build_flow_id_timestamp": ["flow_id", "timestamp"]},
+}
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)  # type: ignore
+    table_names = inspector.get_table_names()
+    for table_name, indexes in INDEXES.items():
+        if table_name not in table_names:
+            continue
+        indexes_names = [index["name"] for index in inspector.get_indexes(table_name)]
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            for index_name, columns in indexes.items():
+                if index_name not in indexes_names:
+                    batch_op.create_index(index_name, columns, unique=False)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)  # type: ignore
+    table_names = inspector.get_table_names()
+    for table_name, indexes in INDEXES.items():
+        if table_name not in table_names:
+            continue
+        indexes_names = [index["name"] for index in inspector.get_indexes(table_name)]
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            for index_name in indexes:
+                if index_name in indexes_names:
+                    batch_op.drop_index(index_name)
@@ -0,0 +1,72 @@
+"""Add the id to the timestamp indexes of message, transaction and vertex_build
+
+Revision ID: b23d2d0e338d
+Revises: 93e2705fa8d6
+Create Date: 2024-08-28 10:41:07.513021
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy.engine.reflection import Inspector
+
+# revision identifiers, used by Alembic.
+revision: str = "b23d2d0e338d"
+down_revision: Union[str, None] = "93e2705fa8d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The indexes of 93e2705fa8d6 and the indexes that replace them, which end with the id pages are ordered by
+INDEXES = {
+    "message": [
+        (
+            ("ix_message_session_id_timestamp", ["session_id", "timestamp"]),
+            ("ix_message_session_id_timestamp_id", ["session_id", "timestamp", "id"]),
+        ),
+        (
+            ("ix_message_flow_id_session_id_timestamp", ["flow_id", "session_id", "timestamp"]),
+            ("ix_message_flow_id_session_id_timestamp_id", ["flow_id", "session_id", "timestamp", "id"]),
+        ),
+    ],
+    "transaction": [
+        (
+            ("ix_transaction_flow_id_timestamp", ["flow_id", "timestamp"]),
+            ("ix_transaction_flow_id_timestamp_id", ["flow_id", "timestamp", "id"]),
+        ),
+    ],
+    "vertex_build": [
+        (
+            ("ix_vertex_build_flow_id_timestamp", ["flow_id", "timestamp"]),
+            ("ix_vertex_build_flow_id_timestamp_build_id", ["flow_id", "timestamp", "build_id"]),
+        ),
+    ],
+}
+
+
+def replace_indexes(reverse: bool) -> None:
+    conn = op.get_bind()
+    inspector = Inspector.from_engine(conn)  # type: ignore
+    table_names = inspector.get_table_names()
+    for table_name, replacements in INDEXES.items():
+        if table_name not in table_names:
+            continue
+        indexes_names = [index["name"] for index in inspector.get_indexes(table_name)]
+        with op.batch_alter_table(table_name, schema=None) as batch_op:
+            for old, new in replacements:
+                if reverse:
+                    old, new = new, old
+                old_name, _ = old
+                new_name, new_columns = new
+                if old_name in indexes_names:
+                    batch_op.drop_index(old_name)
+                if new_name not in indexes_names:
+                    batch_op.create_index(new_name, new_columns, unique=False)
+
+
+def upgrade() -> None:
+    replace_indexes(reverse=False)
+
+
+def downgrade() -> None:
+    replace_indexes(reverse=True)
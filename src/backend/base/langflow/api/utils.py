@@ -3,9 +3,10 @@ import warnings
 from typing import TYPE_CHECKING, Any
 
 from fastapi import HTTPException
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.graph.graph.base import Graph
+from langflow.graph.graph.memo import get_vertex_memo_cache
 from langflow.services.chat.service import ChatService
 from langflow.services.database.models.flow import Flow
 from langflow.services.store.schema import StoreComponentCreate
@@ -139,15 +140,15 @@ async def build_graph_from_data(flow_id: str, payload: dict, **kwargs):
     return graph
 
 
-async def build_graph_from_db_no_cache(flow_id: str, session: Session):
+async def build_graph_from_db_no_cache(flow_id: str, session: AsyncSession):
     """Build and cache the graph."""
-    flow: Flow | None = session.get(Flow, flow_id)
+    flow: Flow | None = await session.get(Flow, uuid.UUID(flow_id))
     if not flow or not flow.data:
         raise ValueError("Invalid flow ID")
     return await build_graph_from_data(flow_id, flow.data, flow_name=flow.name, user_id=str(flow.user_id))
 
 
-async def build_graph_from_db(flow_id: str, session: Session, chat_service: "ChatService"):
+async def build_graph_from_db(flow_id: str, session: AsyncSession, chat_service: "ChatService"):
     graph = await build_graph_from_db_no_cache(flow_id, session)
     await chat_service.set_cache(flow_id, graph)
     return graph
@@ -239,3 +240,12 @@ def parse_value(value: Any, input_type: str) -> Any:
         return float(value) if value is not None else None
     else:
         return value
+
+
+def get_memo_stats(flow_id: str, vertex_id: str) -> dict[str, int]:
+    """Returns the memo hits and misses of a vertex, or an empty dict if vertex memoization is disabled."""
+    memo_cache = get_vertex_memo_cache()
+    if memo_cache is None:
+        return {}
+    stats = memo_cache.vertex_stats(flow_id, vertex_id)
+    return {"memo_hits": stats["hits"], "memo_misses": stats["misses"]}
@@ -100,6 +100,7 @@ def delete_store_api_key(
 ):
     try:
         current_user.store_api_key = None
+        db.add(current_user)
         db.commit()
         return {"detail": "API Key deleted"}
     except Exception as e:
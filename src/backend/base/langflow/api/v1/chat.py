@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Annotated
 from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 from loguru import logger
+from sqlmodel.ext.asyncio.session import AsyncSession
 from starlette.background import BackgroundTask
 from starlette.responses import ContentStream
 from starlette.types import Receive
@@ -20,6 +21,7 @@ from langflow.api.utils import (
     build_graph_from_db_no_cache,
     format_elapsed_time,
     format_exception_message,
+    get_memo_stats,
     get_top_level_vertices,
     parse_exception,
 )
@@ -37,7 +39,13 @@ from langflow.graph.utils import log_vertex_build
 from langflow.schema.schema import OutputValue
 from langflow.services.auth.utils import get_current_active_user
 from langflow.services.chat.service import ChatService
-from langflow.services.deps import get_chat_service, get_session, get_session_service, get_telemetry_service
+from langflow.services.deps import (
+    async_session_scope,
+    get_async_session,
+    get_chat_service,
+    get_session_service,
+    get_telemetry_service,
+)
 from langflow.services.telemetry.schema import ComponentPayload, PlaygroundPayload
 from langflow.services.telemetry.service import TelemetryService
 
@@ -72,7 +80,7 @@ async def retrieve_vertices_order(
     stop_component_id: str | None = None,
     start_component_id: str | None = None,
     chat_service: "ChatService" = Depends(get_chat_service),
-    session=Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
     telemetry_service: "TelemetryService" = Depends(get_telemetry_service),
 ):
     """
@@ -84,7 +92,7 @@ async def retrieve_vertices_order(
         stop_component_id (str, optional): The ID of the stop component. Defaults to None.
         start_component_id (str, optional): The ID of the start component. Defaults to None.
         chat_service (ChatService, optional): The chat service dependency. Defaults to Depends(get_chat_service).
-        session (Session, optional): The session dependency. Defaults to Depends(get_session).
+        session (AsyncSession, optional): The session dependency. Defaults to Depends(get_async_session).
 
     Returns:
         VerticesOrderResponse: The response containing the ordered vertex IDs and the run ID.
@@ -150,7 +158,7 @@ async def build_flow(
     chat_service: "ChatService" = Depends(get_chat_service),
     current_user=Depends(get_current_active_user),
     telemetry_service: "TelemetryService" = Depends(get_telemetry_service),
-    session=Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ):
     async def build_graph_and_get_order() -> tuple[list[str], list[str], "Graph"]:
         start_time = time.perf_counter()
@@ -211,6 +219,7 @@ async def build_flow(
         top_level_vertices = []
         start_time = time.perf_counter()
         error_message = None
+        memoized = False
         try:
             vertex = graph.get_vertex(vertex_id)
             try:
@@ -227,6 +236,7 @@ async def build_flow(
                 params = vertex_build_result.params
                 valid = vertex_build_result.valid
                 artifacts = vertex_build_result.artifacts
+                memoized = vertex_build_result.memoized
                 next_runnable_vertices = await graph.get_next_runnable_vertices(lock, vertex=vertex, cache=False)
                 top_level_vertices = graph.get_top_level_vertices(next_runnable_vertices)
 
@@ -290,6 +300,8 @@ async def build_flow(
                 params=params,
                 id=vertex.id,
                 data=result_data_response,
+                memoized=memoized,
+                **get_memo_stats(flow_id_str, vertex.id),
             )
             background_tasks.add_task(
                 telemetry_service.log_package_component,
@@ -482,14 +494,16 @@ async def build_vertex(
     top_level_vertices = []
     start_time = time.perf_counter()
     error_message = None
+    memoized = False
     try:
         cache = await chat_service.get_cache(flow_id_str)
         if not cache:
             # If there's no cache
             logger.warning(f"No cache found for {flow_id_str}. Building graph starting at {vertex_id}")
-            graph: "Graph" = await build_graph_from_db(
-                flow_id=flow_id_str, session=next(get_session()), chat_service=chat_service
-            )
+            async with async_session_scope() as session:
+                graph: "Graph" = await build_graph_from_db(
+                    flow_id=flow_id_str, session=session, chat_service=chat_service
+                )
         else:
             graph = cache.get("result")
             await graph.initialize_run()
@@ -509,6 +523,7 @@ async def build_vertex(
             params = vertex_build_result.params
             valid = vertex_build_result.valid
             artifacts = vertex_build_result.artifacts
+            memoized = vertex_build_result.memoized
             next_runnable_vertices = await graph.get_next_runnable_vertices(lock, vertex=vertex, cache=False)
             top_level_vertices = graph.get_top_level_vertices(next_runnable_vertices)
             result_data_response = ResultDataResponse.model_validate(result_dict, from_attributes=True)
@@ -575,6 +590,8 @@ async def build_vertex(
             params=params,
             id=vertex.id,
             data=result_data_response,
+            memoized=memoized,
+            **get_memo_stats(flow_id_str, vertex.id),
         )
         background_tasks.add_task(
             telemetry_service.log_package_component,
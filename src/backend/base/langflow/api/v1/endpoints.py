@@ -23,13 +23,14 @@ from langflow.api.v1.schemas import (
     UploadFileResponse,
 )
 from langflow.custom.custom_component.component import Component
+from langflow.custom.eval import get_component_class_cache
 from langflow.custom.utils import build_custom_component_template, get_instance_name
 from langflow.exceptions.api import APIException, InvalidChatInputException
-from langflow.graph.graph.base import Graph
 from langflow.graph.schema import RunOutputs
 from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
 from langflow.interface.initialize.loading import update_params_with_load_from_db_fields
-from langflow.processing.process import process_tweaks, run_graph_internal
+from langflow.processing.graph_cache import get_prepared_graph_cache
+from langflow.processing.process import run_graph_internal
 from langflow.schema.graph import Tweaks
 from langflow.services.auth.utils import api_key_security, get_current_active_user
 from langflow.services.cache.utils import save_uploaded_file
@@ -118,9 +119,15 @@ async def simple_run_flow(
         flow_id_str = str(flow.id)
         if flow.data is None:
             raise ValueError(f"Flow {flow_id_str} has no data")
-        graph_data = flow.data.copy()
-        graph_data = process_tweaks(graph_data, input_request.tweaks or {}, stream=stream)
-        graph = Graph.from_payload(graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name)
+        graph = get_prepared_graph_cache().get_graph(
+            flow_id=flow_id_str,
+            flow_data=flow.data,
+            updated_at=flow.updated_at,
+            tweaks=input_request.tweaks,
+            stream=stream,
+            flow_name=flow.name,
+            user_id=str(user_id),
+        )
         inputs = [
             InputValueRequest(components=[], input_value=input_request.input_value, type=input_request.input_type)
         ]
@@ -367,6 +374,7 @@ async def experimental_run_flow(
     tweaks: Annotated[Tweaks | None, Body(embed=True)] = None,  # noqa: F821
     stream: Annotated[bool, Body(embed=True)] = False,  # noqa: F821
     session_id: Annotated[None | str, Body(embed=True)] = None,  # noqa: F821
+    max_parallel_runs: Annotated[int | None, Body(embed=True, ge=0)] = None,  # noqa: F821
     api_key_user: UserRead = Depends(api_key_security),
     session_service: SessionService = Depends(get_session_service),
 ):
@@ -381,6 +389,7 @@ async def experimental_run_flow(
     - `tweaks` (Optional[Tweaks], optional): A dictionary of tweaks to customize the flow execution. The tweaks can be used to modify the flow's parameters and components. Tweaks can be overridden by the input values.
     - `stream` (bool, optional): Specifies whether the results should be streamed. Defaults to False.
     - `session_id` (Union[None, str], optional): An optional session ID to utilize existing session data for the flow execution.
+    - `max_parallel_runs` (Optional[int], optional): Runs the inputs as a concurrent batch, each input on its own copy of the flow, with at most this many running at the same time (0 means no limit). Each input reports its own error in `error` instead of failing the request. By default the inputs run one after the other.
     - `api_key_user` (User): The user associated with the current API key. Automatically resolved from the API key.
     - `session_service` (SessionService): The session service object for managing flow sessions.
 
@@ -430,9 +439,12 @@ async def experimental_run_flow(
 
             if flow.data is None:
                 raise ValueError(f"Flow {flow_id_str} has no data")
-            graph_data = flow.data
-            graph_data = process_tweaks(graph_data, tweaks or {})
-            graph = Graph.from_payload(graph_data, flow_id=flow_id_str)
+            graph = get_prepared_graph_cache().get_graph(
+                flow_id=flow_id_str,
+                flow_data=flow.data,
+                updated_at=flow.updated_at,
+                tweaks=tweaks,
+            )
         task_result, session_id = await run_graph_internal(
             graph=graph,
             flow_id=flow_id_str,
@@ -440,6 +452,7 @@ async def experimental_run_flow(
             inputs=inputs,
             outputs=outputs,
             stream=stream,
+            max_parallel_runs=max_parallel_runs,
         )
 
         return RunResponse(outputs=task_result, session_id=session_id)
@@ -587,6 +600,10 @@ async def custom_component_update(
 
     """
     try:
+        # The class compiled from the code the component had before this edit won't be used again
+        previous_code = code_request.template.get("code")
+        if isinstance(previous_code, dict) and previous_code.get("value") not in (None, code_request.code):
+            get_component_class_cache().invalidate(previous_code["value"])
         component = Component(_code=code_request.code)
 
         component_node, cc_instance = build_custom_component_template(
@@ -1,3 +1,4 @@
+import asyncio
 import io
 import json
 import re
@@ -14,7 +15,10 @@ from sqlmodel import Session, and_, col, select
 
 from langflow.api.utils import remove_api_keys, validate_is_component
 from langflow.api.v1.schemas import FlowListCreate
+from langflow.graph.utils import flush_logs
 from langflow.initial_setup.setup import STARTER_FOLDER_NAME
+from langflow.processing.flow_cache import invalidate_flow
+from langflow.processing.graph_cache import get_prepared_graph_cache
 from langflow.services.auth.utils import get_current_active_user
 from langflow.services.database.models.flow import Flow, FlowCreate, FlowRead, FlowUpdate
 from langflow.services.database.models.flow.utils import delete_flow_by_id, get_webhook_component_in_flow
@@ -150,7 +154,8 @@ def read_flows(
                 )
             ).all()
         else:
-            flows = current_user.flows
+            # The current user isn't bound to the session, so its flows are queried
+            flows = session.exec(select(Flow).where(Flow.user_id == current_user.id)).all()
 
         flows = validate_is_component(flows)  # type: ignore
         flow_ids = [flow.id for flow in flows]
@@ -228,6 +233,8 @@ def update_flow(
         session.add(db_flow)
         session.commit()
         session.refresh(db_flow)
+        get_prepared_graph_cache().invalidate(str(flow_id))
+        invalidate_flow(flow_id)
         return db_flow
     except Exception as e:
         # If it is a validation error, return the error message
@@ -269,6 +276,8 @@ def delete_flow(
         raise HTTPException(status_code=404, detail="Flow not found")
     delete_flow_by_id(str(flow_id), session)
     session.commit()
+    get_prepared_graph_cache().invalidate(str(flow_id))
+    invalidate_flow(flow_id)
     return {"message": "Flow deleted successfully"}
 
 
@@ -335,6 +344,8 @@ async def delete_multiple_flows(
 
     """
     try:
+        # Logs of the flows still queued would otherwise be written after they are deleted
+        await asyncio.to_thread(flush_logs)
         flows_to_delete = db.exec(select(Flow).where(col(Flow.id).in_(flow_ids)).where(Flow.user_id == user.id)).all()
         for flow in flows_to_delete:
             transactions_to_delete = get_transactions_by_flow_id(db, flow.id)
@@ -347,7 +358,11 @@ async def delete_multiple_flows(
 
             db.delete(flow)
 
+        deleted_flow_ids = [str(flow.id) for flow in flows_to_delete]
         db.commit()
+        for flow_id in deleted_flow_ids:
+            get_prepared_graph_cache().invalidate(flow_id)
+            invalidate_flow(flow_id)
         return {"deleted": len(flows_to_delete)}
     except Exception as exc:
         logger.exception(exc)
@@ -7,6 +7,7 @@ from langflow.api.v1.flows import create_flows
 from langflow.api.v1.schemas import FlowListCreate, FlowListReadWithFolderName
 from langflow.helpers.flow import generate_unique_flow_name
 from langflow.helpers.folders import generate_unique_folder_name
+from langflow.processing.flow_cache import invalidate_flow
 from langflow.services.auth.utils import get_current_active_user
 from langflow.services.database.models.flow.model import Flow, FlowCreate, FlowRead
 from langflow.services.database.models.folder.constants import DEFAULT_FOLDER_NAME
@@ -184,9 +185,12 @@ def delete_folder(
         session.delete(folder)
         session.commit()
         flows = session.exec(select(Flow).where(Flow.folder_id == folder_id, Folder.user_id == current_user.id)).all()
+        deleted_flow_ids = [flow.id for flow in flows]
         for flow in flows:
             session.delete(flow)
         session.commit()
+        for flow_id in deleted_flow_ids:
+            invalidate_flow(flow_id)
         return Response(status_code=status.HTTP_204_NO_CONTENT)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
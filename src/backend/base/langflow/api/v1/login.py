@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
+from fastapi.security.utils import get_authorization_scheme_param
 from langflow.services.database.models.user.crud import get_user_by_id
 from sqlmodel import Session
 
 from langflow.api.v1.schemas import Token
+from langflow.services.auth.cache import invalidate_token
 from langflow.services.auth.utils import (
     authenticate_user,
     create_refresh_token,
@@ -165,7 +167,11 @@ async def refresh_token(
 
 
 @router.post("/logout")
-async def logout(response: Response):
+async def logout(request: Request, response: Response):
+    scheme, token = get_authorization_scheme_param(request.headers.get("Authorization"))
+    for access_token in (token if scheme.lower() == "bearer" else None, request.cookies.get("access_token_lf")):
+        if access_token:
+            invalidate_token(access_token)
     response.delete_cookie("refresh_token_lf")
     response.delete_cookie("access_token_lf")
     response.delete_cookie("apikey_tkn_lflw")
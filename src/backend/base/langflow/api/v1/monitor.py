@@ -1,32 +1,63 @@
+import asyncio
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy import delete
 from sqlmodel import Session, col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from langflow.custom.eval import get_component_class_cache
+from langflow.graph.utils import flush_logs
+from langflow.memory import flush_messages, get_history_cache
+from langflow.services.auth.cache import get_api_key_cache, get_token_cache
 from langflow.services.auth.utils import get_current_active_user
 from langflow.services.database.models.message.model import MessageRead, MessageTable, MessageUpdate
-from langflow.services.database.models.transactions.crud import get_transactions_by_flow_id
+from langflow.services.database.models.transactions.crud import aget_transactions_by_flow_id
 from langflow.services.database.models.transactions.model import TransactionReadResponse
 from langflow.services.database.models.user.model import User
 from langflow.services.database.models.vertex_builds.crud import (
-    get_vertex_builds_by_flow_id,
+    aget_vertex_builds_by_flow_id,
     delete_vertex_builds_by_flow_id,
 )
 from langflow.services.database.models.vertex_builds.model import VertexBuildMapModel
-from langflow.services.deps import get_session
-from langflow.services.monitor.schema import MessageModelResponse
+from langflow.services.database.pagination import Cursor, get_next_cursor, paginate
+from langflow.services.deps import get_async_session, get_cache_service, get_session
+from langflow.services.monitor.schema import CacheStatsResponse, MessageModelResponse
 
 router = APIRouter(prefix="/monitor", tags=["Monitor"])
 
+# Response header with the cursor of the next page of a paginated list
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def decode_cursor(cursor: str | None) -> Cursor | None:
+    if cursor is None:
+        return None
+    try:
+        return Cursor.decode(cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+def set_next_cursor(response: Response, next_cursor: Cursor | None):
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor.encode()
+
 
 @router.get("/builds", response_model=VertexBuildMapModel)
 async def get_vertex_builds(
+    response: Response,
     flow_id: UUID = Query(),
-    session: Session = Depends(get_session),
+    limit: int = Query(1000, ge=1),
+    cursor: str | None = Query(None),
+    session: AsyncSession = Depends(get_async_session),
 ):
+    page_cursor = decode_cursor(cursor)
     try:
-        vertex_builds = get_vertex_builds_by_flow_id(session, flow_id)
+        # Builds still queued by the log writer are written first, without blocking the event loop
+        await asyncio.to_thread(flush_logs)
+        vertex_builds = await aget_vertex_builds_by_flow_id(session, flow_id, limit=limit, cursor=page_cursor)
+        set_next_cursor(response, get_next_cursor(vertex_builds, lambda v: v.timestamp, lambda v: v.build_id, limit))
         return VertexBuildMapModel.from_list_of_dicts(vertex_builds)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -38,6 +69,7 @@ async def delete_vertex_builds(
     session: Session = Depends(get_session),
 ):
     try:
+        await asyncio.to_thread(flush_logs)
         delete_vertex_builds_by_flow_id(session, flow_id)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -45,14 +77,23 @@ async def delete_vertex_builds(
 
 @router.get("/messages", response_model=list[MessageModelResponse])
 async def get_messages(
+    response: Response,
     flow_id: str | None = Query(None),
     session_id: str | None = Query(None),
     sender: str | None = Query(None),
     sender_name: str | None = Query(None),
     order_by: str | None = Query("timestamp"),
-    session: Session = Depends(get_session),
+    # Messages are paged only when the caller asks for it, as the playground loads all the messages of a flow
+    limit: int | None = Query(None, ge=1),
+    cursor: str | None = Query(None),
+    session: AsyncSession = Depends(get_async_session),
 ):
+    page_cursor = decode_cursor(cursor)
+    if page_cursor is not None and order_by != "timestamp":
+        raise HTTPException(status_code=400, detail="Messages can only be paginated by timestamp.")
     try:
+        # Messages still queued by the background writer are written first, without blocking the event loop
+        await asyncio.to_thread(flush_messages)
         stmt = select(MessageTable)
         if flow_id:
             stmt = stmt.where(MessageTable.flow_id == flow_id)
@@ -62,10 +103,17 @@ async def get_messages(
             stmt = stmt.where(MessageTable.sender == sender)
         if sender_name:
             stmt = stmt.where(MessageTable.sender_name == sender_name)
-        if order_by:
-            col = getattr(MessageTable, order_by).asc()
-            stmt = stmt.order_by(col)
-        messages = session.exec(stmt)
+        if order_by == "timestamp":
+            stmt = paginate(stmt, MessageTable.timestamp, MessageTable.id, cursor=page_cursor, limit=limit)
+        else:
+            if order_by:
+                col = getattr(MessageTable, order_by).asc()
+                stmt = stmt.order_by(col)
+            if limit:
+                stmt = stmt.limit(limit)
+        messages = (await session.exec(stmt)).all()
+        if order_by == "timestamp":
+            set_next_cursor(response, get_next_cursor(messages, lambda m: m.timestamp, lambda m: m.id, limit))
         return [MessageModelResponse.model_validate(d, from_attributes=True) for d in messages]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -80,6 +128,8 @@ async def delete_messages(
     try:
         session.exec(delete(MessageTable).where(MessageTable.id.in_(message_ids)))  # type: ignore
         session.commit()
+        if history_cache := get_history_cache():
+            history_cache.invalidate()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -96,10 +146,14 @@ async def update_message(
         if not db_message:
             raise HTTPException(status_code=404, detail="Message not found")
         message_dict = message.model_dump(exclude_unset=True, exclude_none=True)
+        session_ids = {db_message.session_id, message_dict.get("session_id")}
         db_message.sqlmodel_update(message_dict)
         session.add(db_message)
         session.commit()
         session.refresh(db_message)
+        if history_cache := get_history_cache():
+            for session_id in session_ids - {None}:
+                history_cache.invalidate(session_id)
         return db_message
     except HTTPException as e:
         raise e
@@ -113,12 +167,15 @@ async def delete_messages_session(
     session: Session = Depends(get_session),
 ):
     try:
+        await asyncio.to_thread(flush_messages)
         session.exec(  # type: ignore
             delete(MessageTable)
             .where(col(MessageTable.session_id) == session_id)
             .execution_options(synchronize_session="fetch")
         )
         session.commit()
+        if history_cache := get_history_cache():
+            history_cache.invalidate(session_id)
         return {"message": "Messages deleted successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -126,11 +183,17 @@ async def delete_messages_session(
 
 @router.get("/transactions", response_model=list[TransactionReadResponse])
 async def get_transactions(
+    response: Response,
     flow_id: UUID = Query(),
-    session: Session = Depends(get_session),
+    limit: int = Query(1000, ge=1),
+    cursor: str | None = Query(None),
+    session: AsyncSession = Depends(get_async_session),
 ):
+    page_cursor = decode_cursor(cursor)
     try:
-        transactions = get_transactions_by_flow_id(session, flow_id)
+        await asyncio.to_thread(flush_logs)
+        transactions = await aget_transactions_by_flow_id(session, flow_id, limit=limit, cursor=page_cursor)
+        set_next_cursor(response, get_next_cursor(transactions, lambda t: t.timestamp, lambda t: t.id, limit))
         return [
             TransactionReadResponse(
                 transaction_id=t.id,
@@ -147,3 +210,33 @@ async def get_transactions(
         ]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/cache", response_model=CacheStatsResponse)
+async def get_cache_stats(
+    current_user: User = Depends(get_current_active_user),
+):
+    cache_service = get_cache_service()
+    return CacheStatsResponse(cache_type=type(cache_service).__name__, **cache_service.stats())
+
+
+@router.get("/component_cache", response_model=CacheStatsResponse)
+async def get_component_cache_stats(
+    current_user: User = Depends(get_current_active_user),
+):
+    """Returns the stats of the cache of component classes compiled from code."""
+    cache = get_component_class_cache()
+    return CacheStatsResponse(cache_type=type(cache).__name__, **cache.stats())
+
+
+@router.get("/auth_cache", response_model=dict[str, CacheStatsResponse])
+async def get_auth_cache_stats(
+    current_user: User = Depends(get_current_active_user),
+):
+    """Returns the stats of the caches of authenticated API keys and access tokens, when they are enabled."""
+    caches = {"api_keys": get_api_key_cache(), "tokens": get_token_cache()}
+    return {
+        name: CacheStatsResponse(cache_type=type(cache).__name__, **cache.stats())
+        for name, cache in caches.items()
+        if cache is not None
+    }
@@ -280,6 +280,12 @@ class VertexBuildResponse(BaseModel):
     """Mapping of vertex ids to result dict containing the param name and result value."""
     timestamp: datetime | None = Field(default_factory=lambda: datetime.now(timezone.utc))
     """Timestamp of the build."""
+    memoized: bool = False
+    """Whether the result was reused from a previous build with the same inputs."""
+    memo_hits: int | None = None
+    """Number of times this vertex's result was reused. None if vertex memoization is disabled."""
+    memo_misses: int | None = None
+    """Number of times this vertex had to be built. None if vertex memoization is disabled."""
 
 
 class VerticesBuiltResponse(BaseModel):
@@ -7,6 +7,7 @@ from sqlmodel import Session, select
 from sqlmodel.sql.expression import SelectOfScalar
 
 from langflow.api.v1.schemas import UsersResponse
+from langflow.services.auth.cache import invalidate_user
 from langflow.services.auth.utils import (
     get_current_active_superuser,
     get_current_active_user,
@@ -129,8 +130,10 @@ def reset_password(
         raise HTTPException(status_code=400, detail="You can't use your current password")
     new_password = get_password_hash(user_update.password)
     user.password = new_password
+    session.add(user)
     session.commit()
     session.refresh(user)
+    invalidate_user(user.id)
 
     return user
 
@@ -155,5 +158,6 @@ def delete_user(
 
     session.delete(user_db)
     session.commit()
+    invalidate_user(user_id)
 
     return {"detail": "User deleted"}
@@ -58,6 +58,22 @@ class LCModelComponent(Component):
         self.status = result
         return result
 
+    async def atext_response(self) -> Message:
+        """Async version of `text_response`, which the graph builds the text output with."""
+        input_value = self.input_value
+        stream = self.stream
+        system_message = self.system_message
+        output = self.build_model()
+        result = await self.aget_chat_result(output, stream, input_value, system_message)
+        self.status = result
+        return result
+
+    def _get_output_method(self, method_name: str):
+        # Subclasses that override the sync `text_response` keep building their output with it
+        if method_name == "text_response" and type(self).text_response is LCModelComponent.text_response:
+            return self.atext_response
+        return super()._get_output_method(method_name)
+
     def get_result(self, runnable: LLM, stream: bool, input_value: str):
         """
         Retrieves the result from the output of a Runnable object.
@@ -133,13 +149,18 @@ class LCModelComponent(Component):
             status_message = f"Response: {message.content}"  # type: ignore
         return status_message
 
-    def get_chat_result(
+    def _prepare_chat_runnable(
         self,
         runnable: LanguageModel,
-        stream: bool,
         input_value: str | Message,
         system_message: Optional[str] = None,
-    ):
+    ) -> tuple[LanguageModel, Union[list, dict]]:
+        """
+        Builds the runnable and the inputs to send to it.
+
+        Returns:
+            A tuple with the configured runnable (prefixed by the prompt, if the input has one) and its inputs.
+        """
         messages: list[Union[BaseMessage]] = []
         if not input_value and not system_message:
             raise ValueError("The message you want to send to the model is empty.")
@@ -162,28 +183,66 @@ class LCModelComponent(Component):
         if system_message and not system_message_added:
             messages.append(SystemMessage(content=system_message))
         inputs: Union[list, dict] = messages or {}
+        runnable = runnable.with_config(  # type: ignore
+            {
+                "run_name": self.display_name,
+                "project_name": self.get_project_name(),
+                "callbacks": self.get_langchain_callbacks(),
+            }
+        )
+        return runnable, inputs
+
+    def _process_chat_message(self, message):
+        result = message.content if hasattr(message, "content") else message
+        if isinstance(message, AIMessage):
+            status_message = self.build_status_message(message)
+            self.status = status_message
+        elif isinstance(result, dict):
+            result = json.dumps(message, indent=4)
+            self.status = result
+        else:
+            self.status = result
+        return result
+
+    def get_chat_result(
+        self,
+        runnable: LanguageModel,
+        stream: bool,
+        input_value: str | Message,
+        system_message: Optional[str] = None,
+    ):
+        runnable, inputs = self._prepare_chat_runnable(runnable, input_value, system_message)
         try:
-            runnable = runnable.with_config(  # type: ignore
-                {
-                    "run_name": self.display_name,
-                    "project_name": self.get_project_name(),
-                    "callbacks": self.get_langchain_callbacks(),
-                }
-            )
             if stream:
                 return runnable.stream(inputs)  # type: ignore
             else:
                 message = runnable.invoke(inputs)  # type: ignore
-                result = message.content if hasattr(message, "content") else message
-                if isinstance(message, AIMessage):
-                    status_message = self.build_status_message(message)
-                    self.status = status_message
-                elif isinstance(result, dict):
-                    result = json.dumps(message, indent=4)
-                    self.status = result
-                else:
-                    self.status = result
-                return result
+                return self._process_chat_message(message)
+        except Exception as e:
+            if message := self._get_exception_message(e):
+                raise ValueError(message) from e
+            raise e
+
+    async def aget_chat_result(
+        self,
+        runnable: LanguageModel,
+        stream: bool,
+        input_value: str | Message,
+        system_message: Optional[str] = None,
+    ):
+        """
+        Async version of `get_chat_result`.
+
+        Uses `ainvoke`, or returns the `AsyncIterator` from `astream` when streaming,
+        so the model call does not block the event loop.
+        """
+        runnable, inputs = self._prepare_chat_runnable(runnable, input_value, system_message)
+        try:
+            if stream:
+                return runnable.astream(inputs)  # type: ignore
+            else:
+                message = await runnable.ainvoke(inputs)  # type: ignore
+                return self._process_chat_message(message)
         except Exception as e:
             if message := self._get_exception_message(e):
                 raise ValueError(message) from e
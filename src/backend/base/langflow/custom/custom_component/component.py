@@ -17,6 +17,7 @@ from langflow.services.tracing.schema import Log
 from langflow.template.field.base import UNDEFINED, Input, Output
 from langflow.template.frontend_node.custom_components import ComponentFrontendNode
 from langflow.utils.async_helpers import run_until_complete
+from langflow.utils.concurrency import run_sync_in_executor
 from langflow.utils.util import find_closest_match
 
 from .custom_component import CustomComponent
@@ -34,12 +35,15 @@ class Component(CustomComponent):
     inputs: list["InputTypes"] = []
     outputs: list[Output] = []
     code_class_base_inheritance: ClassVar[str] = "Component"
+    # Whether synchronous output methods run in a worker thread so they don't block the event loop.
+    # Components that are safe to run off the event loop thread can set it to True; None follows
+    # the `run_sync_outputs_in_thread` setting, which is off by default.
+    run_sync_outputs_in_thread: ClassVar[bool | None] = None
     _output_logs: dict[str, Log] = {}
 
     def __init__(self, **kwargs):
         # if key starts with _ it is a config
         # else it is an input
-        self._reset_all_output_values()
         inputs = {}
         config = {}
         for key, value in kwargs.items():
@@ -69,10 +73,13 @@ class Component(CustomComponent):
             self.trace_type = self._trace_type
         if not hasattr(self, "trace_type"):
             self.trace_type = "chain"
-        if self.inputs is not None:
-            self.map_inputs(self.inputs)
-        if self.outputs is not None:
-            self.map_outputs(self.outputs)
+        # Inputs and outputs hold per-instance values, so each instance gets its own copies
+        # instead of mutating the definitions shared by every instance of the class
+        self.inputs = [input_.model_copy(deep=True) for input_ in self.inputs]
+        self.outputs = [output.model_copy(deep=True) for output in self.outputs]
+        self._reset_all_output_values()
+        self.map_inputs(self.inputs)
+        self.map_outputs(self.outputs)
         # Set output types
         self._set_output_types()
         self.set_class_code()
@@ -602,6 +609,17 @@ class Component(CustomComponent):
             return await self._build_with_tracing()
         return await self._build_without_tracing()
 
+    def _get_output_method(self, method_name: str) -> Callable:
+        """Returns the method that builds an output, which subclasses can swap for an async equivalent."""
+        return getattr(self, method_name)
+
+    def _runs_sync_outputs_in_thread(self) -> bool:
+        if self.run_sync_outputs_in_thread is not None:
+            return self.run_sync_outputs_in_thread
+        from langflow.services.deps import get_settings_service
+
+        return get_settings_service().settings.run_sync_outputs_in_thread
+
     async def _build_results(self):
         _results = {}
         _artifacts = {}
@@ -616,15 +634,18 @@ class Component(CustomComponent):
                 ):
                     if output.method is None:
                         raise ValueError(f"Output {output.name} does not have a method defined.")
-                    method: Callable = getattr(self, output.method)
+                    method: Callable = self._get_output_method(output.method)
                     if output.cache and output.value != UNDEFINED:
                         _results[output.name] = output.value
                         result = output.value
                     else:
-                        result = method()
                         # If the method is asynchronous, we need to await it
                         if inspect.iscoroutinefunction(method):
-                            result = await result
+                            result = await method()
+                        elif self._runs_sync_outputs_in_thread():
+                            result = await run_sync_in_executor(method)
+                        else:
+                            result = method()
                         if (
                             self._vertex is not None
                             and isinstance(result, Message)
@@ -716,6 +737,6 @@ class Component(CustomComponent):
         return ComponentTool(component=self)
 
     def get_project_name(self):
-        if hasattr(self, "_tracing_service"):
+        if hasattr(self, "_tracing_service") and self._tracing_service:
             return self._tracing_service.project_name
         return "Langflow"
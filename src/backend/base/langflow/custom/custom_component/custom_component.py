@@ -416,10 +416,13 @@ class CustomComponent(BaseComponent):
         def get_variable(name: str, field: str):
             if hasattr(self, "_user_id") and not self.user_id:
                 raise ValueError(f"User id is not set for {self.__class__.__name__}")
+            user_id = self.user_id or ""
+            if self._vertex is not None:
+                # The variables of the user are loaded once per run
+                return self._vertex.graph.get_run_variables().get_variable(user_id=user_id, name=name, field=field)
             variable_service = get_variable_service()  # Get service instance
             # Retrieve and decrypt the variable by name for the current user
             with session_scope() as session:
-                user_id = self.user_id or ""
                 return variable_service.get_variable(user_id=user_id, name=name, field=field, session=session)
 
         return get_variable
@@ -1,12 +1,82 @@
+import hashlib
+import threading
 from typing import TYPE_CHECKING
 
+from cachetools import LRUCache
+
 from langflow.utils import validate
 
 if TYPE_CHECKING:
     from langflow.custom import CustomComponent
 
 
+class ComponentClassCache:
+    """
+    A process-wide, bounded cache of component classes compiled from code.
+
+    Classes are keyed by a hash of the code string, so the same code is only
+    parsed, imported and executed once per process. A `max_size` of 0 disables caching.
+    """
+
+    def __init__(self, max_size: int = 256):
+        self._cache: LRUCache[str, type["CustomComponent"]] = LRUCache(maxsize=max_size)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def hash_code(code: str) -> str:
+        return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+    def get_or_create(self, code: str) -> type["CustomComponent"]:
+        key = self.hash_code(code)
+        with self._lock:
+            class_object = self._cache.get(key)
+            if class_object is not None:
+                self.hits += 1
+                return class_object
+            self.misses += 1
+        # Compile outside the lock so a slow import does not block other lookups
+        class_name = validate.extract_class_name(code)
+        class_object = validate.create_class(code, class_name)
+        if self._cache.maxsize > 0:
+            with self._lock:
+                self._cache[key] = class_object
+        return class_object
+
+    def invalidate(self, code: str):
+        """Removes the class compiled from `code` so the next lookup compiles it again."""
+        with self._lock:
+            self._cache.pop(self.hash_code(code), None)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._cache),
+                "max_size": int(self._cache.maxsize),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_component_class_cache: ComponentClassCache | None = None
+
+
+def get_component_class_cache() -> ComponentClassCache:
+    global _component_class_cache
+    if _component_class_cache is None:
+        from langflow.services.deps import get_settings_service
+
+        _component_class_cache = ComponentClassCache(get_settings_service().settings.component_class_cache_size)
+    return _component_class_cache
+
+
 def eval_custom_component_code(code: str) -> type["CustomComponent"]:
     """Evaluate custom component code"""
-    class_name = validate.extract_class_name(code)
-    return validate.create_class(code, class_name)
+    return get_component_class_cache().get_or_create(code)
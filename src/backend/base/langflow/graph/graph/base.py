@@ -1,14 +1,16 @@
 import asyncio
 import copy
 import json
+import pickle
 import uuid
 import warnings
 from collections import defaultdict, deque
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from functools import partial
 from itertools import chain
-from typing import TYPE_CHECKING, Any, Optional
-from collections.abc import Generator
+from typing import TYPE_CHECKING, Any, Literal, Optional
+from collections.abc import Callable, Generator
 
 import nest_asyncio
 from loguru import logger
@@ -17,6 +19,8 @@ from langflow.exceptions.component import ComponentBuildException
 from langflow.graph.edge.base import CycleEdge
 from langflow.graph.edge.schema import EdgeData
 from langflow.graph.graph.constants import Finish, lazy_load_vertex_dict
+from langflow.graph.graph.memo import fingerprint_vertex, get_vertex_memo_cache
+from langflow.graph.graph.run_state import RunStateLog
 from langflow.graph.graph.runnable_vertices_manager import RunnableVerticesManager
 from langflow.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
 from langflow.graph.graph.state_manager import GraphStateManager
@@ -31,13 +35,19 @@ from langflow.schema import Data
 from langflow.schema.schema import INPUT_FIELD_NAME, InputType
 from langflow.services.cache.utils import CacheMiss
 from langflow.services.chat.schema import GetCache, SetCache
-from langflow.services.deps import get_chat_service, get_tracing_service
+from langflow.services.deps import get_chat_service, get_settings_service, get_tracing_service
+from langflow.utils.concurrency import AsyncConcurrencyLimiter
 
 if TYPE_CHECKING:
     from langflow.api.v1.schemas import InputValueRequest
     from langflow.custom.custom_component.component import Component
     from langflow.graph.schema import ResultData
     from langflow.services.tracing.service import TracingService
+    from langflow.services.variable.cache import RunVariables
+
+
+# Shared by every graph run in this process, see the `max_concurrent_vertices` setting
+GLOBAL_VERTEX_LIMITER = AsyncConcurrencyLimiter()
 
 
 class Graph:
@@ -79,6 +89,7 @@ class Graph:
         self._has_session_id_vertices: list[str] = []
         self._sorted_vertices_layers: list[list[str]] = []
         self._run_id = ""
+        self._run_variables: Optional["RunVariables"] = None
         self._start_time = datetime.now(timezone.utc)
         self.inactivated_vertices: set = set()
         self.activated_vertices: list[str] = []
@@ -86,7 +97,11 @@ class Graph:
         self.vertices_to_run: set[str] = set()
         self.stop_vertex: str | None = None
         self.inactive_vertices: set = set()
-        self.edges: list[CycleEdge] = []
+        self._edges_by_source: dict[str, list[CycleEdge]] = defaultdict(list)
+        self._edges_by_target: dict[str, list[CycleEdge]] = defaultdict(list)
+        self._edges_by_vertex: dict[str, list[CycleEdge]] = defaultdict(list)
+        self._edge_by_source_target: dict[tuple[str, str], CycleEdge] = {}
+        self.edges = []
         self.vertices: list[Vertex] = []
         self.run_manager = RunnableVerticesManager()
         self.state_manager = GraphStateManager()
@@ -105,7 +120,7 @@ class Graph:
         self._is_cyclic: bool | None = None
         self._cycles: list[tuple[str, str]] | None = None
         self._call_order: list[str] = []
-        self._snapshots: list[dict[str, Any]] = []
+        self._run_state_log = RunStateLog()
         try:
             self.tracing_service: "TracingService" | None = get_tracing_service()
         except Exception as exc:
@@ -117,6 +132,53 @@ class Graph:
         if (start is not None and end is None) or (start is None and end is not None):
             raise ValueError("You must provide both input and output components")
 
+    @property
+    def edges(self) -> list[CycleEdge]:
+        return self._edges_list
+
+    @edges.setter
+    def edges(self, edges: list[CycleEdge]):
+        self._edges_list = edges
+        self._build_edge_indexes()
+
+    def _build_edge_indexes(self):
+        """Rebuilds the maps used to look up edges by source, target and (source, target)."""
+        self._edges_by_source = defaultdict(list)
+        self._edges_by_target = defaultdict(list)
+        self._edges_by_vertex = defaultdict(list)
+        self._edge_by_source_target = {}
+        for edge in self._edges_list:
+            self._index_edge(edge)
+
+    def _index_edge(self, edge: CycleEdge):
+        self._edges_by_source[edge.source_id].append(edge)
+        self._edges_by_target[edge.target_id].append(edge)
+        self._edges_by_vertex[edge.source_id].append(edge)
+        if edge.target_id != edge.source_id:
+            self._edges_by_vertex[edge.target_id].append(edge)
+        self._edge_by_source_target.setdefault((edge.source_id, edge.target_id), edge)
+
+    def _append_edge(self, edge: CycleEdge):
+        """Adds an edge to the graph, keeping the edge maps up to date."""
+        self._edges_list.append(edge)
+        self._index_edge(edge)
+
+    def _remove_vertex_edges(self, vertex_id: str):
+        """Removes every edge of a vertex, only touching the edges of its neighbors."""
+        removed_edges = self._edges_by_vertex.pop(vertex_id, [])
+        if not removed_edges:
+            return
+        removed_ids = {id(edge) for edge in removed_edges}
+        self._edges_by_source.pop(vertex_id, None)
+        self._edges_by_target.pop(vertex_id, None)
+        for edge in removed_edges:
+            self._edge_by_source_target.pop((edge.source_id, edge.target_id), None)
+            neighbor_id = edge.target_id if edge.source_id == vertex_id else edge.source_id
+            for edge_map in (self._edges_by_source, self._edges_by_target, self._edges_by_vertex):
+                if neighbor_id in edge_map:
+                    edge_map[neighbor_id] = [_edge for _edge in edge_map[neighbor_id] if id(_edge) not in removed_ids]
+        self._edges_list = [edge for edge in self._edges_list if id(edge) not in removed_ids]
+
     @property
     def state_model(self):
         if not self._state_model:
@@ -489,9 +551,19 @@ class Graph:
         for vertex in self.vertices:
             self.state_manager.subscribe(run_id_str, vertex.update_graph_state)
         self._run_id = run_id_str
+        # Variables changed since the last run are loaded again
+        self._run_variables = None
         if self.tracing_service:
             self.tracing_service.set_run_id(run_id)
 
+    def get_run_variables(self) -> "RunVariables":
+        """Returns the variables of the current run, loaded once and shared by its components."""
+        if self._run_variables is None:
+            from langflow.services.variable.cache import RunVariables
+
+            self._run_variables = RunVariables()
+        return self._run_variables
+
     def set_run_name(self):
         # Given a flow name, flow_id
         if not self.tracing_service:
@@ -505,6 +577,8 @@ class Graph:
         await self.tracing_service.initialize_tracers()
 
     async def end_all_traces(self, outputs: dict[str, Any] | None = None, error: Exception | None = None):
+        # The run is over, so its decrypted variables aren't kept while the graph stays cached
+        self._run_variables = None
         if not self.tracing_service:
             return
         self._end_time = datetime.now(timezone.utc)
@@ -630,6 +704,7 @@ class Graph:
         session_id: str | None = None,
         stream: bool = False,
         fallback_to_env_vars: bool = False,
+        max_parallel_runs: int | None = None,
     ) -> list[RunOutputs]:
         """
         Run the graph with the given inputs and return the outputs.
@@ -641,6 +716,7 @@ class Graph:
             outputs (Optional[list[str]]): A list of output components.
             session_id (Optional[str]): The session ID.
             stream (bool): Whether to stream the outputs.
+            max_parallel_runs (Optional[int]): Runs the inputs as a concurrent batch, see `arun`.
 
         Returns:
             List[RunOutputs]: A list of RunOutputs objects representing the outputs.
@@ -679,19 +755,26 @@ class Graph:
         session_id: str | None = None,
         stream: bool = False,
         fallback_to_env_vars: bool = False,
+        max_parallel_runs: int | None = None,
     ) -> list[RunOutputs]:
         """
         Runs the graph with the given inputs.
 
+        By default the inputs run one after the other on this graph. When `max_parallel_runs` is set,
+        they run as a batch instead: every input gets its own copy of the graph, at most
+        `max_parallel_runs` of them run at the same time (0 means no limit) and an input that fails
+        reports its error in `RunOutputs.error` instead of failing the whole batch.
+
         Args:
             inputs (list[Dict[str, str]]): The input values for the graph.
             inputs_components (Optional[list[list[str]]], optional): Components to run for the inputs. Defaults to None.
             outputs (Optional[list[str]], optional): The outputs to retrieve from the graph. Defaults to None.
             session_id (Optional[str], optional): The session ID for the graph. Defaults to None.
             stream (bool, optional): Whether to stream the results or not. Defaults to False.
+            max_parallel_runs (Optional[int], optional): Runs the inputs as a concurrent batch. Defaults to None.
 
         Returns:
-            List[RunOutputs]: The outputs of the graph.
+            List[RunOutputs]: The outputs of the graph, in the same order as the inputs.
         """
         # inputs is {"message": "Hello, world!"}
         # we need to go through self.inputs and update the self._raw_params
@@ -712,6 +795,17 @@ class Graph:
             types = []
         for _ in range(len(inputs) - len(types)):
             types.append("chat")  # default to chat
+        if max_parallel_runs is not None:
+            return await self._arun_batch(
+                inputs=inputs,
+                inputs_components=inputs_components,
+                types=types,
+                outputs=outputs or [],
+                session_id=session_id or "",
+                stream=stream,
+                fallback_to_env_vars=fallback_to_env_vars,
+                max_parallel_runs=max_parallel_runs,
+            )
         for run_inputs, components, input_type in zip(inputs, inputs_components, types):
             run_outputs = await self._run(
                 inputs=run_inputs,
@@ -727,6 +821,61 @@ class Graph:
             vertex_outputs.append(run_output_object)
         return vertex_outputs
 
+    async def _arun_batch(
+        self,
+        inputs: list[dict[str, str]],
+        inputs_components: list[list[str]],
+        types: list[InputType | None],
+        outputs: list[str],
+        session_id: str,
+        stream: bool,
+        fallback_to_env_vars: bool,
+        max_parallel_runs: int,
+    ) -> list[RunOutputs]:
+        create_run_graph = self._get_run_graph_factory()
+        semaphore = asyncio.Semaphore(max_parallel_runs) if max_parallel_runs > 0 else None
+
+        async def run_input(run_inputs: dict[str, str], components: list[str], input_type: InputType | None):
+            async with semaphore or nullcontext():
+                try:
+                    run_outputs = await create_run_graph()._run(
+                        inputs=run_inputs,
+                        input_components=components,
+                        input_type=input_type,
+                        outputs=outputs,
+                        stream=stream,
+                        session_id=session_id,
+                        fallback_to_env_vars=fallback_to_env_vars,
+                    )
+                except Exception as exc:
+                    logger.debug(f"Error running input {run_inputs}: {exc}")
+                    return RunOutputs(inputs=run_inputs, error=str(exc))
+                return RunOutputs(inputs=run_inputs, outputs=run_outputs)
+
+        return await asyncio.gather(
+            *(
+                run_input(run_inputs, components, input_type)
+                for run_inputs, components, input_type in zip(inputs, inputs_components, types)
+            )
+        )
+
+    def _get_run_graph_factory(self) -> Callable[[], "Graph"]:
+        """
+        Returns a function that creates unbuilt copies of this graph.
+
+        The copy is built from the graph data once and pickled, so each run only pays for unpickling it.
+        """
+        graph_data = copy.deepcopy(self.dump()["data"])
+        graph = Graph.from_payload(graph_data, flow_id=self.flow_id, flow_name=self.flow_name, user_id=self.user_id)
+        try:
+            pickled_graph = pickle.dumps(graph)
+        except Exception as exc:
+            logger.debug(f"Could not pickle graph, it will be rebuilt for every run: {exc}")
+            return lambda: Graph.from_payload(
+                copy.deepcopy(graph_data), flow_id=self.flow_id, flow_name=self.flow_name, user_id=self.user_id
+            )
+        return lambda: pickle.loads(pickled_graph)
+
     def next_vertex_to_build(self):
         """
         Returns the next vertex to be built.
@@ -818,10 +967,7 @@ class Graph:
 
     def get_edge(self, source_id: str, target_id: str) -> CycleEdge | None:
         """Returns the edge between two vertices."""
-        for edge in self.edges:
-            if edge.source_id == source_id and edge.target_id == target_id:
-                return edge
-        return None
+        return self._edge_by_source_target.get((source_id, target_id))
 
     def build_parent_child_map(self, vertices: list["Vertex"]):
         parent_child_map = defaultdict(list)
@@ -859,12 +1005,14 @@ class Graph:
             "vertices_layers": self.vertices_layers,
             "vertices_to_run": self.vertices_to_run,
             "stop_vertex": self.stop_vertex,
+            "_prepared": self._prepared,
             "_run_queue": self._run_queue,
             "_first_layer": self._first_layer,
             "_vertices": self._vertices,
             "_edges": self._edges,
             "_is_input_vertices": self._is_input_vertices,
             "_is_output_vertices": self._is_output_vertices,
+            "_is_state_vertices": self._is_state_vertices,
             "_has_session_id_vertices": self._has_session_id_vertices,
             "_sorted_vertices_layers": self._sorted_vertices_layers,
         }
@@ -908,7 +1056,24 @@ class Graph:
             state["run_manager"] = run_manager
         else:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
+        edges = state.pop("edges")
         self.__dict__.update(state)
+        self.edges = edges
+        # Attributes that are not part of the state are reset as in __init__
+        self._start = None
+        self._end = None
+        self._state_model = None
+        self._runs = 0
+        self._updates = 0
+        self._start_time = datetime.now(timezone.utc)
+        self._lock = asyncio.Lock()
+        self._is_cyclic = None
+        self._cycles = None
+        self._call_order = []
+        self._run_state_log = RunStateLog()
+        self.inactive_vertices = set()
+        self.__dict__.setdefault("_prepared", False)
+        self.__dict__.setdefault("_is_state_vertices", [])
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
         self.state_manager = GraphStateManager()
         self.tracing_service = get_tracing_service()
@@ -1083,8 +1248,12 @@ class Graph:
         """Updates the edges of a vertex."""
         # Vertex has edges, so we need to update the edges
         for edge in vertex.edges:
-            if edge not in self.edges and edge.source_id in self.vertex_map and edge.target_id in self.vertex_map:
-                self.edges.append(edge)
+            if (
+                edge.source_id in self.vertex_map
+                and edge.target_id in self.vertex_map
+                and edge not in self._edges_by_source.get(edge.source_id, [])
+            ):
+                self._append_edge(edge)
 
     def _build_graph(self) -> None:
         """Builds the graph from the vertices and edges."""
@@ -1107,7 +1276,7 @@ class Graph:
             return
         self.vertices.remove(vertex)
         self.vertex_map.pop(vertex_id)
-        self.edges = [edge for edge in self.edges if edge.source_id != vertex_id and edge.target_id != vertex_id]
+        self._remove_vertex_edges(vertex_id)
 
     def _build_vertex_params(self) -> None:
         """Identifies and handles the LLM vertex within the graph."""
@@ -1179,8 +1348,12 @@ class Graph:
         self.reset_inactivated_vertices()
         self.reset_activated_vertices()
 
-        await chat_service.set_cache(str(self.flow_id or self._run_id), self)
-        self._record_snapshot(vertex_id)
+        self._record_snapshot(vertex_id, queue_popped=1, queue_appended=next_runnable_vertices)
+        # The graph is stored once per run, later steps only store what they changed
+        if len(self._call_order) == 1:
+            await chat_service.set_cache(str(self.flow_id or self._run_id), self)
+        else:
+            await chat_service.set_cache_steps(str(self.flow_id or self._run_id), self)
         return vertex_build_result
 
     def get_snapshot(self):
@@ -1195,11 +1368,29 @@ class Graph:
             }
         )
 
-    def _record_snapshot(self, vertex_id: str | None = None, start: bool = False):
-        self._snapshots.append(self.get_snapshot())
+    def _record_snapshot(
+        self,
+        vertex_id: str | None = None,
+        start: bool = False,
+        queue_popped: int = 0,
+        queue_appended: list[str] | None = None,
+    ):
+        """Records the run state, in full when `start` is True and as a delta of the previous step otherwise."""
+        if start:
+            self._run_state_log.start(self)
+        else:
+            self._run_state_log.record(self, vertex_id, queue_popped=queue_popped, queue_appended=queue_appended)
         if vertex_id:
             self._call_order.append(vertex_id)
 
+    @property
+    def run_state_log(self) -> RunStateLog:
+        return self._run_state_log
+
+    def get_recorded_snapshot(self, index: int = -1) -> dict[str, Any]:
+        """Returns the run state recorded at a step of the current run, see `RunStateLog.snapshot`."""
+        return self._run_state_log.snapshot(index)
+
     def step(
         self,
         inputs: Optional["InputValueRequest"] = None,
@@ -1242,6 +1433,10 @@ class Graph:
         try:
             params = ""
             should_build = False
+            memoized = False
+            memo_cache = get_vertex_memo_cache()
+            if memo_cache is not None:
+                vertex.memo_fingerprint = self._get_memo_fingerprint(vertex, inputs_dict, files, user_id)
             if not vertex.frozen:
                 should_build = True
             else:
@@ -1271,10 +1466,25 @@ class Graph:
                     except KeyError:
                         should_build = True
 
+            memo_scope = (self.flow_id or "", self._get_session_id())
+            if should_build and memo_cache is not None and self._is_memoizable(vertex):
+                memoized_state = memo_cache.get(*memo_scope, vertex.id, vertex.memo_fingerprint)
+                if memoized_state is not None:
+                    for attribute, value in memoized_state.items():
+                        setattr(vertex, attribute, value)
+                    try:
+                        vertex._finalize_build()
+                        should_build = False
+                        memoized = True
+                    except Exception:
+                        logger.debug(f"Could not restore memoized result of vertex {vertex.id}")
+
             if should_build:
                 await vertex.build(
                     user_id=user_id, inputs=inputs_dict, fallback_to_env_vars=fallback_to_env_vars, files=files
                 )
+                if memo_cache is not None and self._is_memoizable(vertex):
+                    memo_cache.set(*memo_scope, vertex.memo_fingerprint, vertex)
                 if set_cache is not None:
                     vertex_dict = {
                         "_built": vertex._built,
@@ -1296,7 +1506,12 @@ class Graph:
                 raise ValueError(f"No result found for vertex {vertex_id}")
 
             vertex_build_result = VertexBuildResult(
-                result_dict=result_dict, params=params, valid=valid, artifacts=artifacts, vertex=vertex
+                result_dict=result_dict,
+                params=params,
+                valid=valid,
+                artifacts=artifacts,
+                vertex=vertex,
+                memoized=memoized,
             )
             return vertex_build_result
         except Exception as exc:
@@ -1304,6 +1519,37 @@ class Graph:
                 logger.exception(f"Error building Component: \n\n{exc}")
             raise exc
 
+    def _get_session_id(self) -> str:
+        for vertex_id in self._has_session_id_vertices:
+            vertex = self.get_vertex(vertex_id)
+            if session_id := vertex._raw_params.get("session_id"):
+                return str(session_id)
+        return self.flow_id or ""
+
+    @staticmethod
+    def _has_volatile_result(vertex: "Vertex") -> bool:
+        # Memory and chat output vertices read or write the session history and state vertices
+        # depend on the graph state, so their results can't be predicted from their params
+        return vertex.is_state or bool(vertex.has_session_id and not vertex.is_input)
+
+    def _is_memoizable(self, vertex: "Vertex") -> bool:
+        return not (vertex.frozen or vertex.has_session_id or self._has_volatile_result(vertex))
+
+    def _get_memo_fingerprint(
+        self, vertex: "Vertex", inputs_dict: dict | None, files: list[str] | None, user_id: str | None
+    ) -> str:
+        if self._has_volatile_result(vertex):
+            return uuid.uuid4().hex
+        upstream_fingerprints = []
+        for predecessor_id in self.predecessor_map.get(vertex.id, []):
+            predecessor = self.get_vertex(predecessor_id)
+            if predecessor.memo_fingerprint is None:
+                # Built without memoization, so its result can't be trusted to be the same
+                return uuid.uuid4().hex
+            upstream_fingerprints.append(predecessor.memo_fingerprint)
+        extra = {"inputs": inputs_dict or {}, "files": files or [], "user_id": str(user_id) if user_id else None}
+        return fingerprint_vertex(vertex, upstream_fingerprints, extra)
+
     def get_vertex_edges(
         self,
         vertex_id: str,
@@ -1313,37 +1559,95 @@ class Graph:
         """Returns a list of edges for a given vertex."""
         # The idea here is to return the edges that have the vertex_id as source or target
         # or both
-        return [
-            edge
-            for edge in self.edges
-            if (edge.source_id == vertex_id and is_source is not False)
-            or (edge.target_id == vertex_id and is_target is not False)
-        ]
+        if is_source is False and is_target is False:
+            return []
+        if is_source is False:
+            return list(self._edges_by_target.get(vertex_id, []))
+        if is_target is False:
+            return list(self._edges_by_source.get(vertex_id, []))
+        return list(self._edges_by_vertex.get(vertex_id, []))
 
     def get_vertices_with_target(self, vertex_id: str) -> list["Vertex"]:
         """Returns the vertices connected to a vertex."""
         vertices: list["Vertex"] = []
-        for edge in self.edges:
-            if edge.target_id == vertex_id:
-                vertex = self.get_vertex(edge.source_id)
-                if vertex is None:
-                    continue
-                vertices.append(vertex)
+        for edge in self._edges_by_target.get(vertex_id, []):
+            vertex = self.vertex_map.get(edge.source_id)
+            if vertex is None:
+                continue
+            vertices.append(vertex)
         return vertices
 
-    async def process(self, fallback_to_env_vars: bool, start_component_id: str | None = None) -> "Graph":
-        """Processes the graph with vertices in each layer run in parallel."""
+    async def process(
+        self,
+        fallback_to_env_vars: bool,
+        start_component_id: str | None = None,
+        scheduler: Literal["layered", "dataflow"] | None = None,
+        max_concurrency: int | None = None,
+    ) -> "Graph":
+        """
+        Processes the graph, building independent vertices in parallel.
+
+        Args:
+            fallback_to_env_vars (bool): Whether global variables may fall back to environment variables.
+            start_component_id (Optional[str]): The ID of the component to start from. Defaults to None.
+            scheduler (Optional[str]): "layered" runs the graph one layer at a time, "dataflow" starts each vertex
+                as soon as its predecessors are built. Defaults to the `graph_scheduler` setting.
+            max_concurrency (Optional[int]): Maximum number of vertices of this run built at the same time.
+                Defaults to the `max_concurrent_vertices_per_flow` setting. 0 means no limit.
+
+        Returns:
+            Graph: The processed graph.
+        """
+        settings = get_settings_service().settings
+        scheduler = scheduler or settings.graph_scheduler
+        if max_concurrency is None:
+            max_concurrency = settings.max_concurrent_vertices_per_flow
+        GLOBAL_VERTEX_LIMITER.set_limit(settings.max_concurrent_vertices)
+        run_limiter = AsyncConcurrencyLimiter(max_concurrency)
 
         first_layer = self.sort_vertices(start_component_id=start_component_id)
-        vertex_task_run_count: dict[str, int] = {}
-        to_process = deque(first_layer)
-        layer_index = 0
         chat_service = get_chat_service()
         run_id = uuid.uuid4()
         self.set_run_id(run_id)
         self.set_run_name()
         await self.initialize_run()
         lock = chat_service._async_cache_locks[self.run_id]
+        if scheduler == "dataflow":
+            await self._process_dataflow(first_layer, fallback_to_env_vars, lock=lock, run_limiter=run_limiter)
+        elif scheduler == "layered":
+            await self._process_layers(first_layer, fallback_to_env_vars, lock=lock, run_limiter=run_limiter)
+        else:
+            raise ValueError(f"Invalid scheduler: {scheduler}. Expected 'layered' or 'dataflow'")
+
+        logger.debug("Graph processing complete")
+        return self
+
+    async def _build_vertex_with_limits(
+        self, vertex_id: str, fallback_to_env_vars: bool, run_limiter: AsyncConcurrencyLimiter
+    ) -> VertexBuildResult:
+        """Builds a vertex once both the run and the process-wide concurrency limits allow it."""
+        chat_service = get_chat_service()
+        async with run_limiter.acquire(), GLOBAL_VERTEX_LIMITER.acquire():
+            return await self.build_vertex(
+                vertex_id=vertex_id,
+                user_id=self.user_id,
+                inputs_dict={},
+                fallback_to_env_vars=fallback_to_env_vars,
+                get_cache=chat_service.get_cache,
+                set_cache=chat_service.set_cache,
+            )
+
+    async def _process_layers(
+        self,
+        first_layer: list[str],
+        fallback_to_env_vars: bool,
+        lock: asyncio.Lock,
+        run_limiter: AsyncConcurrencyLimiter,
+    ) -> None:
+        """Runs every vertex of a layer in parallel and waits for the whole layer before starting the next."""
+        vertex_task_run_count: dict[str, int] = {}
+        to_process = deque(first_layer)
+        layer_index = 0
         while to_process:
             current_batch = list(to_process)  # Copy current deque items to a list
             to_process.clear()  # Clear the deque for new items
@@ -1351,14 +1655,7 @@ class Graph:
             for vertex_id in current_batch:
                 vertex = self.get_vertex(vertex_id)
                 task = asyncio.create_task(
-                    self.build_vertex(
-                        vertex_id=vertex_id,
-                        user_id=self.user_id,
-                        inputs_dict={},
-                        fallback_to_env_vars=fallback_to_env_vars,
-                        get_cache=chat_service.get_cache,
-                        set_cache=chat_service.set_cache,
-                    ),
+                    self._build_vertex_with_limits(vertex_id, fallback_to_env_vars, run_limiter),
                     name=f"{vertex.display_name} Run {vertex_task_run_count.get(vertex_id, 0)}",
                 )
                 tasks.append(task)
@@ -1375,8 +1672,54 @@ class Graph:
             to_process.extend(next_runnable_vertices)
             layer_index += 1
 
-        logger.debug("Graph processing complete")
-        return self
+    async def _process_dataflow(
+        self,
+        first_layer: list[str],
+        fallback_to_env_vars: bool,
+        lock: asyncio.Lock,
+        run_limiter: AsyncConcurrencyLimiter,
+    ) -> None:
+        """
+        Starts each vertex as soon as all of its predecessors are built.
+
+        Unlike `_process_layers`, a slow vertex only delays its own successors,
+        so the run takes as long as its critical path.
+        """
+        vertex_task_run_count: dict[str, int] = defaultdict(int)
+        running: dict[asyncio.Task, str] = {}
+
+        def schedule(vertex_id: str) -> None:
+            if vertex_id in running.values():
+                return
+            # Mark it before the task starts so it is not picked up again as a runnable predecessor
+            self.run_manager.add_to_vertices_being_run(vertex_id)
+            vertex = self.get_vertex(vertex_id)
+            task = asyncio.create_task(
+                self._build_vertex_with_limits(vertex_id, fallback_to_env_vars, run_limiter),
+                name=f"{vertex.display_name} Run {vertex_task_run_count[vertex_id]}",
+            )
+            running[task] = vertex_id
+            vertex_task_run_count[vertex_id] += 1
+
+        for vertex_id in first_layer:
+            schedule(vertex_id)
+
+        while running:
+            done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                running.pop(task)
+                if (exc := task.exception()) is not None:
+                    logger.error(f"Task {task.get_name()} failed with exception: {exc}")
+                    for pending_task in running:
+                        pending_task.cancel()
+                    # Let the cancelled builds unwind before the run is reported as failed
+                    await asyncio.gather(*running, return_exceptions=True)
+                    raise exc
+                vertex = task.result().vertex
+                self.run_manager.remove_vertex_from_runnables(vertex.id)
+                next_runnable_vertices = await self.get_next_runnable_vertices(lock, vertex=vertex, cache=False)
+                for next_vertex_id in next_runnable_vertices:
+                    schedule(next_vertex_id)
 
     def find_next_runnable_vertices(self, vertex_id: str, vertex_successors_ids: list[str]) -> list[str]:
         next_runnable_vertices = set()
@@ -1419,8 +1762,8 @@ class Graph:
                 for t in tasks[i + 1 :]:
                     t.cancel()
                 raise result
-            elif isinstance(result, tuple) and len(result) == 5:
-                vertices.append(result[4])
+            elif isinstance(result, VertexBuildResult):
+                vertices.append(result.vertex)
             else:
                 raise ValueError(f"Invalid result from task {task_name}: {result}")
 
@@ -1447,25 +1790,31 @@ class Graph:
             ValueError: If the graph contains a cycle.
         """
         # States: 0 = unvisited, 1 = visiting, 2 = visited
-        state = {vertex: 0 for vertex in self.vertices}
+        state = {vertex.id: 0 for vertex in self.vertices}
         sorted_vertices = []
 
-        def dfs(vertex):
-            if state[vertex] == 1:
-                # We have a cycle
-                raise ValueError("Graph contains a cycle, cannot perform topological sort")
-            if state[vertex] == 0:
-                state[vertex] = 1
-                for edge in vertex.edges:
-                    if edge.source_id == vertex.id:
-                        dfs(self.get_vertex(edge.target_id))
-                state[vertex] = 2
-                sorted_vertices.append(vertex)
-
-        # Visit each vertex
+        # Iterative depth-first search, so deep graphs don't hit the recursion limit
         for vertex in self.vertices:
-            if state[vertex] == 0:
-                dfs(vertex)
+            if state[vertex.id] != 0:
+                continue
+            state[vertex.id] = 1
+            stack = [(vertex, iter(self._edges_by_source.get(vertex.id, [])))]
+            while stack:
+                current, edges = stack[-1]
+                for edge in edges:
+                    target_state = state.get(edge.target_id, 0)
+                    if target_state == 1:
+                        # We have a cycle
+                        raise ValueError("Graph contains a cycle, cannot perform topological sort")
+                    if target_state == 0:
+                        state[edge.target_id] = 1
+                        target = self.get_vertex(edge.target_id)
+                        stack.append((target, iter(self._edges_by_source.get(target.id, []))))
+                        break
+                else:
+                    stack.pop()
+                    state[current.id] = 2
+                    sorted_vertices.append(current)
 
         return list(reversed(sorted_vertices))
 
@@ -1519,7 +1868,7 @@ class Graph:
     def get_vertex_neighbors(self, vertex: "Vertex") -> dict["Vertex", int]:
         """Returns the neighbors of a vertex."""
         neighbors: dict["Vertex", int] = {}
-        for edge in self.edges:
+        for edge in self._edges_by_vertex.get(vertex.id, []):
             if edge.source_id == vertex.id:
                 neighbor = self.get_vertex(edge.target_id)
                 if neighbor is None:
@@ -1624,7 +1973,8 @@ class Graph:
         self._first_layer = sorted(first_layer)
         self._run_queue = deque(self._first_layer)
         self._prepared = True
-        self._record_snapshot()
+        self._record_snapshot(start=True)
+        self._call_order = []
         return self
 
     def get_children_by_vertex_type(self, vertex: Vertex, vertex_type: str) -> list[Vertex]:
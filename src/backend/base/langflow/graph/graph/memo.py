@@ -0,0 +1,132 @@
+import hashlib
+import pickle
+import threading
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from cachetools import LRUCache
+from loguru import logger
+
+if TYPE_CHECKING:
+    from langflow.graph.vertex.base import Vertex
+
+# The attributes of a built vertex that are saved and restored, as for frozen vertices
+MEMOIZED_VERTEX_ATTRIBUTES = ["_built", "results", "artifacts", "_built_object", "_built_result"]
+
+
+def _default_serializer(value: Any) -> Any:
+    from langflow.graph.vertex.base import Vertex
+
+    if isinstance(value, Vertex):
+        # Upstream vertices are covered by their own fingerprints
+        return f"vertex:{value.id}"
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    return repr(value)
+
+
+def fingerprint_vertex(vertex: "Vertex", upstream_fingerprints: list[str], extra: dict | None = None) -> str:
+    """
+    Returns a hash of everything a vertex build depends on.
+
+    That is the vertex type and code, its resolved params, the fingerprints of the vertices
+    it receives results from and `extra` (the run inputs, files and user).
+    """
+    template = vertex.data["node"]["template"]
+    code = template.get("code", {}).get("value") if isinstance(template.get("code"), dict) else None
+    payload = {
+        "id": vertex.id,
+        "type": vertex.vertex_type,
+        "code": code,
+        "params": vertex._raw_params,
+        "upstream": sorted(upstream_fingerprints),
+        "extra": extra or {},
+    }
+    serialized = orjson.dumps(
+        payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=_default_serializer
+    )
+    return hashlib.sha256(serialized).hexdigest()
+
+
+class VertexMemoCache:
+    """
+    An LRU cache of built vertex results keyed by vertex fingerprint.
+
+    Entries are scoped per flow and session and stored pickled, so the cache is bounded by the
+    total size in bytes of its entries. Hits and misses are counted per flow and vertex.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_tracked_vertices: int = 4096):
+        self._cache: LRUCache[tuple[str, str, str], bytes] = LRUCache(maxsize=max_bytes, getsizeof=len)
+        self._vertex_stats: LRUCache[tuple[str, str], dict[str, int]] = LRUCache(maxsize=max_tracked_vertices)
+        self._lock = threading.Lock()
+
+    def _count(self, flow_id: str, vertex_id: str, stat: str):
+        stats = self._vertex_stats.get((flow_id, vertex_id))
+        if stats is None:
+            stats = {"hits": 0, "misses": 0}
+            self._vertex_stats[(flow_id, vertex_id)] = stats
+        stats[stat] += 1
+
+    def get(self, flow_id: str, session_id: str, vertex_id: str, fingerprint: str) -> dict[str, Any] | None:
+        """Returns a copy of the saved vertex attributes, or None if the vertex has to be built."""
+        with self._lock:
+            pickled_state = self._cache.get((flow_id, session_id, fingerprint))
+            self._count(flow_id, vertex_id, "misses" if pickled_state is None else "hits")
+        if pickled_state is None:
+            return None
+        return pickle.loads(pickled_state)
+
+    def set(self, flow_id: str, session_id: str, fingerprint: str, vertex: "Vertex"):
+        state = {attribute: getattr(vertex, attribute) for attribute in MEMOIZED_VERTEX_ATTRIBUTES}
+        try:
+            pickled_state = pickle.dumps(state)
+        except Exception as exc:
+            logger.debug(f"Vertex {vertex.id} can't be memoized: {exc}")
+            return
+        if len(pickled_state) > self._cache.maxsize:
+            return
+        with self._lock:
+            self._cache[(flow_id, session_id, fingerprint)] = pickled_state
+
+    def vertex_stats(self, flow_id: str, vertex_id: str) -> dict[str, int]:
+        with self._lock:
+            return dict(self._vertex_stats.get((flow_id, vertex_id)) or {"hits": 0, "misses": 0})
+
+    def invalidate(self, flow_id: str, session_id: str | None = None):
+        """Removes the entries of a flow, or only those of one of its sessions."""
+        with self._lock:
+            for key in list(self._cache):
+                if key[0] == flow_id and (session_id is None or key[1] == session_id):
+                    self._cache.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self._vertex_stats.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._cache),
+                "bytes": int(self._cache.currsize),
+                "max_bytes": int(self._cache.maxsize),
+            }
+
+
+_vertex_memo_cache: VertexMemoCache | None = None
+
+
+def get_vertex_memo_cache() -> VertexMemoCache | None:
+    """Returns the process-wide memo cache, or None when vertex memoization is disabled."""
+    global _vertex_memo_cache
+    from langflow.services.deps import get_settings_service
+
+    settings = get_settings_service().settings
+    if not settings.vertex_memoization:
+        return None
+    if _vertex_memo_cache is None:
+        _vertex_memo_cache = VertexMemoCache(settings.vertex_memo_cache_size)
+    return _vertex_memo_cache
@@ -0,0 +1,253 @@
+import copy
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from langflow.graph.graph.base import Graph
+
+
+class RunStateDelta(NamedTuple):
+    """The changes made to the run state of a graph by one step."""
+
+    vertex_id: str | None
+    queue_popped: int
+    """Number of vertex ids removed from the front of the run queue."""
+    queue_appended: tuple[str, ...]
+    """Vertex ids added to the back of the run queue."""
+    sets: dict[str, tuple[frozenset[str], frozenset[str]]]
+    """Added and removed ids of each tracked set that changed."""
+    run_predecessors: dict[str, tuple[str, ...]]
+    """New predecessors of the vertices whose predecessors changed."""
+    activated_vertices: tuple[str, ...]
+    run_map: dict[str, list[str]] | None = None
+    """The new run map, only set by the step that rebuilt it."""
+    vertex_states: dict[str, Any] | None = None
+    """New state (active or inactive) of the vertices whose state changed."""
+
+
+class RunStateLog:
+    """
+    Records the run state of a graph as one full snapshot plus a delta per step.
+
+    The full snapshot is taken when the graph is prepared. Each step then only stores what
+    changed, and unchanged state is shared between steps, so memory grows with the size of the
+    changes instead of the size of the graph. `snapshot` rebuilds the state at any step and
+    `deltas_since` returns the steps that were not persisted yet.
+
+    Caches that store a copy of the graph write it in full once per run and then only the steps
+    recorded since their last write, see `ChatService.set_cache_steps`. `persisted_states`,
+    `steps_token` and `steps_written` are their bookkeeping.
+    """
+
+    TRACKED_SETS = ("vertices_to_run", "vertices_being_run", "inactive_vertices")
+
+    def __init__(self):
+        self._base: dict[str, Any] | None = None
+        self._deltas: list[RunStateDelta] = []
+        self._sets: dict[str, set[str]] = {}
+        self._run_predecessors: dict[str, tuple[str, ...]] = {}
+        self._run_map_id: int | None = None
+        self._vertex_states: dict[str, Any] = {}
+        self._changed_state_ids: set[str] = set()
+        self.persisted_states = 0
+        """Number of recorded states already written to the cache."""
+        self.steps_token: str | None = None
+        """Identifies the last full write of the graph, which the steps written after it apply to."""
+        self.steps_written = 0
+
+    def __len__(self) -> int:
+        """Number of recorded states, counting the initial snapshot."""
+        return 0 if self._base is None else len(self._deltas) + 1
+
+    @staticmethod
+    def _get_sets(graph: "Graph") -> dict[str, set[str]]:
+        return {
+            "vertices_to_run": graph.run_manager.vertices_to_run,
+            "vertices_being_run": graph.run_manager.vertices_being_run,
+            "inactive_vertices": graph.inactive_vertices,
+        }
+
+    def start(self, graph: "Graph"):
+        """Takes the full snapshot that the following deltas apply to, dropping any previous ones."""
+        run_manager = graph.run_manager
+        self._sets = {name: set(values) for name, values in self._get_sets(graph).items()}
+        self._run_predecessors = {
+            vertex_id: tuple(predecessors) for vertex_id, predecessors in run_manager.run_predecessors.items()
+        }
+        self._run_map_id = id(run_manager.run_map)
+        self._vertex_states = {vertex.id: vertex.state for vertex in graph.vertices}
+        self._changed_state_ids = set()
+        self._base = {
+            # The tuples are shared with the current state, only the dicts are copied
+            "sets": {name: frozenset(values) for name, values in self._sets.items()},
+            "run_predecessors": dict(self._run_predecessors),
+            "run_map": copy.deepcopy(dict(run_manager.run_map)),
+            "run_queue": tuple(graph._run_queue),
+            "vertices_layers": copy.deepcopy(graph.vertices_layers),
+            "first_layer": list(graph.first_layer or []),
+            "activated_vertices": tuple(graph.activated_vertices),
+        }
+        self._deltas = []
+        self.persisted_states = 0
+        self.steps_token = None
+        self.steps_written = 0
+
+    def record(
+        self,
+        graph: "Graph",
+        vertex_id: str | None,
+        queue_popped: int = 0,
+        queue_appended: list[str] | None = None,
+    ) -> RunStateDelta:
+        """
+        Records the changes made by a step.
+
+        Only the vertices the step touched (the built vertex, its successors, the vertices added to
+        the queue and those whose state was set) are compared, so the cost of a step doesn't grow with
+        the size of the graph. Everything is compared when the run map was rebuilt, as activating or
+        deactivating branches does.
+        """
+        if self._base is None:
+            self.start(graph)
+        run_manager = graph.run_manager
+        queue_appended = tuple(queue_appended or [])
+
+        run_map = None
+        touched: set[str] | None
+        if id(run_manager.run_map) != self._run_map_id:
+            self._run_map_id = id(run_manager.run_map)
+            run_map = copy.deepcopy(dict(run_manager.run_map))
+            touched = None
+        else:
+            touched = {*run_manager.run_map.get(vertex_id, []), *queue_appended, *self._changed_state_ids}
+            if vertex_id:
+                touched.add(vertex_id)
+        changed_sets = self._record_sets(graph, touched)
+
+        changed_predecessors = {}
+        predecessor_ids = (
+            set(run_manager.run_predecessors) | set(self._run_predecessors) if touched is None else touched
+        )
+        for touched_id in predecessor_ids:
+            current = tuple(run_manager.run_predecessors.get(touched_id, ()))
+            if self._run_predecessors.get(touched_id, ()) != current:
+                changed_predecessors[touched_id] = current
+                self._run_predecessors[touched_id] = current
+
+        changed_states = {}
+        state_ids = graph.vertex_map if touched is None else touched
+        for state_id in state_ids:
+            if (vertex := graph.vertex_map.get(state_id)) and self._vertex_states.get(state_id) != vertex.state:
+                changed_states[state_id] = self._vertex_states[state_id] = vertex.state
+        self._changed_state_ids.clear()
+
+        delta = RunStateDelta(
+            vertex_id=vertex_id,
+            queue_popped=queue_popped,
+            queue_appended=queue_appended,
+            sets=changed_sets,
+            run_predecessors=changed_predecessors,
+            activated_vertices=tuple(graph.activated_vertices),
+            run_map=run_map,
+            vertex_states=changed_states or None,
+        )
+        self._deltas.append(delta)
+        return delta
+
+    def state_changed(self, vertex_id: str):
+        """Marks a vertex whose state was set, to compare its state at the next step."""
+        self._changed_state_ids.add(vertex_id)
+
+    def _record_sets(
+        self, graph: "Graph", touched: set[str] | None
+    ) -> dict[str, tuple[frozenset[str], frozenset[str]]]:
+        """Updates the recorded sets and returns the ids added to and removed from those that changed."""
+        changed = {}
+        for name, values in self._get_sets(graph).items():
+            recorded = self._sets[name]
+            if touched is not None:
+                added = frozenset(i for i in touched if i in values and i not in recorded)
+                removed = frozenset(i for i in touched if i not in values and i in recorded)
+                # A set whose size doesn't add up was changed outside the touched vertices
+                if len(recorded) + len(added) - len(removed) == len(values):
+                    if added or removed:
+                        recorded.difference_update(removed)
+                        recorded.update(added)
+                        changed[name] = (added, removed)
+                    continue
+            if recorded != values:
+                added, removed = frozenset(values - recorded), frozenset(recorded - values)
+                self._sets[name] = set(values)
+                changed[name] = (added, removed)
+        return changed
+
+    def deltas_since(self, index: int) -> list[RunStateDelta]:
+        """Returns the deltas recorded after the first `index` states, to persist them incrementally."""
+        return self._deltas[max(index - 1, 0) :]
+
+    def snapshot(self, index: int = -1) -> dict[str, Any]:
+        """
+        Rebuilds the run state after the given step.
+
+        Index 0 is the state when the graph was prepared and -1 the latest one. The returned
+        dict has the same layout as `Graph.get_snapshot`.
+        """
+        if self._base is None:
+            raise ValueError("No run state recorded. Call start() first.")
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Run state index out of range")
+
+        run_queue = list(self._base["run_queue"])
+        sets = {name: set(values) for name, values in self._base["sets"].items()}
+        run_predecessors = {vertex_id: list(values) for vertex_id, values in self._base["run_predecessors"].items()}
+        activated_vertices = self._base["activated_vertices"]
+        run_map = self._base["run_map"]
+
+        for delta in self._deltas[:index]:
+            del run_queue[: delta.queue_popped]
+            run_queue.extend(delta.queue_appended)
+            for name, (added, removed) in delta.sets.items():
+                sets[name].difference_update(removed)
+                sets[name].update(added)
+            for vertex_id, predecessors in delta.run_predecessors.items():
+                run_predecessors[vertex_id] = list(predecessors)
+            activated_vertices = delta.activated_vertices
+            if delta.run_map is not None:
+                run_map = delta.run_map
+
+        return {
+            "run_manager": {
+                "run_map": copy.deepcopy(run_map),
+                "run_predecessors": run_predecessors,
+                "vertices_to_run": sets["vertices_to_run"],
+                "vertices_being_run": sets["vertices_being_run"],
+            },
+            "run_queue": run_queue,
+            "vertices_layers": copy.deepcopy(self._base["vertices_layers"]),
+            "first_layer": list(self._base["first_layer"]),
+            "inactive_vertices": sets["inactive_vertices"],
+            "activated_vertices": list(activated_vertices),
+        }
+
+
+def apply_delta(graph: "Graph", delta: RunStateDelta):
+    """Applies the changes of a step recorded by another copy of the graph, such as one loaded from a cache."""
+    for _ in range(delta.queue_popped):
+        graph._run_queue.popleft()
+    graph._run_queue.extend(delta.queue_appended)
+    sets = RunStateLog._get_sets(graph)
+    for name, (added, removed) in delta.sets.items():
+        sets[name].difference_update(removed)
+        sets[name].update(added)
+    run_predecessors = graph.run_manager.run_predecessors
+    for vertex_id, predecessors in delta.run_predecessors.items():
+        # Keep the container type the run manager uses, a set or a list
+        container = type(run_predecessors[vertex_id]) if vertex_id in run_predecessors else list
+        run_predecessors[vertex_id] = container(predecessors)
+    graph.activated_vertices = list(delta.activated_vertices)
+    if delta.run_map is not None:
+        graph.run_manager.run_map = defaultdict(list, copy.deepcopy(delta.run_map))
+    for vertex_id, state in (delta.vertex_states or {}).items():
+        graph.vertex_map[vertex_id].state = state
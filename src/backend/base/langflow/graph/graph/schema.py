@@ -36,6 +36,7 @@ class VertexBuildResult(NamedTuple):
     valid: bool
     artifacts: dict
     vertex: "Vertex"
+    memoized: bool = False
 
 
 class OutputConfigDict(TypedDict):
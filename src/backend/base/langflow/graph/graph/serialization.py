@@ -0,0 +1,251 @@
+import hashlib
+import pickle
+import threading
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING
+
+import orjson
+from cachetools import LRUCache
+
+from langflow.services.base import Service
+from langflow.services.cache.utils import dumps_payload, loads_payload
+from langflow.services.schema import ServiceType
+
+if TYPE_CHECKING:
+    from langflow.graph.graph.base import Graph
+    from langflow.graph.graph.run_state import RunStateDelta
+    from langflow.graph.vertex.base import Vertex
+
+# Graph attributes rebuilt from the flow data, so they are left out of the run state
+GRAPH_STRUCTURE_ATTRIBUTES = frozenset({"vertices", "edges", "raw_graph_data", "_vertices", "_edges"})
+# Vertex attributes rebuilt from the node data. `_raw_params` is kept when tweaks updated it.
+VERTEX_STRUCTURE_ATTRIBUTES = frozenset({"graph", "_lock", "_data", "data", "_raw_params"})
+
+
+@dataclass(frozen=True)
+class SerializedGraph:
+    """The run state of a graph whose structure is stored separately under `get_structure_key(version)`."""
+
+    version: str
+    state: bytes
+    steps_token: str | None = None
+    """Identifies the steps of the run stored after this state, see `get_steps_key`."""
+
+
+def can_serialize_state(graph: "Graph") -> bool:
+    """Only graphs built from flow data can be rebuilt from their structure."""
+    return bool(graph.raw_graph_data and graph.raw_graph_data.get("nodes"))
+
+
+def get_flow_version(graph: "Graph") -> str:
+    """Returns a hash of the flow data of the graph, which identifies its structure."""
+    data = orjson.dumps(graph.raw_graph_data, option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.sha256(data).hexdigest()
+
+
+def get_structure_key(version: str) -> str:
+    return f"graph-structure:{version}"
+
+
+def get_steps_key(key: str, index: int) -> str:
+    """The key of the `index`-th batch of steps (from 1) written after the graph stored under `key`."""
+    return f"graph-steps:{key}:{index}"
+
+
+def dump_structure(graph: "Graph") -> bytes:
+    """Serializes what is needed to rebuild the graph before any run."""
+    return dumps_payload(
+        {
+            "raw_graph_data": graph.raw_graph_data,
+            "flow_id": graph.flow_id,
+            "flow_name": graph.flow_name,
+            "user_id": graph.user_id,
+        }
+    )
+
+
+class _StatePickler(pickle.Pickler):
+    """
+    Pickles references to the graph and its vertices by id, as they come from the structure.
+
+    Services, such as the tracing service held by built components, are pickled by type and
+    resolved to the services of the process that loads the state.
+    """
+
+    def __init__(self, file, graph: "Graph", **kwargs):
+        super().__init__(file, **kwargs)
+        self._graph = graph
+        self._vertex_ids = {id(vertex): vertex.id for vertex in graph.vertices}
+
+    def persistent_id(self, obj):
+        if obj is self._graph:
+            return ("graph",)
+        if (vertex_id := self._vertex_ids.get(id(obj))) is not None:
+            return ("vertex", vertex_id)
+        if isinstance(obj, Service):
+            return ("service", obj.name)
+        return None
+
+
+class _StateUnpickler(pickle.Unpickler):
+    def __init__(self, file, graph: "Graph", **kwargs):
+        super().__init__(file, **kwargs)
+        self._graph = graph
+
+    def persistent_load(self, pid):
+        if pid[0] == "graph":
+            return self._graph
+        if pid[0] == "service":
+            from langflow.services.deps import get_service
+
+            return get_service(ServiceType(pid[1]))
+        try:
+            return self._graph.vertex_map[pid[1]]
+        except KeyError as exc:
+            raise pickle.UnpicklingError(f"Vertex {pid[1]} is not part of the graph structure") from exc
+
+
+def _dump_vertex_state(vertex: "Vertex") -> dict:
+    vertex_state = vertex.__getstate__()
+    for key in VERTEX_STRUCTURE_ATTRIBUTES:
+        if key != "_raw_params" or not vertex.updated_raw_params:
+            vertex_state.pop(key, None)
+    # Params start as a copy of the raw params, so only the values replaced by the runs are kept
+    params = vertex_state.pop("params")
+    raw_params = vertex._raw_params
+    return {
+        "attributes": vertex_state,
+        "changed_params": {
+            key: value for key, value in params.items() if key not in raw_params or raw_params[key] is not value
+        },
+        "removed_params": [key for key in raw_params if key not in params],
+    }
+
+
+def _load_vertex_state(vertex: "Vertex", vertex_state: dict):
+    attributes = vertex_state["attributes"]
+    raw_params = attributes.get("_raw_params", vertex._raw_params)
+    removed_params = set(vertex_state["removed_params"])
+    params = {key: value for key, value in raw_params.items() if key not in removed_params}
+    params.update(vertex_state["changed_params"])
+    vertex.__setstate__({**vertex.__dict__, **attributes, "params": params})
+
+
+def dump_state(graph: "Graph") -> SerializedGraph:
+    """Serializes the per-run state of the graph and its vertices, without the flow data they were built from."""
+    graph_state = {key: value for key, value in graph.__getstate__().items() if key not in GRAPH_STRUCTURE_ATTRIBUTES}
+    vertex_states = {vertex.id: _dump_vertex_state(vertex) for vertex in graph.vertices}
+    state = dumps_payload(
+        {"graph": graph_state, "vertices": vertex_states}, pickler_factory=partial(_StatePickler, graph=graph)
+    )
+    return SerializedGraph(version=get_flow_version(graph), state=state)
+
+
+def dump_steps(graph: "Graph", deltas: list["RunStateDelta"], token: str) -> bytes:
+    """
+    Serializes the run state changes of some steps, with the state of the vertices they built.
+
+    Other vertices only change through the states recorded in the deltas, so the size of the
+    payload depends on the steps and not on the size of the graph. `token` is the `steps_token`
+    of the state the steps apply to.
+    """
+    vertex_ids = {delta.vertex_id for delta in deltas if delta.vertex_id}
+    vertex_states = {vertex_id: _dump_vertex_state(graph.vertex_map[vertex_id]) for vertex_id in vertex_ids}
+    return dumps_payload(
+        {"token": token, "deltas": deltas, "vertices": vertex_states},
+        pickler_factory=partial(_StatePickler, graph=graph),
+    )
+
+
+def load_steps(graph: "Graph", steps: bytes, token: str) -> bool:
+    """
+    Applies steps serialized by `dump_steps` to a graph loaded from an earlier state of the same run.
+
+    Returns:
+        bool: False if the steps were written after another state, and were not applied.
+
+    Raises:
+        ValueError: If the steps don't match the graph structure.
+    """
+    from langflow.graph.graph.run_state import apply_delta
+
+    try:
+        data = loads_payload(steps, unpickler_factory=partial(_StateUnpickler, graph=graph))
+    except pickle.UnpicklingError as exc:
+        raise ValueError(str(exc)) from exc
+    if data["token"] != token:
+        return False
+    if not data["vertices"].keys() <= graph.vertex_map.keys():
+        raise ValueError("The vertices of the steps don't match the graph structure")
+    for delta in data["deltas"]:
+        apply_delta(graph, delta)
+    for vertex_id, vertex_state in data["vertices"].items():
+        _load_vertex_state(graph.vertex_map[vertex_id], vertex_state)
+    return True
+
+
+class _GraphTemplates:
+    """
+    Pickles of freshly built graphs by flow version.
+
+    Unpickling a template is several times faster than building the graph from its flow data,
+    and each load gets its own copy.
+    """
+
+    def __init__(self, max_size: int = 64):
+        self._templates: LRUCache[str, bytes] = LRUCache(maxsize=max_size)
+        self._lock = threading.Lock()
+
+    def __contains__(self, version: str) -> bool:
+        with self._lock:
+            return version in self._templates
+
+    def get(self, version: str, structure: bytes | None) -> "Graph":
+        with self._lock:
+            template = self._templates.get(version)
+        if template is None:
+            if structure is None:
+                raise KeyError(version)
+            from langflow.graph.graph.base import Graph
+
+            data = loads_payload(structure)
+            graph = Graph.from_payload(
+                data["raw_graph_data"], flow_id=data["flow_id"], flow_name=data["flow_name"], user_id=data["user_id"]
+            )
+            template = pickle.dumps(graph, protocol=5)
+            with self._lock:
+                self._templates[version] = template
+        return pickle.loads(template)
+
+
+_templates = _GraphTemplates()
+
+
+def has_template(version: str) -> bool:
+    """Whether `load_graph` can rebuild graphs of this flow version without their structure."""
+    return version in _templates
+
+
+def load_graph(serialized: SerializedGraph, structure: bytes | None = None) -> "Graph":
+    """
+    Rebuilds a graph from its run state and the structure of its flow version.
+
+    The structure is only needed the first time a flow version is loaded in the process.
+
+    Raises:
+        KeyError: If the structure is needed but wasn't given.
+        ValueError: If the state doesn't match the structure.
+    """
+    graph = _templates.get(serialized.version, structure)
+    try:
+        state = loads_payload(serialized.state, unpickler_factory=partial(_StateUnpickler, graph=graph))
+    except pickle.UnpicklingError as exc:
+        raise ValueError(str(exc)) from exc
+    vertex_states = state["vertices"]
+    if vertex_states.keys() != graph.vertex_map.keys():
+        raise ValueError("The vertices of the graph state don't match the graph structure")
+    for vertex_id, vertex_state in vertex_states.items():
+        _load_vertex_state(graph.vertex_map[vertex_id], vertex_state)
+    graph.__setstate__({**graph.__getstate__(), **state["graph"]})
+    return graph
@@ -83,3 +83,4 @@ OUTPUT_COMPONENTS = [
 class RunOutputs(BaseModel):
     inputs: dict = Field(default_factory=dict)
     outputs: list[ResultData | None] = Field(default_factory=list)
+    error: str | None = None
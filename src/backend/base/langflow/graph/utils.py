@@ -1,21 +1,23 @@
-import json
+import threading
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 from collections.abc import Generator
 from uuid import UUID
 
 from langchain_core.documents import Document
 from loguru import logger
 from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
 from pydantic.v1 import BaseModel as V1BaseModel
+from sqlmodel import SQLModel
 
 from langflow.interface.utils import extract_input_variables_from_prompt
 from langflow.schema.data import Data
 from langflow.schema.message import Message
-from langflow.services.database.models.transactions.crud import log_transaction as crud_log_transaction
-from langflow.services.database.models.transactions.model import TransactionBase
-from langflow.services.database.models.vertex_builds.crud import log_vertex_build as crud_log_vertex_build
-from langflow.services.database.models.vertex_builds.model import VertexBuildBase
+from langflow.services.database.batching import BatchWriter
+from langflow.services.database.models.transactions.model import TransactionBase, TransactionTable
+from langflow.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
+from langflow.services.database.retention import compact_log_data
 from langflow.services.database.utils import session_getter
 from langflow.services.deps import get_db_service, get_settings_service
 
@@ -135,26 +137,86 @@ def _vertex_to_primitive_dict(target: "Vertex") -> dict:
     return params
 
 
+class LogWriter(BatchWriter[Callable[[], SQLModel]]):
+    """
+    Writes transactions and vertex builds to the database from a background thread.
+
+    Items are functions building the rows, so the outputs are serialized in the writer thread rather than
+    in the build. When the queue is full, logs are dropped and counted instead of slowing the builds down.
+    """
+
+    name = "log writer"
+
+    def _write(self, batch: list[Callable[[], SQLModel]]):
+        rows = []
+        for build_row in batch:
+            try:
+                rows.append(build_row())
+            except Exception as exc:
+                logger.error(f"Error serializing log: {exc}")
+        with session_getter(get_db_service()) as session:
+            session.add_all(rows)
+            session.commit()
+
+
+_log_writer: LogWriter | None = None
+_log_writer_lock = threading.Lock()
+
+
+def get_log_writer() -> LogWriter:
+    global _log_writer
+    with _log_writer_lock:
+        if _log_writer is None:
+            settings = get_settings_service().settings
+            _log_writer = LogWriter(
+                batch_size=settings.logs_ingest_batch_size,
+                interval=settings.logs_ingest_interval,
+                max_queue_size=settings.logs_ingest_queue_size,
+            )
+        return _log_writer
+
+
+def flush_logs():
+    """Blocks until the queued transactions and vertex builds have been written."""
+    if _log_writer is not None:
+        _log_writer.flush()
+
+
+def stop_log_writer():
+    """Writes the queued logs and stops the log writer. Called when the services are torn down."""
+    global _log_writer
+    with _log_writer_lock:
+        writer, _log_writer = _log_writer, None
+    if writer is not None:
+        writer.stop()
+
+
 async def log_transaction(
     flow_id: str | UUID, source: "Vertex", status, target: Optional["Vertex"] = None, error=None
 ) -> None:
     try:
-        if not get_settings_service().settings.transactions_storage_enabled:
+        settings = get_settings_service().settings
+        if not settings.transactions_storage_enabled:
             return
-        inputs = _vertex_to_primitive_dict(source)
+        # The params and result of the vertex change with the next builds, so they are serialized now,
+        # and only their compaction and the insert are left to the writer thread
         transaction = TransactionBase(
             vertex_id=source.id,
             target_id=target.id if target else None,
-            inputs=inputs,
-            # ugly hack to get the model dump with weird datatypes
-            outputs=json.loads(source.result.model_dump_json()) if source.result else None,
+            inputs=_vertex_to_primitive_dict(source),
+            outputs=source.result.model_dump(mode="json") if source.result else None,
             status=status,
             error=error,
             flow_id=flow_id if isinstance(flow_id, UUID) else UUID(flow_id),
         )
-        with session_getter(get_db_service()) as session:
-            inserted = crud_log_transaction(session, transaction)
-            logger.debug(f"Logged transaction: {inserted.id}")
+
+        def build_row() -> TransactionTable:
+            transaction.outputs = compact_log_data(
+                transaction.outputs, settings.logs_outputs_storage, settings.logs_outputs_max_length
+            )
+            return TransactionTable(**transaction.model_dump())
+
+        get_log_writer().submit([build_row])
     except Exception as e:
         logger.error(f"Error logging transaction: {e}")
 
@@ -168,20 +230,26 @@ def log_vertex_build(
     artifacts: dict | None = None,
 ):
     try:
-        if not get_settings_service().settings.vertex_builds_storage_enabled:
+        settings = get_settings_service().settings
+        if not settings.vertex_builds_storage_enabled:
             return
+        storage, max_length = settings.logs_outputs_storage, settings.logs_outputs_max_length
+        # Serialized now, as later builds can change the data and artifacts while the row waits in the queue
         vertex_build = VertexBuildBase(
             flow_id=flow_id,
             id=vertex_id,
             valid=valid,
             params=str(params) if params else None,
-            # ugly hack to get the model dump with weird datatypes
-            data=json.loads(data.model_dump_json()),
-            # ugly hack to get the model dump with weird datatypes
-            artifacts=json.loads(json.dumps(artifacts, default=str)),
+            data=data.model_dump(mode="json"),
+            # Artifacts can hold any type, those that aren't JSON serializable are stored as strings
+            artifacts=to_jsonable_python(artifacts, fallback=str),
         )
-        with session_getter(get_db_service()) as session:
-            inserted = crud_log_vertex_build(session, vertex_build)
-            logger.debug(f"Logged vertex build: {inserted.build_id}")
+
+        def build_row() -> VertexBuildTable:
+            vertex_build.data = compact_log_data(vertex_build.data, storage, max_length)
+            vertex_build.artifacts = compact_log_data(vertex_build.artifacts, storage, max_length)
+            return VertexBuildTable(**vertex_build.model_dump())
+
+        get_log_writer().submit([build_row])
     except Exception as e:
         logger.exception(f"Error logging vertex build: {e}")
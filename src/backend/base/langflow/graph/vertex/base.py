@@ -62,6 +62,8 @@ class Vertex:
         self.is_input = any(input_component_name in self.id for input_component_name in INPUT_COMPONENTS)
         self.is_output = any(output_component_name in self.id for output_component_name in OUTPUT_COMPONENTS)
         self.has_session_id = None
+        # Set by the graph when vertex memoization is enabled, see langflow.graph.graph.memo
+        self.memo_fingerprint: str | None = None
         self._custom_component = None
         self.has_external_input = False
         self.has_external_output = False
@@ -127,6 +129,7 @@ class Vertex:
 
     def set_state(self, state: str):
         self.state = VertexStates[state]
+        self.graph.run_state_log.state_changed(self.id)
         if self.state == VertexStates.INACTIVE and self.graph.in_degree_map[self.id] < 2:
             # If the vertex is inactive and has only one in degree
             # it means that it is not a merge point in the graph
@@ -174,11 +177,11 @@ class Vertex:
 
     @property
     def outgoing_edges(self) -> list["CycleEdge"]:
-        return [edge for edge in self.edges if edge.source_id == self.id]
+        return self.graph.get_vertex_edges(self.id, is_target=False)
 
     @property
     def incoming_edges(self) -> list["CycleEdge"]:
-        return [edge for edge in self.edges if edge.target_id == self.id]
+        return self.graph.get_vertex_edges(self.id, is_source=False)
 
     @property
     def edges_source_names(self) -> set[str | None]:
@@ -210,7 +213,7 @@ class Vertex:
         self._built_result = state.get("_built_result") or UnbuiltResult()
 
     def set_top_level(self, top_level_vertices: list[str]) -> None:
-        self.parent_is_top_level = self.parent_node_id in top_level_vertices
+        self.parent_is_top_level = self.parent_node_id is not None and self.parent_node_id in top_level_vertices
 
     def _parse_data(self) -> None:
         self.data = self._data["data"]
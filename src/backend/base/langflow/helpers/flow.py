@@ -6,11 +6,12 @@ from pydantic.v1 import BaseModel, Field, create_model
 from sqlmodel import select
 
 from langflow.graph.schema import RunOutputs
+from langflow.processing.flow_cache import get_flow_cache
 from langflow.schema import Data
 from langflow.schema.schema import INPUT_FIELD_NAME
 from langflow.services.database.models.flow import Flow
 from langflow.services.database.models.flow.model import FlowRead
-from langflow.services.deps import get_settings_service, session_scope
+from langflow.services.deps import async_session_scope, get_settings_service, session_scope
 
 if TYPE_CHECKING:
     from langflow.graph.graph.base import Graph
@@ -258,22 +259,26 @@ def get_arg_names(inputs: List["Vertex"]) -> List[dict[str, str]]:
     ]
 
 
-def get_flow_by_id_or_endpoint_name(flow_id_or_name: str, user_id: Optional[UUID] = None) -> FlowRead | None:
-    flow_read = None
-    with session_scope() as session:
-        endpoint_name = None
-        try:
-            flow_id = UUID(flow_id_or_name)
-            flow = session.get(Flow, flow_id)
-        except ValueError:
-            endpoint_name = flow_id_or_name
-            stmt = select(Flow).where(Flow.endpoint_name == endpoint_name)
-            if user_id:
-                stmt = stmt.where(Flow.user_id == user_id)
-            flow = session.exec(stmt).first()
+async def get_flow_by_id_or_endpoint_name(flow_id_or_name: str, user_id: Optional[UUID] = None) -> FlowRead | None:
+    try:
+        conditions = [Flow.id == UUID(flow_id_or_name)]
+    except ValueError:
+        conditions = [Flow.endpoint_name == flow_id_or_name]
+        if user_id:
+            conditions.append(Flow.user_id == user_id)
+    flow_cache = get_flow_cache()
+    async with async_session_scope() as session:
+        if flow_cache is not None:
+            # Only the version of the flow is read, its data is loaded when it is not cached at that version
+            version = (await session.exec(select(Flow.id, Flow.updated_at).where(*conditions))).first()
+            if version is not None and (flow_read := flow_cache.get(*version)) is not None:
+                return flow_read
+        flow = (await session.exec(select(Flow).where(*conditions))).first()
         if flow is None:
             raise HTTPException(status_code=404, detail=f"Flow identifier {flow_id_or_name} not found")
         flow_read = FlowRead.model_validate(flow, from_attributes=True)
+        if flow_cache is not None:
+            flow_cache.set(flow_read, flow.updated_at)
     return flow_read
 
 
@@ -72,7 +72,7 @@ def load_flow_from_json(
 
 def run_flow_from_json(
     flow: Union[Path, str, dict],
-    input_value: str,
+    input_value: Union[str, List[str]],
     tweaks: Optional[dict] = None,
     input_type: str = "chat",
     output_type: str = "chat",
@@ -83,13 +83,15 @@ def run_flow_from_json(
     cache: Optional[str] = None,
     disable_logs: Optional[bool] = True,
     fallback_to_env_vars: bool = False,
+    max_parallel_runs: Optional[int] = None,
 ) -> List[RunOutputs]:
     """
     Run a flow from a JSON file or dictionary.
 
     Args:
         flow (Union[Path, str, dict]): The path to the JSON file or the JSON dictionary representing the flow.
-        input_value (str): The input value to be processed by the flow.
+        input_value (Union[str, List[str]]): The input value to be processed by the flow, or a list of them
+            to run the flow once per value.
         tweaks (Optional[dict], optional): Optional tweaks to be applied to the flow. Defaults to None.
         input_type (str, optional): The type of the input value. Defaults to "chat".
         output_type (str, optional): The type of the output value. Defaults to "chat".
@@ -100,6 +102,9 @@ def run_flow_from_json(
         cache (Optional[str], optional): The cache directory to use. Defaults to None.
         disable_logs (Optional[bool], optional): Whether to disable logs. Defaults to True.
         fallback_to_env_vars (bool, optional): Whether Global Variables should fallback to environment variables if not found. Defaults to False.
+        max_parallel_runs (Optional[int], optional): Runs the input values concurrently, each on its own copy of the
+            flow, with at most this many at a time (0 means no limit). Errors are reported per input in
+            `RunOutputs.error`. Defaults to None, which runs the values one after the other.
 
     Returns:
         List[RunOutputs]: A list of RunOutputs objects representing the results of running the flow.
@@ -130,5 +135,6 @@ def run_flow_from_json(
         output_type=output_type,
         output_component=output_component,
         fallback_to_env_vars=fallback_to_env_vars,
+        max_parallel_runs=max_parallel_runs,
     )
     return result
@@ -29,9 +29,11 @@ from langflow.initial_setup.setup import (
 )
 from langflow.interface.types import get_and_cache_all_types_dict
 from langflow.interface.utils import setup_llm_caching
+from langflow.services.database.retention import run_log_retention
 from langflow.services.deps import get_cache_service, get_settings_service, get_telemetry_service
 from langflow.services.plugins.langfuse_plugin import LangfuseInstance
 from langflow.services.utils import initialize_services, teardown_services
+from langflow.utils.concurrency import shutdown_sync_executor
 from langflow.logging.logger import configure
 
 # Ignore Pydantic deprecation warnings from Langchain
@@ -97,6 +99,7 @@ def get_lifespan(fix_migration=False, socketio_server=None, version=None):
             task = asyncio.create_task(get_and_cache_all_types_dict(get_settings_service(), get_cache_service()))
             await create_or_update_starter_projects(task)
             asyncio.create_task(get_telemetry_service().start())
+            retention_task = asyncio.create_task(run_log_retention())
             load_flows_from_directory()
             yield
         except Exception as exc:
@@ -105,7 +108,9 @@ def get_lifespan(fix_migration=False, socketio_server=None, version=None):
             raise
         # Shutdown message
         rprint("[bold red]Shutting down Langflow...[/bold red]")
+        retention_task.cancel()
         await teardown_services()
+        shutdown_sync_executor()
 
     return lifespan
 
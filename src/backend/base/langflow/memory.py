@@ -1,14 +1,22 @@
+import threading
+import time
 import warnings
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import List, Sequence
 from uuid import UUID
 
+from cachetools import TTLCache
 from loguru import logger
 from sqlalchemy import delete
 from sqlmodel import Session, col, select
 
 from langflow.schema.message import Message
+from langflow.services.database.batching import BatchWriter
 from langflow.services.database.models.message.model import MessageRead, MessageTable
-from langflow.services.deps import session_scope
+from langflow.services.database.pagination import Cursor, get_next_cursor, paginate
+from langflow.services.deps import get_settings_service, session_scope
 from langflow.field_typing import BaseChatMessageHistory
 from langchain_core.messages import BaseMessage
 
@@ -21,6 +29,8 @@ def get_messages(
     order: str | None = "DESC",
     flow_id: UUID | None = None,
     limit: int | None = None,
+    since: datetime | None = None,
+    cursor: Cursor | None = None,
 ) -> List[Message]:
     """
     Retrieves messages from the monitor service based on the provided filters.
@@ -31,11 +41,27 @@ def get_messages(
         session_id (Optional[str]): The session ID associated with the messages.
         order_by (Optional[str]): The field to order the messages by. Defaults to "timestamp".
         limit (Optional[int]): The maximum number of messages to retrieve.
+        since (Optional[datetime]): Only retrieve the messages stored at or after this time.
+        cursor (Optional[Cursor]): Retrieve the page after this cursor, as returned by `get_next_messages_cursor`.
+            Only for messages ordered by timestamp.
 
     Returns:
         List[Data]: A list of Data objects representing the retrieved messages.
     """
     messages_read: list[Message] = []
+    # Only the messages a read can return need to be written first
+    flush_messages(None if flow_id else session_id)
+    if since and since.tzinfo:
+        # Timestamps are stored in UTC, without a timezone
+        since = since.astimezone(timezone.utc).replace(tzinfo=None)
+    if cursor is not None and order_by != "timestamp":
+        raise ValueError("Messages can only be paginated by timestamp.")
+    if session_id and not flow_id and not cursor and order_by == "timestamp" and (history_cache := get_history_cache()):
+        cached = history_cache.get_messages(
+            session_id, sender=sender, sender_name=sender_name, order=order, limit=limit, since=since
+        )
+        if cached is not None:
+            return cached
     with session_scope() as session:
         stmt = select(MessageTable)
         if sender:
@@ -46,23 +72,44 @@ def get_messages(
             stmt = stmt.where(MessageTable.session_id == session_id)
         if flow_id:
             stmt = stmt.where(MessageTable.flow_id == flow_id)
-        if order_by:
-            if order == "DESC":
-                col = getattr(MessageTable, order_by).desc()
-            else:
-                col = getattr(MessageTable, order_by).asc()
-            stmt = stmt.order_by(col)
-        if limit:
-            stmt = stmt.limit(limit)
+        if since:
+            stmt = stmt.where(MessageTable.timestamp >= since)
+        if cursor is not None or (limit and order_by == "timestamp"):
+            # Pages are ordered the same way from the first one, so the cursor of the next page can follow it
+            stmt = paginate(
+                stmt, MessageTable.timestamp, MessageTable.id, cursor=cursor, limit=limit, descending=order == "DESC"
+            )
+        else:
+            if order_by:
+                if order == "DESC":
+                    col = getattr(MessageTable, order_by).desc()
+                else:
+                    col = getattr(MessageTable, order_by).asc()
+                stmt = stmt.order_by(col)
+            if limit:
+                stmt = stmt.limit(limit)
         messages = session.exec(stmt)
         messages_read = [Message(**d.model_dump()) for d in messages]
 
     return messages_read
 
 
+def get_next_messages_cursor(messages: list[Message], limit: int | None = None) -> Cursor | None:
+    """Returns the cursor of the page after a page returned by `get_messages`, or None if it was the last one."""
+    return get_next_cursor(
+        messages,
+        lambda message: _parse_timestamp(message.timestamp),
+        lambda message: UUID(str(message.id)),
+        limit=limit,
+    )
+
+
 def add_messages(messages: Message | list[Message], flow_id: str | None = None):
     """
     Add a message to the monitor service.
+
+    With `message_write_behind` enabled the messages are handed to the background writer,
+    and are returned without waiting for them to be written.
     """
     try:
         if not isinstance(messages, list):
@@ -75,24 +122,118 @@ def add_messages(messages: Message | list[Message], flow_id: str | None = None):
         messages_models: list[MessageTable] = []
         for msg in messages:
             messages_models.append(MessageTable.from_message(msg, flow_id=flow_id))
-        with session_scope() as session:
-            messages_models = add_messagetables(messages_models, session)
-        return [Message(**message.model_dump()) for message in messages_models]
+        if writer := get_message_writer():
+            # Ids and timestamps are set on creation, so the messages can be returned before they are written
+            messages_read = [MessageRead.model_validate(message, from_attributes=True) for message in messages_models]
+            writer.submit(messages_models)
+        else:
+            with session_scope() as session:
+                messages_read = add_messagetables(messages_models, session)
+        stored = [Message(**message.model_dump()) for message in messages_read]
+        if history_cache := get_history_cache():
+            history_cache.append(stored)
+        return stored
     except Exception as e:
         logger.exception(e)
         raise e
 
 
 def add_messagetables(messages: list[MessageTable], session: Session):
-    for message in messages:
+    """Inserts the messages in a single transaction."""
+    try:
+        session.add_all(messages)
+        # Read before the commit expires them, which would reload each message with its own query
+        messages_read = [MessageRead.model_validate(message, from_attributes=True) for message in messages]
+        session.commit()
+    except Exception as e:
+        logger.exception(e)
+        raise e
+    return messages_read
+
+
+class MessageWriter(BatchWriter[MessageTable]):
+    """
+    Writes messages to the database from a background thread.
+
+    Messages submitted by concurrent runs are coalesced, and each batch is inserted in one transaction.
+    The messages pending per session are counted, so reads of a session only wait for its own messages.
+    """
+
+    name = "message writer"
+
+    def __init__(self, *args, **kwargs):
+        self._pending: Counter[str] = Counter()
+        self._written = threading.Condition()
+        super().__init__(*args, **kwargs)
+
+    def submit(self, items: list[MessageTable]) -> int:
+        # Counted before they are queued, so the writer can't write them first
+        session_ids = [str(item.session_id) for item in items]
+        with self._written:
+            self._pending.update(session_ids)
+        accepted = super().submit(items)
+        if accepted < len(items):
+            self._done(session_ids[accepted:])
+        return accepted
+
+    def flush_session(self, session_id: str):
+        """Blocks until the submitted messages of a session have been written."""
+        with self._written:
+            self._written.wait_for(lambda: self._pending[session_id] <= 0 or not self._thread.is_alive())
+
+    def _done(self, session_ids: list[str]):
+        with self._written:
+            for session_id in session_ids:
+                self._pending[session_id] -= 1
+                if self._pending[session_id] <= 0:
+                    del self._pending[session_id]
+            self._written.notify_all()
+
+    def _write(self, batch: list[MessageTable]):
+        # Read first, the commit expires the messages
+        session_ids = [str(item.session_id) for item in batch]
         try:
-            session.add(message)
-            session.commit()
-            session.refresh(message)
-        except Exception as e:
-            logger.exception(e)
-            raise e
-    return [MessageRead.model_validate(message, from_attributes=True) for message in messages]
+            with session_scope() as session:
+                add_messagetables(batch, session)
+        finally:
+            self._done(session_ids)
+
+
+_message_writer: MessageWriter | None = None
+_message_writer_lock = threading.Lock()
+
+
+def get_message_writer() -> MessageWriter | None:
+    """Returns the background message writer, or None if `message_write_behind` is disabled."""
+    global _message_writer
+    settings = get_settings_service().settings
+    if not settings.message_write_behind:
+        return None
+    with _message_writer_lock:
+        if _message_writer is None:
+            _message_writer = MessageWriter(
+                batch_size=settings.message_write_batch_size, interval=settings.message_write_interval
+            )
+        return _message_writer
+
+
+def flush_messages(session_id: str | None = None):
+    """Blocks until the messages handed to the background writer, or those of a session, have been written."""
+    if (writer := _message_writer) is None:
+        return
+    if session_id is None:
+        writer.flush()
+    else:
+        writer.flush_session(session_id)
+
+
+def stop_message_writer():
+    """Writes the pending messages and stops the background writer. Called when the services are torn down."""
+    global _message_writer
+    with _message_writer_lock:
+        writer, _message_writer = _message_writer, None
+    if writer is not None:
+        writer.stop()
 
 
 def delete_messages(session_id: str):
@@ -102,6 +243,9 @@ def delete_messages(session_id: str):
     Args:
         session_id (str): The session ID associated with the messages to delete.
     """
+    flush_messages(session_id)
+    if history_cache := get_history_cache():
+        history_cache.invalidate(session_id)
     with session_scope() as session:
         session.exec(
             delete(MessageTable)
@@ -138,27 +282,197 @@ def store_message(
     return add_messages([message], flow_id=flow_id)
 
 
+@dataclass
+class _SessionHistory:
+    messages: deque[Message]
+    ids: set
+    # Whether the messages are the whole history of the session, not only the most recent ones
+    complete: bool
+    # Time of the most recent message, messages stored from then on are loaded on the next read
+    last_timestamp: datetime | None = None
+    # When the messages were last loaded from the database, as per `time.monotonic`
+    synced_at: float | None = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add(self, messages: list[Message]):
+        added = False
+        for message in messages:
+            if message.id in self.ids:
+                continue
+            if len(self.messages) == self.messages.maxlen:
+                self.ids.discard(self.messages.popleft().id)
+                self.complete = False
+            self.messages.append(message)
+            self.ids.add(message.id)
+            added = True
+        if not added:
+            return
+        keys = [_order_key(message) for message in self.messages]
+        if keys != sorted(keys):
+            # Messages stored concurrently by another worker can arrive out of order
+            self.messages = deque(sorted(self.messages, key=_order_key), maxlen=self.messages.maxlen)
+        self.last_timestamp = max(timestamp for timestamp, _ in keys)
+
+
+def _order_key(message: Message) -> tuple[datetime, UUID]:
+    """Messages are in the order of the database pages, by timestamp and then id."""
+    return _parse_timestamp(message.timestamp), UUID(str(message.id))
+
+
+def _parse_timestamp(timestamp: str) -> datetime:
+    return datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
+
+
+class SessionHistoryCache:
+    """
+    The most recent messages of the recently used chat sessions.
+
+    The first read of a session loads its last `window` messages. Later reads only load the messages
+    stored since the most recent cached one, so the cost of a turn doesn't grow with the history.
+    Messages stored by this process are added as they are stored, so reads within `sync_interval`
+    seconds of the last load don't query the database at all; only messages stored by other
+    workers can be missed for that long.
+    Requests the cached messages can't fully answer, such as the oldest messages of a long session,
+    return None and are left to the database.
+    """
+
+    def __init__(self, max_sessions: int = 1000, window: int = 200, ttl: int = 300, sync_interval: float = 0):
+        self.window = window
+        self.sync_interval = sync_interval
+        self._sessions: TTLCache[str, _SessionHistory] = TTLCache(maxsize=max_sessions, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get_messages(
+        self,
+        session_id: str,
+        sender: str | None = None,
+        sender_name: str | None = None,
+        order: str | None = "DESC",
+        limit: int | None = None,
+        since: datetime | None = None,
+    ) -> list[Message] | None:
+        """Returns the messages like `get_messages` would, or None if the cached messages may not be enough."""
+        history = self._load(session_id)
+        with history.lock:
+            messages = list(history.messages)
+            complete = history.complete
+        oldest = _parse_timestamp(messages[0].timestamp) if messages else None
+        messages = [
+            message
+            for message in messages
+            if (not sender or message.sender == sender)
+            and (not sender_name or message.sender_name == sender_name)
+            and (not since or _parse_timestamp(message.timestamp) >= since)
+        ]
+        if order == "DESC":
+            messages.reverse()
+        # Messages older than the cached ones may match too, unless the request stops before reaching them
+        covers_since = since is not None and oldest is not None and oldest < since
+        covers_limit = order == "DESC" and limit is not None and len(messages) >= limit
+        if not (complete or covers_since or covers_limit):
+            return None
+        if limit:
+            messages = messages[:limit]
+        # Copies, as callers may change the messages they get
+        return [message.model_copy(update={"data": dict(message.data)}) for message in messages]
+
+    def _load(self, session_id: str) -> _SessionHistory:
+        with self._lock:
+            history = self._sessions.get(session_id)
+            if history is None:
+                history = _SessionHistory(messages=deque(maxlen=self.window), ids=set(), complete=False)
+                self._sessions[session_id] = history
+        with history.lock:
+            now = time.monotonic()
+            if history.synced_at is not None and now - history.synced_at < self.sync_interval:
+                return history
+            with session_scope() as session:
+                stmt = select(MessageTable).where(MessageTable.session_id == session_id)
+                if history.last_timestamp is None:
+                    stmt = stmt.order_by(col(MessageTable.timestamp).desc(), col(MessageTable.id).desc())
+                    rows = session.exec(stmt.limit(self.window)).all()
+                    rows = rows[::-1]
+                    history.complete = len(rows) < self.window
+                else:
+                    stmt = stmt.where(MessageTable.timestamp >= history.last_timestamp)
+                    rows = session.exec(
+                        stmt.order_by(col(MessageTable.timestamp).asc(), col(MessageTable.id).asc())
+                    ).all()
+                history.add([Message(**row.model_dump()) for row in rows])
+            history.synced_at = now
+        return history
+
+    def append(self, messages: list[Message]):
+        """Adds stored messages to the sessions that are cached."""
+        for message in messages:
+            with self._lock:
+                history = self._sessions.get(message.session_id)
+            if history is not None:
+                with history.lock:
+                    history.add([message])
+
+    def invalidate(self, session_id: str | None = None):
+        """Drops the cached messages of a session, or of every session if no session is given."""
+        with self._lock:
+            if session_id is None:
+                self._sessions.clear()
+            else:
+                self._sessions.pop(session_id, None)
+
+
+_history_cache: SessionHistoryCache | None = None
+_history_cache_lock = threading.Lock()
+
+
+def get_history_cache() -> SessionHistoryCache | None:
+    """Returns the chat history cache, or None if `message_history_cache_size` is 0."""
+    global _history_cache
+    settings = get_settings_service().settings
+    if not settings.message_history_cache_size:
+        return None
+    with _history_cache_lock:
+        if _history_cache is None:
+            _history_cache = SessionHistoryCache(
+                max_sessions=settings.message_history_cache_size,
+                window=settings.message_history_window,
+                ttl=settings.message_history_cache_ttl,
+                sync_interval=settings.message_history_sync_interval,
+            )
+        return _history_cache
+
+
 class LCBuiltinChatMemory(BaseChatMessageHistory):
     def __init__(
         self,
         flow_id: str,
         session_id: str,
+        n_messages: int | None = None,
+        since: datetime | None = None,
     ) -> None:
         self.flow_id = flow_id
         self.session_id = session_id
+        self.n_messages = n_messages
+        self.since = since
 
     @property
     def messages(self) -> List[BaseMessage]:
         messages = get_messages(
             session_id=self.session_id,
+            limit=self.n_messages,
+            since=self.since,
         )
         return [m.to_lc_message() for m in messages]
 
     def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        messages_to_store = []
         for lc_message in messages:
             message = Message.from_lc_message(lc_message)
             message.session_id = self.session_id
-            store_message(message, flow_id=self.flow_id)
+            if not message.session_id or not message.sender or not message.sender_name:
+                raise ValueError("All of session_id, sender, and sender_name must be provided.")
+            messages_to_store.append(message)
+        if messages_to_store:
+            add_messages(messages_to_store, flow_id=self.flow_id)
 
     def clear(self) -> None:
         delete_messages(self.session_id)
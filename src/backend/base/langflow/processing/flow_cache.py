@@ -0,0 +1,90 @@
+import threading
+from datetime import datetime
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+from cachetools import LRUCache
+
+from langflow.services.database.models.flow.model import FlowRead
+
+
+class _Entry(NamedTuple):
+    flow: FlowRead
+    updated_at: Optional[datetime]
+
+
+class FlowCache:
+    """
+    An LRU cache of the flows resolved by the /run and /webhook endpoints, with their parsed data.
+
+    Each flow is cached with the `updated_at` it was loaded with. Callers read the current `updated_at`
+    of the flow, a query that does not load its data, and only get the cached flow if it is the same,
+    so a flow updated through another worker is reloaded on its next lookup.
+    """
+
+    def __init__(self, max_size: int = 100):
+        self._cache: LRUCache[UUID, _Entry] = LRUCache(maxsize=max_size)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, flow_id: UUID, updated_at: Optional[datetime]) -> Optional[FlowRead]:
+        """
+        Returns a copy of the cached flow if it was cached at this `updated_at`.
+
+        The copy shares the flow data with the cache, which callers must not change.
+        """
+        with self._lock:
+            entry = self._cache.get(flow_id)
+            if entry is None or entry.updated_at != updated_at:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return entry.flow.model_copy()
+
+    def set(self, flow: FlowRead, updated_at: Optional[datetime]):
+        with self._lock:
+            self._cache[flow.id] = _Entry(flow.model_copy(), updated_at)
+
+    def invalidate(self, flow_id: UUID):
+        with self._lock:
+            self._cache.pop(flow_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._cache),
+                "max_size": int(self._cache.maxsize),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_flow_cache: FlowCache | None = None
+_flow_cache_lock = threading.Lock()
+
+
+def get_flow_cache() -> FlowCache | None:
+    """Returns the cache of flows by ID, or None if `flow_cache_size` is 0."""
+    global _flow_cache
+    from langflow.services.deps import get_settings_service
+
+    settings = get_settings_service().settings
+    if not settings.flow_cache_size:
+        return None
+    with _flow_cache_lock:
+        if _flow_cache is None:
+            _flow_cache = FlowCache(max_size=settings.flow_cache_size)
+        return _flow_cache
+
+
+def invalidate_flow(flow_id: UUID | str):
+    """Drops a flow that was updated or deleted from the cache."""
+    if _flow_cache is not None:
+        _flow_cache.invalidate(flow_id if isinstance(flow_id, UUID) else UUID(flow_id))
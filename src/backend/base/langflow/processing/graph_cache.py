@@ -0,0 +1,141 @@
+import copy
+import hashlib
+import pickle
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Union
+
+import orjson
+from cachetools import LRUCache
+from loguru import logger
+
+from langflow.graph.graph.base import Graph
+from langflow.processing.process import process_tweaks
+
+if TYPE_CHECKING:
+    from langflow.schema.graph import Tweaks
+
+
+def fingerprint_tweaks(tweaks: Union["Tweaks", dict[str, Any], None], stream: bool = False) -> str:
+    """Returns a stable hash of the tweaks (and stream flag) applied to a flow."""
+    if tweaks is not None and not isinstance(tweaks, dict):
+        tweaks = tweaks.model_dump()
+    payload = orjson.dumps({"tweaks": tweaks or {}, "stream": stream}, option=orjson.OPT_SORT_KEYS, default=str)
+    return hashlib.sha256(payload).hexdigest()
+
+
+class PreparedGraphCache:
+    """
+    An LRU cache of graphs that are ready to run.
+
+    Building a graph from a flow payload processes groups, creates every vertex and edge
+    and computes all vertex params. The result only depends on the flow data and the
+    tweaks, so it is pickled once per (flow id, flow `updated_at`, tweak fingerprint)
+    and every request gets its own unpickled copy to run on.
+    """
+
+    def __init__(self, max_size: int = 32):
+        self._cache: LRUCache[tuple[str, str, str], bytes] = LRUCache(maxsize=max_size)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # Flows whose graph could not be pickled, so they are built again on every request
+        self._unpicklable_flows: set[str] = set()
+
+    @staticmethod
+    def build_key(
+        flow_id: str, updated_at: datetime | None, tweaks: Union["Tweaks", dict[str, Any], None], stream: bool = False
+    ) -> tuple[str, str, str]:
+        return (flow_id, updated_at.isoformat() if updated_at else "", fingerprint_tweaks(tweaks, stream))
+
+    def get_graph(
+        self,
+        flow_id: str,
+        flow_data: dict,
+        updated_at: datetime | None,
+        tweaks: Union["Tweaks", dict[str, Any], None] = None,
+        stream: bool = False,
+        flow_name: str | None = None,
+        user_id: str | None = None,
+    ) -> Graph:
+        """
+        Returns a graph for the flow that is not shared with any other caller.
+
+        Args:
+            flow_id (str): The ID of the flow.
+            flow_data (dict): The flow data, used only when the graph is not cached.
+            updated_at (Optional[datetime]): When the flow was last updated.
+            tweaks (Optional[dict]): The tweaks to apply to the flow data.
+            stream (bool): Whether the flow will be streamed.
+            flow_name (Optional[str]): The name of the flow.
+            user_id (Optional[str]): The ID of the user running the flow.
+
+        Returns:
+            Graph: A fresh graph for this run.
+        """
+        key = self.build_key(flow_id, updated_at, tweaks, stream)
+        with self._lock:
+            pickled_graph = self._cache.get(key)
+            if pickled_graph is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if pickled_graph is None:
+            # process_tweaks changes the nodes in place, so the caller's flow data is copied first
+            graph_data = process_tweaks(copy.deepcopy(flow_data), tweaks or {}, stream=stream)
+            graph = Graph.from_payload(graph_data, flow_id=flow_id, flow_name=flow_name, user_id=user_id)
+            if self._cache.maxsize > 0:
+                try:
+                    pickled_graph = pickle.dumps(graph)
+                except Exception as exc:
+                    with self._lock:
+                        first_failure = flow_id not in self._unpicklable_flows
+                        self._unpicklable_flows.add(flow_id)
+                    if first_failure:
+                        logger.warning(f"Could not cache graph for flow {flow_id}, it is built on every run: {exc}")
+                else:
+                    with self._lock:
+                        self._cache[key] = pickled_graph
+            return graph
+
+        graph = pickle.loads(pickled_graph)
+        graph.flow_name = flow_name
+        graph.user_id = user_id
+        return graph
+
+    def invalidate(self, flow_id: str):
+        """Removes every cached graph of the flow."""
+        with self._lock:
+            for key in [key for key in self._cache if key[0] == flow_id]:
+                self._cache.pop(key, None)
+            self._unpicklable_flows.discard(flow_id)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+            self._unpicklable_flows.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._cache),
+                "max_size": int(self._cache.maxsize),
+                "hits": self.hits,
+                "misses": self.misses,
+                "unpicklable_flows": len(self._unpicklable_flows),
+            }
+
+
+_prepared_graph_cache: PreparedGraphCache | None = None
+
+
+def get_prepared_graph_cache() -> PreparedGraphCache:
+    global _prepared_graph_cache
+    if _prepared_graph_cache is None:
+        from langflow.services.deps import get_settings_service
+
+        _prepared_graph_cache = PreparedGraphCache(get_settings_service().settings.prepared_graph_cache_size)
+    return _prepared_graph_cache
@@ -26,6 +26,7 @@ async def run_graph_internal(
     session_id: Optional[str] = None,
     inputs: Optional[List["InputValueRequest"]] = None,
     outputs: Optional[List[str]] = None,
+    max_parallel_runs: Optional[int] = None,
 ) -> tuple[List[RunOutputs], str]:
     """Run the graph and generate the result"""
     inputs = inputs or []
@@ -54,33 +55,39 @@ async def run_graph_internal(
         stream=stream,
         session_id=session_id_str or "",
         fallback_to_env_vars=fallback_to_env_vars,
+        max_parallel_runs=max_parallel_runs,
     )
     return run_outputs, session_id_str
 
 
 def run_graph(
     graph: "Graph",
-    input_value: str,
+    input_value: Union[str, List[str]],
     input_type: str,
     output_type: str,
     fallback_to_env_vars: bool = False,
     output_component: Optional[str] = None,
+    max_parallel_runs: Optional[int] = None,
 ) -> List[RunOutputs]:
     """
     Runs the given Langflow Graph with the specified input and returns the outputs.
 
     Args:
         graph (Graph): The graph to be executed.
-        input_value (str): The input value to be passed to the graph.
+        input_value (Union[str, List[str]]): The input value to be passed to the graph, or a list of them
+            to run the graph once per value.
         input_type (str): The type of the input value.
         output_type (str): The type of the desired output.
         output_component (Optional[str], optional): The specific output component to retrieve. Defaults to None.
+        max_parallel_runs (Optional[int], optional): Runs the input values as a concurrent batch
+            (see `Graph.arun`). Defaults to None.
 
     Returns:
         List[RunOutputs]: A list of RunOutputs objects representing the outputs of the graph.
 
     """
-    inputs = [InputValue(components=[], input_value=input_value, type=input_type)]
+    input_values = input_value if isinstance(input_value, list) else [input_value]
+    inputs = [InputValue(components=[], input_value=value, type=input_type) for value in input_values]
     if output_component:
         outputs = [output_component]
     else:
@@ -108,6 +115,7 @@ def run_graph(
         stream=False,
         session_id="",
         fallback_to_env_vars=fallback_to_env_vars,
+        max_parallel_runs=max_parallel_runs,
     )
     return run_outputs
 
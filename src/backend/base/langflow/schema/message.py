@@ -15,6 +15,7 @@ from pydantic import BeforeValidator, ConfigDict, Field, field_serializer, field
 from langflow.base.prompts.utils import dict_values_to_string
 from langflow.schema.data import Data
 from langflow.schema.image import Image, get_file_paths, is_image_file
+from langflow.utils.async_helpers import run_until_complete
 from langflow.utils.constants import (
     MESSAGE_SENDER_AI,
     MESSAGE_SENDER_NAME_AI,
@@ -165,8 +166,8 @@ class Message(Data):
 
     def sync_get_file_content_dicts(self):
         coro = self.get_file_content_dicts()
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(coro)
+        # Also called from worker threads, which have no event loop of their own
+        return run_until_complete(coro)
 
     # Keep this async method for backwards compatibility
     async def get_file_content_dicts(self):
@@ -0,0 +1,137 @@
+import threading
+import time
+from typing import Any, NamedTuple, Optional
+from uuid import UUID
+
+from cachetools import LRUCache
+
+
+class _Entry(NamedTuple):
+    user_id: UUID
+    value: Any
+    expires_at: float
+
+
+class AuthenticationCache:
+    """
+    Users recently authenticated by a credential, such as an API key or an access token.
+
+    Entries expire after `ttl` seconds, or when the credential itself expires if that is sooner. The TTL bounds
+    how long a revoked credential or a changed user can be served from the cache by other workers. In this
+    process, `invalidate` and `invalidate_user` remove them as soon as the credential is revoked or the user
+    is changed.
+    """
+
+    def __init__(self, max_size: int = 1000, ttl: float = 30):
+        self.ttl = ttl
+        self._cache: LRUCache[str, _Entry] = LRUCache(maxsize=max_size)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, credential: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._cache.get(credential)
+            if entry is not None and entry.expires_at <= time.time():
+                del self._cache[credential]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry.value
+
+    def set(self, credential: str, user_id: UUID, value: Any, expires_at: Optional[float] = None):
+        """Caches the value of a credential, until `expires_at` (a Unix timestamp) if it's sooner than the TTL."""
+        deadline = time.time() + self.ttl
+        if expires_at is not None:
+            deadline = min(deadline, expires_at)
+        with self._lock:
+            self._cache[credential] = _Entry(user_id, value, deadline)
+
+    def invalidate(self, credential: str):
+        with self._lock:
+            if self._cache.pop(credential, None) is not None:
+                self.invalidations += 1
+
+    def invalidate_user(self, user_id: UUID):
+        """Removes every entry of the user."""
+        with self._lock:
+            for credential in [credential for credential, entry in self._cache.items() if entry.user_id == user_id]:
+                del self._cache[credential]
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+            self.expirations = 0
+            self.invalidations = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._cache),
+                "max_size": int(self._cache.maxsize),
+                "hits": self.hits,
+                "misses": self.misses,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+_api_key_cache: AuthenticationCache | None = None
+_token_cache: AuthenticationCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_api_key_cache() -> AuthenticationCache | None:
+    """Returns the cache of API key -> user, or None if `api_key_cache_ttl` is 0."""
+    global _api_key_cache
+    from langflow.services.deps import get_settings_service
+
+    settings = get_settings_service().settings
+    if not settings.api_key_cache_ttl:
+        return None
+    with _cache_lock:
+        if _api_key_cache is None:
+            _api_key_cache = AuthenticationCache(max_size=settings.api_key_cache_size, ttl=settings.api_key_cache_ttl)
+        return _api_key_cache
+
+
+def get_token_cache() -> AuthenticationCache | None:
+    """Returns the cache of verified access token -> user, or None if `token_cache_ttl` is 0."""
+    global _token_cache
+    from langflow.services.deps import get_settings_service
+
+    settings = get_settings_service().settings
+    if not settings.token_cache_ttl:
+        return None
+    with _cache_lock:
+        if _token_cache is None:
+            _token_cache = AuthenticationCache(max_size=settings.token_cache_size, ttl=settings.token_cache_ttl)
+        return _token_cache
+
+
+def invalidate_user(user_id: UUID):
+    """Removes the cached entries of a user that was changed or deleted."""
+    for cache in (_api_key_cache, _token_cache):
+        if cache is not None:
+            cache.invalidate_user(user_id)
+
+
+def clear_authentication_caches():
+    """Empties the caches when the services are torn down, as their users belong to the database service."""
+    for cache in (_api_key_cache, _token_cache):
+        if cache is not None:
+            cache.clear()
+
+
+def invalidate_token(token: str):
+    """Removes a cached access token, when the user logs out."""
+    if _token_cache is not None:
+        _token_cache.invalidate(token)
@@ -2,7 +2,7 @@ import base64
 import random
 import warnings
 from datetime import datetime, timedelta, timezone
-from typing import Annotated, Coroutine, Optional, Union
+from typing import Annotated, Coroutine, Optional
 from uuid import UUID
 
 from cryptography.fernet import Fernet
@@ -10,14 +10,21 @@ from fastapi import Depends, HTTPException, Security, status
 from fastapi.security import APIKeyHeader, APIKeyQuery, OAuth2PasswordBearer
 from jose import JWTError, jwt
 from loguru import logger
+from sqlalchemy.orm import make_transient_to_detached
 from sqlmodel import Session
 from starlette.websockets import WebSocket
 
-from langflow.services.database.models.api_key.crud import check_key
-from langflow.services.database.models.api_key.model import ApiKey
-from langflow.services.database.models.user.crud import get_user_by_id, get_user_by_username, update_user_last_login_at
+from langflow.services.auth.cache import get_api_key_cache, get_token_cache
+from langflow.services.database.models.api_key.crud import acheck_key, get_api_key_usage_counter
+from langflow.services.database.models.user.crud import (
+    aget_user_by_id,
+    aget_user_by_username,
+    get_user_by_id,
+    get_user_by_username,
+    update_user_last_login_at,
+)
 from langflow.services.database.models.user.model import User, UserRead
-from langflow.services.deps import get_session, get_settings_service
+from langflow.services.deps import async_session_scope, get_session, get_settings_service
 
 oauth2_login = OAuth2PasswordBearer(tokenUrl="api/v1/login", auto_error=False)
 
@@ -31,10 +38,9 @@ api_key_header = APIKeyHeader(name=API_KEY_NAME, scheme_name="API key header", a
 async def api_key_security(
     query_param: str = Security(api_key_query),
     header_param: str = Security(api_key_header),
-    db: Session = Depends(get_session),
 ) -> Optional[UserRead]:
     settings_service = get_settings_service()
-    result: Optional[Union[ApiKey, User]] = None
+    result: Optional[User] = None
     if settings_service.auth_settings.AUTO_LOGIN:
         # Get the first user
         if not settings_service.auth_settings.SUPERUSER:
@@ -43,7 +49,8 @@ async def api_key_security(
                 detail="Missing first superuser credentials",
             )
 
-        result = get_user_by_username(db, settings_service.auth_settings.SUPERUSER)
+        async with async_session_scope() as session:
+            result = await aget_user_by_username(session, settings_service.auth_settings.SUPERUSER)
 
     elif not query_param and not header_param:
         raise HTTPException(
@@ -51,34 +58,47 @@ async def api_key_security(
             detail="An API key must be passed as query or header",
         )
 
-    elif query_param:
-        result = check_key(db, query_param)
-
     else:
-        result = check_key(db, header_param)
+        user = await get_user_by_api_key(query_param or header_param)
+        if user is not None:
+            return user
 
     if not result:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Invalid or missing API key",
         )
-    if isinstance(result, ApiKey):
-        return UserRead.model_validate(result.user, from_attributes=True)
-    elif isinstance(result, User):
-        return UserRead.model_validate(result, from_attributes=True)
-    raise ValueError("Invalid result type")
+    return UserRead.model_validate(result, from_attributes=True)
+
+
+async def get_user_by_api_key(api_key: str) -> Optional[UserRead]:
+    """Returns the user of the API key, or None if the key is invalid. Checked keys are cached for a few seconds."""
+    cache = get_api_key_cache()
+    cached = cache.get(api_key) if cache is not None else None
+    if cached is not None:
+        api_key_id, user = cached
+        get_api_key_usage_counter().record(api_key_id)
+        # Copied, as callers may change the user they get
+        return user.model_copy()
+    async with async_session_scope() as session:
+        api_key_object = await acheck_key(session, api_key)
+        if api_key_object is None:
+            return None
+        user = UserRead.model_validate(api_key_object.user, from_attributes=True)
+    if cache is not None:
+        cache.set(api_key, user.id, (api_key_object.id, user.model_copy()))
+    return user
 
 
 async def get_current_user(
     token: str = Security(oauth2_login),
     query_param: str = Security(api_key_query),
     header_param: str = Security(api_key_header),
-    db: Session = Depends(get_session),
 ) -> User:
     if token:
-        return await get_current_user_by_jwt(token, db)
+        return await get_current_user_by_jwt(token)
     else:
-        user = await api_key_security(query_param, header_param, db)
+        user = await api_key_security(query_param, header_param)
         if user:
             return user
 
@@ -90,13 +110,16 @@ async def get_current_user(
 
 async def get_current_user_by_jwt(
     token: Annotated[str, Depends(oauth2_login)],
-    db: Session = Depends(get_session),
 ) -> User:
     settings_service = get_settings_service()
 
     if isinstance(token, Coroutine):
         token = await token
 
+    cache = get_token_cache()
+    if cache is not None and (user_data := cache.get(token)) is not None:
+        return _detached_user(user_data)
+
     secret_key = settings_service.auth_settings.SECRET_KEY.get_secret_value()
     if secret_key is None:
         logger.error("Secret key is not set in settings.")
@@ -139,7 +162,8 @@ async def get_current_user_by_jwt(
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
 
-    user = get_user_by_id(db, user_id)
+    async with async_session_scope() as session:
+        user = await aget_user_by_id(session, user_id)
     if user is None or not user.is_active:
         logger.info("User not found or inactive.")
         raise HTTPException(
@@ -147,20 +171,30 @@ async def get_current_user_by_jwt(
             detail="User not found or is inactive.",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    user_data = user.model_dump()
+    if cache is not None:
+        cache.set(token, user.id, user_data, expires_at=payload.get("exp"))
+    # Loaded without blocking the event loop or opening a sync session for the request
+    return _detached_user(user_data)
+
+
+def _detached_user(user_data: dict) -> User:
+    """Returns the user of cached data as a detached instance, which endpoints can add to their session to update it."""
+    user = User(**user_data)
+    make_transient_to_detached(user)
     return user
 
 
 async def get_current_user_for_websocket(
     websocket: WebSocket,
-    db: Session = Depends(get_session),
     query_param: str = Security(api_key_query),
 ) -> Optional[User]:
     token = websocket.query_params.get("token")
     api_key = websocket.query_params.get("x-api-key")
     if token:
-        return await get_current_user_by_jwt(token, db)
+        return await get_current_user_by_jwt(token)
     elif api_key:
-        return await api_key_security(api_key, query_param, db)
+        return await api_key_security(api_key, query_param)
     else:
         return None
 
@@ -1,4 +1,5 @@
 from langflow.services.cache.service import AsyncInMemoryCache, CacheService, RedisCache, ThreadingInMemoryCache
+from langflow.services.cache.tiered import TieredCache
 
 from . import factory, service
 
@@ -9,4 +10,5 @@ __all__ = [
     "AsyncInMemoryCache",
     "CacheService",
     "RedisCache",
+    "TieredCache",
 ]
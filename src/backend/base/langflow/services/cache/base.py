@@ -63,6 +63,15 @@ class CacheService(Service, Generic[LockType]):
         Clear all items from the cache.
         """
 
+    def stats(self) -> dict:
+        """
+        Return usage statistics of the cache, such as the number of entries and hits.
+
+        Returns:
+            A dict of statistics, empty if the cache doesn't keep any.
+        """
+        return {}
+
     @abc.abstractmethod
     def __contains__(self, key):
         """
@@ -158,6 +167,61 @@ class AsyncBaseCacheService(Service, Generic[AsyncLockType]):
         Clear all items from the cache.
         """
 
+    async def get_many(self, keys, lock: Optional[AsyncLockType] = None) -> list:
+        """
+        Retrieve several items from the cache.
+
+        Caches backed by a server override this to fetch them in a single round trip.
+
+        Args:
+            keys: The keys of the items to retrieve.
+
+        Returns:
+            The values in the order of the keys.
+        """
+        return [await self.get(key, lock=lock) for key in keys]
+
+    async def set_many(self, items: dict, lock: Optional[AsyncLockType] = None):
+        """
+        Add several items to the cache.
+
+        Args:
+            items: A mapping of keys to the values to cache.
+        """
+        for key, value in items.items():
+            await self.set(key, value, lock=lock)
+
+    async def delete_many(self, keys, lock: Optional[AsyncLockType] = None):
+        """
+        Remove several items from the cache.
+
+        Args:
+            keys: The keys of the items to remove.
+        """
+        for key in keys:
+            await self.delete(key, lock=lock)
+
+    async def contains(self, key) -> bool:
+        """
+        Check if the key is in the cache without blocking the event loop.
+
+        Args:
+            key: The key of the item to check.
+
+        Returns:
+            True if the key is in the cache, False otherwise.
+        """
+        return key in self
+
+    def stats(self) -> dict:
+        """
+        Return usage statistics of the cache, such as the number of entries and hits.
+
+        Returns:
+            A dict of statistics, empty if the cache doesn't keep any.
+        """
+        return {}
+
     @abc.abstractmethod
     def __contains__(self, key):
         """
@@ -1,5 +1,4 @@
 import asyncio
-import pickle
 import time
 from typing import Generic, Optional
 
@@ -7,7 +6,7 @@ from diskcache import Cache
 from loguru import logger
 
 from langflow.services.cache.base import AsyncBaseCacheService, AsyncLockType
-from langflow.services.cache.utils import CACHE_MISS
+from langflow.services.cache.utils import CACHE_MISS, dumps_payload, loads_payload
 
 
 class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):  # type: ignore
@@ -35,7 +34,7 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):  # type: ig
         if item:
             if time.time() - item["time"] < self.expiration_time:
                 await asyncio.to_thread(self.cache.touch, key)  # Refresh the expiry time
-                return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
+                return loads_payload(item["value"]) if isinstance(item["value"], bytes) else item["value"]
             else:
                 logger.info(f"Cache item for key '{key}' has expired and will be deleted.")
                 await self._delete(key)  # Log before deleting the expired item
@@ -51,7 +50,7 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):  # type: ig
     async def _set(self, key, value):
         if self.max_size and len(self.cache) >= self.max_size:
             await asyncio.to_thread(self.cache.cull)
-        item = {"value": pickle.dumps(value) if not isinstance(value, (str, bytes)) else value, "time": time.time()}
+        item = {"value": dumps_payload(value) if not isinstance(value, str) else value, "time": time.time()}
         await asyncio.to_thread(self.cache.set, key, item)
 
     async def delete(self, key, lock: Optional[asyncio.Lock] = None):
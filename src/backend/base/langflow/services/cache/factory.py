@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 
 from langflow.services.cache.disk import AsyncDiskCache
 from langflow.services.cache.service import AsyncInMemoryCache, CacheService, RedisCache, ThreadingInMemoryCache
+from langflow.services.cache.tiered import LocalInvalidationBus, RedisInvalidationBus, TieredCache
 from langflow.services.factory import ServiceFactory
 from langflow.logging.logger import logger
 
@@ -18,27 +19,56 @@ class CacheServiceFactory(ServiceFactory):
         # based on the settings_service
 
         if settings_service.settings.cache_type == "redis":
-            logger.debug("Creating Redis cache")
-            redis_cache: RedisCache = RedisCache(
-                host=settings_service.settings.redis_host,
-                port=settings_service.settings.redis_port,
-                db=settings_service.settings.redis_db,
-                url=settings_service.settings.redis_url,
-                expiration_time=settings_service.settings.redis_cache_expire,
-            )
-            if redis_cache.is_connected():
-                logger.debug("Redis cache is connected")
-                return redis_cache
-            else:
-                # do not attempt to fallback to another cache type
-                raise ConnectionError("Failed to connect to Redis cache")
+            return self._create_redis_cache(settings_service)
 
         elif settings_service.settings.cache_type == "memory":
-            return ThreadingInMemoryCache(expiration_time=settings_service.settings.cache_expire)
+            return ThreadingInMemoryCache(
+                expiration_time=settings_service.settings.cache_expire,
+                max_bytes=settings_service.settings.cache_max_bytes,
+                sweep_interval=settings_service.settings.cache_sweep_interval,
+            )
         elif settings_service.settings.cache_type == "async":
-            return AsyncInMemoryCache(expiration_time=settings_service.settings.cache_expire)
-        elif settings_service.settings.cache_type == "disk":
-            return AsyncDiskCache(
-                cache_dir=settings_service.settings.config_dir,
+            return AsyncInMemoryCache(
                 expiration_time=settings_service.settings.cache_expire,
+                max_bytes=settings_service.settings.cache_max_bytes,
+                sweep_interval=settings_service.settings.cache_sweep_interval,
             )
+        elif settings_service.settings.cache_type == "disk":
+            return self._create_disk_cache(settings_service)
+        elif settings_service.settings.cache_type == "tiered":
+            return self._create_tiered_cache(settings_service)
+
+    def _create_redis_cache(self, settings_service: "SettingsService") -> RedisCache:
+        logger.debug("Creating Redis cache")
+        redis_cache: RedisCache = RedisCache(
+            host=settings_service.settings.redis_host,
+            port=settings_service.settings.redis_port,
+            db=settings_service.settings.redis_db,
+            url=settings_service.settings.redis_url,
+            expiration_time=settings_service.settings.redis_cache_expire,
+            max_connections=settings_service.settings.redis_max_connections,
+        )
+        if redis_cache.is_connected():
+            logger.debug("Redis cache is connected")
+            return redis_cache
+        else:
+            # do not attempt to fallback to another cache type
+            raise ConnectionError("Failed to connect to Redis cache")
+
+    def _create_disk_cache(self, settings_service: "SettingsService") -> AsyncDiskCache:
+        return AsyncDiskCache(
+            cache_dir=settings_service.settings.config_dir,
+            expiration_time=settings_service.settings.cache_expire,
+        )
+
+    def _create_tiered_cache(self, settings_service: "SettingsService") -> TieredCache:
+        l1 = AsyncInMemoryCache(
+            max_size=settings_service.settings.tiered_cache_l1_max_size,
+            expiration_time=settings_service.settings.cache_expire,
+            max_bytes=settings_service.settings.cache_max_bytes,
+            sweep_interval=settings_service.settings.cache_sweep_interval,
+        )
+        if settings_service.settings.tiered_cache_l2 == "redis":
+            redis_cache = self._create_redis_cache(settings_service)
+            return TieredCache(l1=l1, l2=redis_cache, bus=RedisInvalidationBus(redis_cache))
+        return TieredCache(l1=l1, l2=self._create_disk_cache(settings_service), bus=LocalInvalidationBus())
@@ -2,26 +2,128 @@ import asyncio
 import pickle
 import threading
 import time
+from contextlib import suppress
 from collections import OrderedDict
-from typing import Generic, Optional
+from typing import TYPE_CHECKING, Generic, Optional
+from weakref import WeakKeyDictionary
 
 from loguru import logger
 
 from langflow.services.cache.base import AsyncBaseCacheService, AsyncLockType, CacheService, LockType
-from langflow.services.cache.utils import CACHE_MISS
+from langflow.services.cache.utils import CACHE_MISS, dumps_payload, get_object_size, loads_payload
 
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
 
-class ThreadingInMemoryCache(CacheService, Generic[LockType]):  # type: ignore
+
+class MemoryAccountingMixin:
+    """
+    LRU bookkeeping shared by the in-memory caches.
+
+    Entries are evicted, least recently used first, when the cache holds more than `max_size`
+    entries or more than `max_bytes` bytes. Sizes are the pickled size of bytes values and an
+    estimate from `get_object_size` otherwise, and are only computed when `max_bytes` is set, as
+    estimating them walks the whole value. The methods don't lock, the caches call them while
+    holding their lock.
+    """
+
+    def _init_accounting(self, entries: OrderedDict, max_size=None, max_bytes=None, expiration_time=60 * 60):
+        """Sets up the bookkeeping of `entries`, the dict the cache stores its items in."""
+        self._entries = entries
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.expiration_time = expiration_time
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _is_expired(self, item: dict, now: float) -> bool:
+        return self.expiration_time is not None and now - item["time"] >= self.expiration_time
+
+    def _lookup(self, key):
+        """Returns the entry of the key and marks it as recently used, or None if it is missing or expired."""
+        item = self._entries.get(key)
+        if item is not None and self._is_expired(item, time.time()):
+            logger.info(f"Cache item for key '{key}' has expired and will be deleted.")
+            self._remove(key)
+            self.expirations += 1
+            item = None
+        if item is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return item
+
+    def _store(self, key, value) -> bool:
+        """Stores the value, evicting entries to make room. Returns False if it is larger than the whole budget."""
+        self._remove(key)
+        if not self.max_bytes:
+            size = 0
+        else:
+            size = len(value) if isinstance(value, bytes) else get_object_size(value)
+        if self.max_bytes and size > self.max_bytes:
+            logger.warning(f"Cache item for key '{key}' ({size} bytes) is larger than the cache and was not stored.")
+            self.evictions += 1
+            return False
+        entries = self._entries
+        while entries and (
+            (self.max_size and len(entries) >= self.max_size)
+            or (self.max_bytes and self._bytes + size > self.max_bytes)
+        ):
+            _, evicted = entries.popitem(last=False)
+            self._bytes -= evicted["size"]
+            self.evictions += 1
+        entries[key] = {"value": value, "time": time.time(), "size": size}
+        self._bytes += size
+        return True
+
+    def _remove(self, key):
+        if (item := self._entries.pop(key, None)) is not None:
+            self._bytes -= item["size"]
+
+    def _remove_all(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    def _sweep(self) -> int:
+        """Removes the expired entries and returns how many were removed."""
+        now = time.time()
+        expired = [key for key, item in self._entries.items() if self._is_expired(item, now)]
+        for key in expired:
+            self._remove(key)
+        self.expirations += len(expired)
+        return len(expired)
+
+    def _get_stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_size": self.max_size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class ThreadingInMemoryCache(MemoryAccountingMixin, CacheService, Generic[LockType]):  # type: ignore
     """
     A simple in-memory cache using an OrderedDict.
 
-    This cache supports setting a maximum size and expiration time for cached items.
-    When the cache is full, it uses a Least Recently Used (LRU) eviction policy.
+    This cache supports setting a maximum size, a maximum total size in bytes and an expiration
+    time for cached items. When the cache is full, it uses a Least Recently Used (LRU) eviction
+    policy. Expired items are removed when read and by a background sweeper thread.
     Thread-safe using a threading Lock.
 
     Attributes:
         max_size (int, optional): Maximum number of items to store in the cache.
+        max_bytes (int, optional): Maximum estimated size in bytes of all the items in the cache.
         expiration_time (int, optional): Time in seconds after which a cached item expires. Default is 1 hour.
+        sweep_interval (int, optional): Seconds between sweeps of expired items. No sweeper runs when not set.
 
     Example:
 
@@ -37,18 +139,41 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):  # type: ignore
         b = cache["b"]
     """
 
-    def __init__(self, max_size=None, expiration_time=60 * 60):
+    def __init__(self, max_size=None, expiration_time=60 * 60, max_bytes=None, sweep_interval=None):
         """
         Initialize a new InMemoryCache instance.
 
         Args:
             max_size (int, optional): Maximum number of items to store in the cache.
             expiration_time (int, optional): Time in seconds after which a cached item expires. Default is 1 hour.
+            max_bytes (int, optional): Maximum estimated size in bytes of all the items in the cache.
+            sweep_interval (int, optional): Seconds between sweeps of expired items.
         """
         self._cache = OrderedDict()
         self._lock = threading.RLock()
-        self.max_size = max_size
-        self.expiration_time = expiration_time
+        self._init_accounting(self._cache, max_size=max_size, max_bytes=max_bytes, expiration_time=expiration_time)
+        self._stop_sweeper = threading.Event()
+        if sweep_interval:
+            threading.Thread(
+                target=self._sweep_periodically, args=(sweep_interval,), name="cache-sweeper", daemon=True
+            ).start()
+
+    def _sweep_periodically(self, interval: float):
+        while not self._stop_sweeper.wait(interval):
+            self.sweep()
+
+    def sweep(self) -> int:
+        """Removes the expired items and returns how many were removed."""
+        with self._lock:
+            return self._sweep()
+
+    def stats(self) -> dict:
+        """Returns the number of entries, their estimated size and the hit, miss, eviction and expiration counts."""
+        with self._lock:
+            return self._get_stats()
+
+    async def teardown(self):
+        self._stop_sweeper.set()
 
     def get(self, key, lock: Optional[threading.Lock] = None):
         """
@@ -67,18 +192,11 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):  # type: ignore
         """
         Retrieve an item from the cache without acquiring the lock.
         """
-        if item := self._cache.get(key):
-            if self.expiration_time is None or time.time() - item["time"] < self.expiration_time:
-                # Move the key to the end to make it recently used
-                self._cache.move_to_end(key)
-                # Check if the value is pickled
-                if isinstance(item["value"], bytes):
-                    value = pickle.loads(item["value"])
-                else:
-                    value = item["value"]
-                return value
-            else:
-                self.delete(key)
+        if item := self._lookup(key):
+            # Check if the value is pickled
+            if isinstance(item["value"], bytes):
+                return pickle.loads(item["value"])
+            return item["value"]
         return None
 
     def set(self, key, value, lock: Optional[threading.Lock] = None):
@@ -92,15 +210,7 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):  # type: ignore
             value: The value to cache.
         """
         with lock or self._lock:
-            if key in self._cache:
-                # Remove existing key before re-inserting to update order
-                self.delete(key)
-            elif self.max_size and len(self._cache) >= self.max_size:
-                # Remove least recently used item
-                self._cache.popitem(last=False)
-            # pickle locally to mimic Redis
-
-            self._cache[key] = {"value": value, "time": time.time()}
+            self._store(key, value)
 
     def upsert(self, key, value, lock: Optional[threading.Lock] = None):
         """
@@ -145,14 +255,14 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):  # type: ignore
             key: The key of the item to remove.
         """
         with lock or self._lock:
-            self._cache.pop(key, None)
+            self._remove(key)
 
     def clear(self, lock: Optional[threading.Lock] = None):
         """
         Clear all items from the cache.
         """
         with lock or self._lock:
-            self._cache.clear()
+            self._remove_all()
 
     def __contains__(self, key):
         """Check if the key is in the cache."""
@@ -176,7 +286,10 @@ class ThreadingInMemoryCache(CacheService, Generic[LockType]):  # type: ignore
 
     def __repr__(self):
         """Return a string representation of the InMemoryCache instance."""
-        return f"InMemoryCache(max_size={self.max_size}, expiration_time={self.expiration_time})"
+        return (
+            f"InMemoryCache(max_size={self.max_size}, max_bytes={self.max_bytes}, "
+            f"expiration_time={self.expiration_time})"
+        )
 
 
 class RedisCache(AsyncBaseCacheService, Generic[LockType]):  # type: ignore
@@ -184,6 +297,9 @@ class RedisCache(AsyncBaseCacheService, Generic[LockType]):  # type: ignore
     A Redis-based cache implementation.
 
     This cache supports setting an expiration time for cached items.
+    It uses the redis.asyncio client, so cache calls don't block the event loop. Connections
+    are shared through a pool, with one pool per event loop because asyncio connections
+    can't be used from another loop.
 
     Attributes:
         expiration_time (int, optional): Time in seconds after which a cached item expires. Default is 1 hour.
@@ -193,16 +309,15 @@ class RedisCache(AsyncBaseCacheService, Generic[LockType]):  # type: ignore
         cache = RedisCache(expiration_time=5)
 
         # setting cache values
-        cache.set("a", 1)
-        cache.set("b", 2)
-        cache["c"] = 3
+        await cache.set("a", 1)
+        await cache.set_many({"b": 2, "c": 3})
 
         # getting cache values
-        a = cache.get("a")
-        b = cache["b"]
+        a = await cache.get("a")
+        b, c = await cache.get_many(["b", "c"])
     """
 
-    def __init__(self, host="localhost", port=6379, db=0, url=None, expiration_time=60 * 60):
+    def __init__(self, host="localhost", port=6379, db=0, url=None, expiration_time=60 * 60, max_connections=None):
         """
         Initialize a new RedisCache instance.
 
@@ -210,11 +325,13 @@ class RedisCache(AsyncBaseCacheService, Generic[LockType]):  # type: ignore
             host (str, optional): Redis host.
             port (int, optional): Redis port.
             db (int, optional): Redis DB.
+            url (str, optional): Redis URL, used instead of host, port and db when set.
             expiration_time (int, optional): Time in seconds after which a
-            ached item expires. Default is 1 hour.
+            cached item expires. Default is 1 hour.
+            max_connections (int, optional): Maximum number of connections of each pool.
         """
         try:
-            import redis
+            import redis.asyncio  # noqa: F401
         except ImportError as exc:
             raise ImportError(
                 "RedisCache requires the redis-py package."
@@ -224,25 +341,59 @@ class RedisCache(AsyncBaseCacheService, Generic[LockType]):  # type: ignore
             "RedisCache is an experimental feature and may not work as expected."
             " Please report any issues to our GitHub repository."
         )
-        if url:
-            self._client = redis.StrictRedis.from_url(url)
-        else:
-            self._client = redis.StrictRedis(host=host, port=port, db=db)
+        self.url = url
+        self.connection_kwargs = {"host": host, "port": port, "db": db}
+        self.max_connections = max_connections
         self.expiration_time = expiration_time
+        self._clients: WeakKeyDictionary[asyncio.AbstractEventLoop, "Redis"] = WeakKeyDictionary()
+
+    def _create_client(self) -> "Redis":
+        from redis.asyncio import ConnectionPool, StrictRedis
+
+        if self.url:
+            pool = ConnectionPool.from_url(self.url, max_connections=self.max_connections)
+        else:
+            pool = ConnectionPool(max_connections=self.max_connections, **self.connection_kwargs)
+        return StrictRedis(connection_pool=pool)
+
+    @property
+    def _client(self) -> "Redis":
+        """The client of the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._create_client()
+            self._clients[loop] = client
+        return client
 
     # check connection
     def is_connected(self):
         """
-        Check if the Redis client is connected.
+        Check if the Redis server can be reached.
+
+        This uses a short-lived synchronous client, since it is called once when the
+        cache service is created and that may happen outside of an event loop.
         """
         import redis
 
+        if self.url:
+            client = redis.StrictRedis.from_url(self.url)
+        else:
+            client = redis.StrictRedis(**self.connection_kwargs)
         try:
-            self._client.ping()
+            client.ping()
             return True
         except redis.exceptions.ConnectionError as exc:
             logger.error(f"RedisCache could not connect to the Redis server: {exc}")
             return False
+        finally:
+            client.close()
+
+    def _dumps(self, value) -> bytes:
+        try:
+            return dumps_payload(value)
+        except TypeError as exc:
+            raise TypeError("RedisCache only accepts values that can be pickled. ") from exc
 
     async def get(self, key, lock=None):
         """
@@ -256,8 +407,23 @@ class RedisCache(AsyncBaseCacheService, Generic[LockType]):  # type: ignore
         """
         if key is None:
             return None
-        value = self._client.get(str(key))
-        return pickle.loads(value) if value else None
+        value = await self._client.get(str(key))
+        return loads_payload(value) if value else None
+
+    async def get_many(self, keys, lock=None):
+        """
+        Retrieve several items from the cache in a single round trip.
+
+        Args:
+            keys: The keys of the items to retrieve.
+
+        Returns:
+            The values in the order of the keys, with None for the keys that are not found.
+        """
+        if not keys:
+            return []
+        values = await self._client.mget([str(key) for key in keys])
+        return [loads_payload(value) if value else None for value in values]
 
     async def set(self, key, value, lock=None):
         """
@@ -267,31 +433,66 @@ class RedisCache(AsyncBaseCacheService, Generic[LockType]):  # type: ignore
             key: The key of the item.
             value: The value to cache.
         """
-        try:
-            if pickled := pickle.dumps(value):
-                result = self._client.setex(str(key), self.expiration_time, pickled)
-                if not result:
-                    raise ValueError("RedisCache could not set the value.")
-        except TypeError as exc:
-            raise TypeError("RedisCache only accepts values that can be pickled. ") from exc
+        if pickled := self._dumps(value):
+            result = await self._client.setex(str(key), self.expiration_time, pickled)
+            if not result:
+                raise ValueError("RedisCache could not set the value.")
+
+    async def set_many(self, items, lock=None):
+        """
+        Add several items to the cache in a single pipelined round trip.
+
+        Args:
+            items: A mapping of keys to the values to cache.
+        """
+        if not items:
+            return
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.setex(str(key), self.expiration_time, self._dumps(value))
+            results = await pipe.execute()
+        if not all(results):
+            raise ValueError("RedisCache could not set the values.")
 
     async def upsert(self, key, value, lock=None):
         """
         Inserts or updates a value in the cache.
         If the existing value and the new value are both dictionaries, they are merged.
 
+        The merge runs in a WATCH/MULTI transaction that is retried if the key changes in
+        the meantime, so concurrent upserts from several workers don't overwrite each other.
+
         Args:
             key: The key of the item.
             value: The value to insert or update.
         """
         if key is None:
             return
-        existing_value = await self.get(key)
-        if existing_value is not None and isinstance(existing_value, dict) and isinstance(value, dict):
-            existing_value.update(value)
-            value = existing_value
+        if not isinstance(value, dict):
+            # Nothing to merge, so a plain set is already atomic
+            await self.set(key, value)
+            return
 
-        await self.set(key, value)
+        from redis.exceptions import WatchError
+
+        key = str(key)
+        async with self._client.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(key)
+                    existing = await pipe.get(key)
+                    existing_value = loads_payload(existing) if existing else None
+                    if isinstance(existing_value, dict):
+                        existing_value.update(value)
+                        new_value = existing_value
+                    else:
+                        new_value = value
+                    pipe.multi()
+                    pipe.setex(key, self.expiration_time, self._dumps(new_value))
+                    await pipe.execute()
+                    return
+                except WatchError:
+                    continue
 
     async def delete(self, key, lock=None):
         """
@@ -300,42 +501,108 @@ class RedisCache(AsyncBaseCacheService, Generic[LockType]):  # type: ignore
         Args:
             key: The key of the item to remove.
         """
-        self._client.delete(key)
+        await self._client.delete(str(key))
+
+    async def delete_many(self, keys, lock=None):
+        """
+        Remove several items from the cache in a single round trip.
+
+        Args:
+            keys: The keys of the items to remove.
+        """
+        if keys:
+            await self._client.delete(*[str(key) for key in keys])
 
     async def clear(self, lock=None):
         """
         Clear all items from the cache.
         """
-        self._client.flushdb()
+        await self._client.flushdb()
 
-    def __contains__(self, key):
+    async def contains(self, key) -> bool:
         """Check if the key is in the cache."""
-        return False if key is None else self._client.exists(str(key))
+        return False if key is None else bool(await self._client.exists(str(key)))
+
+    def __contains__(self, key):
+        """The check needs a round trip to Redis, so it is only available as `await cache.contains(key)`."""
+        raise TypeError("RedisCache can't be checked synchronously, use `await cache.contains(key)` instead.")
 
     async def __getitem__(self, key):
         """Retrieve an item from the cache using the square bracket notation."""
-        return self.get(key)
+        return await self.get(key)
 
     async def __setitem__(self, key, value):
         """Add an item to the cache using the square bracket notation."""
-        self.set(key, value)
+        await self.set(key, value)
 
     async def __delitem__(self, key):
         """Remove an item from the cache using the square bracket notation."""
-        self.delete(key)
+        await self.delete(key)
+
+    async def teardown(self):
+        """Closes the connection pool of the running event loop and drops those of other loops."""
+        client = self._clients.get(asyncio.get_running_loop())
+        self._clients.clear()
+        if client is not None:
+            await client.aclose()
 
     def __repr__(self):
         """Return a string representation of the RedisCache instance."""
         return f"RedisCache(expiration_time={self.expiration_time})"
 
 
-class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):  # type: ignore
-    def __init__(self, max_size=None, expiration_time=3600):
+class AsyncInMemoryCache(MemoryAccountingMixin, AsyncBaseCacheService, Generic[AsyncLockType]):  # type: ignore
+    """
+    An in-memory LRU cache for the event loop, with the same limits as `ThreadingInMemoryCache`.
+
+    The expired items sweeper runs as a single task, on the loop the cache is first written from. It moves to
+    another loop only once that loop is closed.
+    """
+
+    def __init__(self, max_size=None, expiration_time=3600, max_bytes=None, sweep_interval=None):
         self.cache = OrderedDict()
 
         self.lock = asyncio.Lock()
-        self.max_size = max_size
-        self.expiration_time = expiration_time
+        self._init_accounting(self.cache, max_size=max_size, max_bytes=max_bytes, expiration_time=expiration_time)
+        self.sweep_interval = sweep_interval
+        self._sweeper_task: Optional[asyncio.Task] = None
+
+    def _ensure_sweeper(self):
+        if not self.sweep_interval:
+            return
+        task = self._sweeper_task
+        if task is not None and not task.done():
+            if not task.get_loop().is_closed():
+                # Writes from other loops, such as those of components run in worker threads, keep the sweeper
+                return
+            # The task of a closed loop never runs again
+            with suppress(RuntimeError):
+                task.cancel()
+        self._sweeper_task = asyncio.create_task(self._sweep_periodically())
+
+    async def _sweep_periodically(self):
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            await self.sweep()
+
+    async def sweep(self) -> int:
+        """Removes the expired items and returns how many were removed."""
+        async with self.lock:
+            return self._sweep()
+
+    def stats(self) -> dict:
+        """Returns the number of entries, their estimated size and the hit, miss, eviction and expiration counts."""
+        return self._get_stats()
+
+    async def teardown(self):
+        task, self._sweeper_task = self._sweeper_task, None
+        if task is None:
+            return
+        with suppress(RuntimeError):
+            task.cancel()
+        if task.get_loop() is asyncio.get_running_loop():
+            with suppress(asyncio.CancelledError):
+                await task
 
     async def get(self, key, lock: Optional[asyncio.Lock] = None):
         if not lock:
@@ -345,14 +612,8 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):  # type
             return await self._get(key)
 
     async def _get(self, key):
-        item = self.cache.get(key, None)
-        if item:
-            if time.time() - item["time"] < self.expiration_time:
-                self.cache.move_to_end(key)
-                return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
-            else:
-                logger.info(f"Cache item for key '{key}' has expired and will be deleted.")
-                await self._delete(key)  # Log before deleting the expired item
+        if item := self._lookup(key):
+            return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
         return CACHE_MISS
 
     async def set(self, key, value, lock: Optional[asyncio.Lock] = None):
@@ -369,10 +630,8 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):  # type
             )
 
     async def _set(self, key, value):
-        if self.max_size and len(self.cache) >= self.max_size:
-            self.cache.popitem(last=False)
-        self.cache[key] = {"value": value, "time": time.time()}
-        self.cache.move_to_end(key)
+        self._ensure_sweeper()
+        self._store(key, value)
 
     async def delete(self, key, lock: Optional[asyncio.Lock] = None):
         if not lock:
@@ -382,8 +641,7 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):  # type
             await self._delete(key)
 
     async def _delete(self, key):
-        if key in self.cache:
-            del self.cache[key]
+        self._remove(key)
 
     async def clear(self, lock: Optional[asyncio.Lock] = None):
         if not lock:
@@ -393,7 +651,7 @@ class AsyncInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):  # type
             await self._clear()
 
     async def _clear(self):
-        self.cache.clear()
+        self._remove_all()
 
     async def upsert(self, key, value, lock: Optional[asyncio.Lock] = None):
         if not lock:
@@ -0,0 +1,241 @@
+import asyncio
+import json
+import pickle
+import uuid
+from typing import TYPE_CHECKING, Awaitable, Callable, Generic, Optional, Union
+from weakref import WeakKeyDictionary
+
+from loguru import logger
+
+from langflow.services.cache.base import AsyncBaseCacheService, AsyncLockType
+from langflow.services.cache.service import AsyncInMemoryCache
+from langflow.services.cache.utils import CACHE_MISS
+
+if TYPE_CHECKING:
+    from langflow.services.cache.service import RedisCache
+
+INVALIDATION_CHANNEL = "langflow:cache:invalidate"
+
+
+class LocalInvalidationBus:
+    """
+    Delivers invalidation messages to the caches of this process.
+
+    Stand-in for `RedisInvalidationBus` when the second tier isn't Redis. It only reaches
+    caches sharing the bus, so other workers rely on the expiration time of their first tier.
+    """
+
+    def __init__(self):
+        self._queues: list[asyncio.Queue] = []
+
+    async def publish(self, message: str):
+        for queue in self._queues:
+            queue.put_nowait(message)
+
+    async def listen(self, callback: Callable[[str], Awaitable[None]]):
+        queue: asyncio.Queue = asyncio.Queue()
+        self._queues.append(queue)
+        try:
+            while True:
+                await callback(await queue.get())
+        finally:
+            self._queues.remove(queue)
+
+
+class RedisInvalidationBus:
+    """Delivers invalidation messages to every worker through a Redis pub/sub channel."""
+
+    def __init__(self, redis_cache: "RedisCache", channel: str = INVALIDATION_CHANNEL):
+        self.redis_cache = redis_cache
+        self.channel = channel
+
+    async def publish(self, message: str):
+        await self.redis_cache._client.publish(self.channel, message)
+
+    async def listen(self, callback: Callable[[str], Awaitable[None]]):
+        pubsub = self.redis_cache._client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self.channel)
+        try:
+            async for message in pubsub.listen():
+                data = message["data"]
+                await callback(data.decode() if isinstance(data, bytes) else data)
+        finally:
+            await pubsub.aclose()
+
+
+InvalidationBus = Union[LocalInvalidationBus, RedisInvalidationBus]
+
+
+class TieredCache(AsyncBaseCacheService, Generic[AsyncLockType]):  # type: ignore
+    """
+    A per-process in-memory cache in front of a shared cache.
+
+    Reads are served from the first tier, which keeps values unpickled, and fall back to the
+    second tier (Redis or disk) on a miss. Writes go to both tiers of the writing worker, and the
+    changed keys are dropped from the first tier of every other worker through the invalidation bus.
+
+    Attributes:
+        l1 (AsyncInMemoryCache): The in-process cache.
+        l2 (AsyncBaseCacheService): The shared cache.
+        bus (LocalInvalidationBus | RedisInvalidationBus): Carries the invalidated keys between workers.
+    """
+
+    def __init__(self, l1: AsyncInMemoryCache, l2: AsyncBaseCacheService, bus: Optional[InvalidationBus] = None):
+        self.l1 = l1
+        self.l2 = l2
+        self.bus = bus or LocalInvalidationBus()
+        self.lock = asyncio.Lock()
+        self._id = uuid.uuid4().hex
+        # Bumped by every invalidation, so a read racing with one doesn't fill the first tier with a stale value
+        self._generation = 0
+        self._listeners: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task] = WeakKeyDictionary()
+
+    def _ensure_listener(self):
+        loop = asyncio.get_running_loop()
+        task = self._listeners.get(loop)
+        if task is None or task.done():
+            self._listeners[loop] = loop.create_task(self._listen())
+
+    async def _listen(self):
+        try:
+            await self.bus.listen(self._on_message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            # Invalidations may have been missed, so nothing in the first tier can be trusted
+            logger.warning(f"Cache invalidation listener stopped: {exc}")
+            await self._invalidate_local(None)
+
+    async def _on_message(self, message: str):
+        payload = json.loads(message)
+        if payload["origin"] != self._id:
+            await self._invalidate_local(payload["key"])
+
+    async def _invalidate_local(self, key):
+        self._generation += 1
+        if key is None:
+            await self.l1.clear()
+        else:
+            await self.l1.delete(key)
+
+    async def _invalidate(self, key):
+        """Drops the key from the first tier of this and every other worker. A key of None drops everything."""
+        await self._invalidate_local(key)
+        await self.bus.publish(json.dumps({"origin": self._id, "key": key}))
+
+    async def _set_local(self, key, value, lock):
+        # The first tier unpickles bytes values when read, so bytes are stored pickled to come back as they were
+        if isinstance(value, bytes):
+            value = pickle.dumps(value)
+        await self.l1.set(key, value, lock=lock)
+
+    async def get(self, key, lock: Optional[asyncio.Lock] = None):
+        if not lock:
+            async with self.lock:
+                return await self._get(key, self.lock)
+        else:
+            return await self._get(key, lock)
+
+    async def _get(self, key, lock):
+        self._ensure_listener()
+        value = await self.l1.get(key, lock=lock)
+        if value is not CACHE_MISS:
+            return value
+        generation = self._generation
+        value = await self.l2.get(key, lock=lock)
+        if value is None or value is CACHE_MISS:
+            return CACHE_MISS
+        if generation == self._generation:
+            await self._set_local(key, value, lock)
+        return value
+
+    async def set(self, key, value, lock: Optional[asyncio.Lock] = None):
+        if not lock:
+            async with self.lock:
+                await self._set(key, value, self.lock)
+        else:
+            await self._set(key, value, lock)
+
+    async def _set(self, key, value, lock):
+        self._ensure_listener()
+        await self.l2.set(key, value, lock=lock)
+        await self._invalidate(key)
+        await self._set_local(key, value, lock)
+
+    async def upsert(self, key, value, lock: Optional[asyncio.Lock] = None, shared_value=None):
+        """
+        Inserts or updates a value, merging dicts with the stored value.
+
+        Args:
+            key: The key of the item.
+            value: The value to insert or update.
+            shared_value: What to write to the second tier instead of `value`, such as a serialized
+                form of it. The first tier of this worker still gets `value`.
+        """
+        if not lock:
+            async with self.lock:
+                await self._upsert(key, value, self.lock, shared_value)
+        else:
+            await self._upsert(key, value, lock, shared_value)
+
+    async def _upsert(self, key, value, lock, shared_value=None):
+        self._ensure_listener()
+        generation = self._generation
+        local_value = value
+        if isinstance(value, dict):
+            # Dicts are merged with the stored value, which the first tier only knows if it holds
+            # it or if there is none. Otherwise the next read brings the merged value back.
+            local = await self.l1.get(key, lock=lock)
+            if isinstance(local, dict):
+                local_value = {**local, **value}
+            elif local is CACHE_MISS and await self.l2.contains(key):
+                local_value = CACHE_MISS
+        await self.l2.upsert(key, value if shared_value is None else shared_value, lock=lock)
+        await self._invalidate(key)
+        # Another invalidation of the key while writing may have made the merged value stale
+        if local_value is not CACHE_MISS and self._generation == generation + 1:
+            await self._set_local(key, local_value, lock)
+
+    async def delete(self, key, lock: Optional[asyncio.Lock] = None):
+        if not lock:
+            async with self.lock:
+                await self._delete(key, self.lock)
+        else:
+            await self._delete(key, lock)
+
+    async def _delete(self, key, lock):
+        self._ensure_listener()
+        await self.l2.delete(key, lock=lock)
+        await self._invalidate(key)
+
+    async def clear(self, lock: Optional[asyncio.Lock] = None):
+        if not lock:
+            async with self.lock:
+                await self._clear(self.lock)
+        else:
+            await self._clear(lock)
+
+    async def _clear(self, lock):
+        self._ensure_listener()
+        await self.l2.clear(lock=lock)
+        await self._invalidate(None)
+
+    async def contains(self, key) -> bool:
+        return key in self.l1 or await self.l2.contains(key)
+
+    def __contains__(self, key):
+        """A miss in the first tier needs the shared tier, so the check is only available as `await cache.contains(key)`."""
+        raise TypeError("TieredCache can't be checked synchronously, use `await cache.contains(key)` instead.")
+
+    def stats(self) -> dict:
+        return self.l1.stats()
+
+    async def teardown(self):
+        for task in list(self._listeners.values()):
+            task.cancel()
+        self._listeners.clear()
+        await self.l1.teardown()
+        await self.l2.teardown()
+
+    def __repr__(self):
+        return f"TieredCache(l1={type(self.l1).__name__}, l2={type(self.l2).__name__})"
@@ -1,8 +1,16 @@
 import base64
 import contextlib
 import hashlib
+import io
 import os
+import pickle
+import struct
+import sys
 import tempfile
+import types
+import zlib
+from collections import deque
+from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict
 
@@ -27,6 +35,110 @@ class CacheMiss:
         return False
 
 
+# Objects that are shared by the whole process rather than owned by a cached value
+_UNOWNED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.CodeType,
+)
+_LEAF_TYPES = (str, bytes, bytearray, int, float, complex, bool, type(None))
+
+
+def get_object_size(obj: Any) -> int:
+    """
+    Estimates the memory used by an object and everything it references, in bytes.
+
+    Services, modules, classes and functions are skipped since the cached value doesn't own them.
+    Objects referenced several times are counted once.
+    """
+    from langflow.services.base import Service
+
+    seen: set[int] = set()
+    stack = [obj]
+    size = 0
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, _UNOWNED_TYPES) or isinstance(current, Service):
+            continue
+        seen.add(id(current))
+        try:
+            size += sys.getsizeof(current)
+        except TypeError:
+            continue
+        if isinstance(current, _LEAF_TYPES):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset, deque)):
+            stack.extend(current)
+        if (attributes := getattr(current, "__dict__", None)) is not None:
+            stack.append(attributes)
+        for slot in getattr(type(current), "__slots__", ()):
+            if isinstance(slot, str) and slot not in ("__dict__", "__weakref__"):
+                stack.append(getattr(current, slot, None))
+    return size
+
+
+# Header of the payloads written by `dumps_payload`: magic, flags and number of out-of-band buffers
+_PAYLOAD_HEADER = struct.Struct("<4sBI")
+_PAYLOAD_MAGIC = b"LFC1"
+_BUFFER_LENGTH = struct.Struct("<Q")
+_COMPRESSED = 1
+COMPRESSION_THRESHOLD = 16 * 1024
+
+
+def dumps_payload(value: Any, pickler_factory: Callable[..., pickle.Pickler] = pickle.Pickler) -> bytes:
+    """
+    Serializes a value for the caches that store bytes.
+
+    The value is pickled with protocol 5, so large buffers such as numpy embeddings are written
+    out-of-band instead of being copied into the pickle. Pickles over `COMPRESSION_THRESHOLD` bytes,
+    which are mostly text, are compressed with zlib.
+    """
+    buffers: list[pickle.PickleBuffer] = []
+    file = io.BytesIO()
+    pickler_factory(file, protocol=5, buffer_callback=buffers.append).dump(value)
+    body = file.getvalue()
+    flags = 0
+    if len(body) >= COMPRESSION_THRESHOLD:
+        compressed = zlib.compress(body, 1)
+        if len(compressed) < len(body):
+            body = compressed
+            flags |= _COMPRESSED
+    raw_buffers = [buffer.raw() for buffer in buffers]
+    parts = [_PAYLOAD_HEADER.pack(_PAYLOAD_MAGIC, flags, len(raw_buffers))]
+    parts.extend(_BUFFER_LENGTH.pack(buffer.nbytes) for buffer in raw_buffers)
+    parts.extend(raw_buffers)
+    parts.append(body)
+    return b"".join(parts)
+
+
+def loads_payload(data: bytes, unpickler_factory: Callable[..., pickle.Unpickler] = pickle.Unpickler) -> Any:
+    """Deserializes a value written by `dumps_payload`. Plain pickles are loaded as they are."""
+    if not data.startswith(_PAYLOAD_MAGIC):
+        return pickle.loads(data)
+    _, flags, buffer_count = _PAYLOAD_HEADER.unpack_from(data)
+    offset = _PAYLOAD_HEADER.size
+    lengths = []
+    for _ in range(buffer_count):
+        lengths.append(_BUFFER_LENGTH.unpack_from(data, offset)[0])
+        offset += _BUFFER_LENGTH.size
+    view = memoryview(data)
+    buffers = []
+    for length in lengths:
+        # Copied so the objects built on them, such as numpy arrays, stay writable
+        buffers.append(bytearray(view[offset : offset + length]))
+        offset += length
+    body = data[offset:]
+    if flags & _COMPRESSED:
+        body = zlib.decompress(body)
+    return unpickler_factory(io.BytesIO(body), buffers=buffers).load()
+
+
 def create_cache_folder(func):
     def wrapper(*args, **kwargs):
         # Get the destination folder
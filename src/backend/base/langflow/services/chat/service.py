@@ -1,11 +1,25 @@
 import asyncio
-from collections import defaultdict
+import uuid
+from dataclasses import replace
 from threading import RLock
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+from loguru import logger
 
 from langflow.services.base import Service
 from langflow.services.cache.base import AsyncBaseCacheService
+from langflow.services.cache.service import AsyncInMemoryCache, ThreadingInMemoryCache
+from langflow.services.cache.tiered import TieredCache
+from langflow.services.cache.utils import CACHE_MISS
 from langflow.services.deps import get_cache_service
+from langflow.utils.concurrency import WeakLockRegistry
+
+if TYPE_CHECKING:
+    from langflow.graph.graph.base import Graph
+    from langflow.graph.graph.serialization import SerializedGraph
+
+# The number of step keys `ChatService._get_steps` fetches in its first round trip
+STEPS_BATCH_SIZE = 8
 
 
 class ChatService(Service):
@@ -16,10 +30,15 @@ class ChatService(Service):
     name = "chat_service"
 
     def __init__(self):
-        self._async_cache_locks = defaultdict(asyncio.Lock)
-        self._sync_cache_locks = defaultdict(RLock)
+        self._async_cache_locks = WeakLockRegistry(asyncio.Lock)
+        self._sync_cache_locks = WeakLockRegistry(RLock)
         self.cache_service = get_cache_service()
 
+    @property
+    def stores_references(self) -> bool:
+        """Whether the cache keeps the objects themselves, so changes to a cached object don't need to be stored again."""
+        return isinstance(self.cache_service, (ThreadingInMemoryCache, AsyncInMemoryCache))
+
     def _get_lock(self, key: str):
         """
         Retrieves the lock associated with the given key.
@@ -86,9 +105,131 @@ class ChatService(Service):
             "result": data,
             "type": type(data),
         }
+        if not self.stores_references and self._is_serializable_graph(data):
+            shared_dict = {**result_dict, "result": await self._serialize_graph(data)}
+            if isinstance(self.cache_service, TieredCache):
+                # The first tier of this worker keeps the graph itself, only the shared tier gets its run state
+                await self.cache_service.upsert(
+                    str(key), result_dict, lock=lock or self._get_lock(key), shared_value=shared_dict
+                )
+                return await self._contains(key)
+            result_dict = shared_dict
         await self._perform_cache_operation("upsert", key, result_dict, lock)
+        return await self._contains(key)
+
+    async def _contains(self, key: str) -> bool:
+        if isinstance(self.cache_service, AsyncBaseCacheService):
+            return await self.cache_service.contains(str(key))
         return key in self.cache_service
 
+    @staticmethod
+    def _is_serializable_graph(data: Any) -> bool:
+        from langflow.graph.graph.base import Graph
+        from langflow.graph.graph.serialization import can_serialize_state
+
+        return isinstance(data, Graph) and can_serialize_state(data)
+
+    async def _serialize_graph(self, graph: "Graph") -> "SerializedGraph":
+        """
+        Splits the graph into its run state and its structure.
+
+        The structure is stored once per flow version and shared by every cached run of the flow,
+        so only the run state is written on each update. The steps the graph runs afterwards are
+        written by `set_cache_steps` with a new `steps_token`.
+        """
+        from langflow.graph.graph.serialization import dump_state, dump_structure, get_structure_key
+
+        serialized = dump_state(graph)
+        structure_key = get_structure_key(serialized.version)
+        if not await self._contains(structure_key):
+            await self._perform_cache_operation("upsert", structure_key, dump_structure(graph))
+
+        # The steps written after the previous state are part of this one, so they are superseded
+        run_state_log = graph.run_state_log
+        run_state_log.persisted_states = len(run_state_log)
+        run_state_log.steps_token = uuid.uuid4().hex
+        run_state_log.steps_written = 0
+        return replace(serialized, steps_token=run_state_log.steps_token)
+
+    async def set_cache_steps(self, key: str, graph: "Graph"):
+        """
+        Stores the steps a graph ran since it was last stored, instead of the whole graph.
+
+        Only the run state deltas of the steps and the vertices they built are written, so each
+        write scales with the step rather than with the graph. The graph is stored in full if it
+        wasn't stored by `set_cache` in this run yet. Nothing is written when the cache keeps a
+        reference to the graph, as it already sees every change.
+        """
+        from langflow.graph.graph.serialization import dump_steps, get_steps_key
+
+        if self.stores_references:
+            return
+        run_state_log = graph.run_state_log
+        if not self._is_serializable_graph(graph) or run_state_log.steps_token is None:
+            await self.set_cache(key, graph)
+            return
+        deltas = run_state_log.deltas_since(run_state_log.persisted_states)
+        if not deltas:
+            return
+        steps = dump_steps(graph, deltas, run_state_log.steps_token)
+        await self._perform_cache_operation("upsert", get_steps_key(key, run_state_log.steps_written + 1), steps)
+        run_state_log.steps_written += 1
+        run_state_log.persisted_states = len(run_state_log)
+
+    async def _deserialize_graph(self, key: str, serialized: "SerializedGraph") -> Optional["Graph"]:
+        """
+        Rebuilds a graph stored by `_serialize_graph` and applies the steps stored since by `set_cache_steps`.
+
+        Returns None if the structure of the graph is gone.
+        """
+        from langflow.graph.graph.serialization import (
+            get_structure_key,
+            has_template,
+            load_graph,
+            load_steps,
+        )
+
+        structure = None
+        if not has_template(serialized.version):
+            structure = await self._perform_cache_operation("get", get_structure_key(serialized.version))
+            if not isinstance(structure, bytes):
+                logger.warning(f"The structure of flow version {serialized.version} is not in the cache")
+                return None
+        try:
+            graph = load_graph(serialized, structure)
+            if serialized.steps_token is not None:
+                # Steps left by earlier writes under the same key have another token and end the loop
+                for steps in await self._get_steps(key):
+                    if not load_steps(graph, steps, serialized.steps_token):
+                        break
+        except ValueError as exc:
+            logger.warning(f"Could not load the cached graph: {exc}")
+            return None
+        return graph
+
+    async def _get_steps(self, key: str) -> list[bytes]:
+        """
+        Fetches the batches of steps stored under `key` by `set_cache_steps`, in the order they were written.
+
+        The keys are fetched with `get_many`, doubling the number of keys of each round trip, until one is missing.
+        """
+        from langflow.graph.graph.serialization import get_steps_key
+
+        steps: list[bytes] = []
+        batch_size = STEPS_BATCH_SIZE
+        while True:
+            first = len(steps) + 1
+            keys = [get_steps_key(key, index) for index in range(first, first + batch_size)]
+            if isinstance(self.cache_service, AsyncBaseCacheService):
+                values = await self.cache_service.get_many(keys)
+            else:
+                values = [self.cache_service.get(steps_key) for steps_key in keys]
+            for value in values:
+                if not isinstance(value, bytes):
+                    return steps
+                steps.append(value)
+            batch_size *= 2
+
     async def get_cache(self, key: str, lock: Optional[asyncio.Lock] = None) -> Any:
         """
         Get the cache for a client.
@@ -100,7 +241,15 @@ class ChatService(Service):
         Returns:
             Any: The cached data.
         """
-        return await self._perform_cache_operation("get", key, lock=lock or self._get_lock(key))
+        from langflow.graph.graph.serialization import SerializedGraph
+
+        result = await self._perform_cache_operation("get", key, lock=lock or self._get_lock(key))
+        if isinstance(result, dict) and isinstance(result.get("result"), SerializedGraph):
+            graph = await self._deserialize_graph(key, result["result"])
+            if graph is None:
+                return CACHE_MISS
+            result = {**result, "result": graph}
+        return result
 
     async def clear_cache(self, key: str, lock: Optional[asyncio.Lock] = None):
         """
@@ -110,4 +259,16 @@ class ChatService(Service):
             key (str): The cache key.
             lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
         """
+        from langflow.graph.graph.serialization import get_steps_key
+
         await self._perform_cache_operation("delete", key, lock=lock or self._get_lock(key))
+        if self.stores_references:
+            return
+        # The steps of the cached graph are of no use without it
+        if steps_count := len(await self._get_steps(key)):
+            keys = [get_steps_key(key, index) for index in range(1, steps_count + 1)]
+            if isinstance(self.cache_service, AsyncBaseCacheService):
+                await self.cache_service.delete_many(keys)
+            else:
+                for steps_key in keys:
+                    self.cache_service.delete(steps_key)
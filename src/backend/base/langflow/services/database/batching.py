@@ -0,0 +1,104 @@
+import queue
+import threading
+import time
+from typing import Any, Generic, Optional, TypeVar
+
+from loguru import logger
+
+ItemT = TypeVar("ItemT")
+
+
+class BatchWriter(Generic[ItemT]):
+    """
+    Writes items to the database from a background thread, in batches.
+
+    Items submitted concurrently are coalesced: the writer waits up to `interval` seconds for more items
+    after the first one, and hands up to `batch_size` of them to `_write` at once. With a `max_queue_size`,
+    items submitted while the queue is full are dropped and counted instead of making the caller wait.
+    """
+
+    name = "batch-writer"
+
+    def __init__(self, batch_size: int = 100, interval: float = 0.05, max_queue_size: int = 0):
+        self.batch_size = batch_size
+        self.interval = interval
+        self.max_queue_size = max_queue_size
+        self.written = 0
+        self.dropped = 0
+        self._queue: queue.Queue[Optional[ItemT]] = queue.Queue(maxsize=max_queue_size)
+        self._counters_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def submit(self, items: list[ItemT]) -> int:
+        """
+        Queues the items to be written and returns how many were accepted.
+
+        Raises:
+            RuntimeError: If the writer is stopped.
+        """
+        if not self._thread.is_alive():
+            raise RuntimeError(f"The {self.name} is stopped.")
+        accepted = 0
+        for item in items:
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                break
+            accepted += 1
+        if dropped := len(items) - accepted:
+            with self._counters_lock:
+                self.dropped += dropped
+                total = self.dropped
+            # Once per thousand, a full queue would otherwise flood the logs too
+            if total // 1000 != (total - dropped) // 1000 or total == dropped:
+                logger.warning(f"The {self.name} queue is full, {total} items were dropped so far.")
+        return accepted
+
+    def flush(self):
+        """Blocks until every submitted item has been written."""
+        if self._thread.is_alive():
+            self._queue.join()
+
+    def stop(self):
+        """Writes the pending items and stops the thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def stats(self) -> dict[str, Any]:
+        with self._counters_lock:
+            return {"queued": self._queue.qsize(), "written": self.written, "dropped": self.dropped}
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            batch = [item]
+            stopping = False
+            deadline = time.monotonic() + self.interval
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            try:
+                self._write(batch)
+                with self._counters_lock:
+                    self.written += len(batch)
+            except Exception as exc:
+                logger.error(f"The {self.name} could not write {len(batch)} items to the database: {exc}")
+            finally:
+                for _ in range(len(batch) + stopping):
+                    self._queue.task_done()
+            if stopping:
+                return
+
+    def _write(self, batch: list[ItemT]):
+        raise NotImplementedError
@@ -4,10 +4,16 @@ import threading
 from typing import List, Optional
 from uuid import UUID
 
+from loguru import logger
+from sqlalchemy import bindparam
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel.sql.expression import SelectOfScalar
 
+from langflow.services.auth.cache import get_api_key_cache
 from langflow.services.database.models.api_key import ApiKey, ApiKeyCreate, ApiKeyRead, UnmaskedApiKeyRead
+from langflow.services.deps import get_settings_service, session_scope
 
 
 def get_api_keys(session: Session, user_id: UUID) -> List[ApiKeyRead]:
@@ -41,6 +47,8 @@ def delete_api_key(session: Session, api_key_id: UUID) -> None:
         raise ValueError("API Key not found")
     session.delete(api_key)
     session.commit()
+    if (cache := get_api_key_cache()) is not None:
+        cache.invalidate(api_key.api_key)
 
 
 def check_key(session: Session, api_key: str) -> Optional[ApiKey]:
@@ -48,27 +56,106 @@ def check_key(session: Session, api_key: str) -> Optional[ApiKey]:
     query: SelectOfScalar = select(ApiKey).where(ApiKey.api_key == api_key)
     api_key_object: Optional[ApiKey] = session.exec(query).first()
     if api_key_object is not None:
-        threading.Thread(
-            target=update_total_uses,
-            args=(
-                session,
-                api_key_object,
-            ),
-        ).start()
+        get_api_key_usage_counter().record(api_key_object.id)
     return api_key_object
 
 
-def update_total_uses(session, api_key: ApiKey):
-    """Update the total uses and last used at."""
-    # This is running in a separate thread to avoid slowing down the request
-    # but session is not thread safe so we need to create a new session
-
-    with Session(session.get_bind()) as new_session:
-        new_api_key = new_session.get(ApiKey, api_key.id)
-        if new_api_key is None:
-            raise ValueError("API Key not found")
-        new_api_key.total_uses += 1
-        new_api_key.last_used_at = datetime.datetime.now(datetime.timezone.utc)
-        new_session.add(new_api_key)
-        new_session.commit()
-    return new_api_key
+async def acheck_key(session: AsyncSession, api_key: str) -> Optional[ApiKey]:
+    """Check if the API key is valid, loading its user with it."""
+    query: SelectOfScalar = select(ApiKey).where(ApiKey.api_key == api_key).options(selectinload(ApiKey.user))  # type: ignore
+    api_key_object: Optional[ApiKey] = (await session.exec(query)).first()
+    if api_key_object is not None:
+        get_api_key_usage_counter().record(api_key_object.id)
+    return api_key_object
+
+
+def update_total_uses(session: Session, uses: dict[UUID, tuple[int, datetime.datetime]]):
+    """Adds the uses of each API key to its total and sets when it was last used, in one UPDATE."""
+    table = ApiKey.__table__  # type: ignore
+    stmt = (
+        table.update()
+        .where(table.c.id == bindparam("api_key_id"))
+        .values(total_uses=table.c.total_uses + bindparam("uses"), last_used_at=bindparam("used_at"))
+    )
+    params = [
+        {"api_key_id": api_key_id, "uses": count, "used_at": used_at} for api_key_id, (count, used_at) in uses.items()
+    ]
+    session.connection().execute(stmt, params)
+    session.commit()
+
+
+class ApiKeyUsageCounter:
+    """
+    Counts the uses of API keys in memory and adds them to the database every `interval` seconds.
+
+    Counting a use doesn't touch the database, so authenticating with an API key costs at most
+    the lookup of the key. Uses that could not be written are kept for the next flush.
+    """
+
+    def __init__(self, interval: float = 5.0):
+        self.interval = interval
+        self._uses: dict[UUID, tuple[int, datetime.datetime]] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="api key usage counter", daemon=True)
+        self._thread.start()
+
+    def record(self, api_key_id: UUID):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        with self._lock:
+            count, _ = self._uses.get(api_key_id, (0, now))
+            self._uses[api_key_id] = (count + 1, now)
+
+    def flush(self):
+        """Writes the uses counted since the last flush."""
+        with self._lock:
+            uses, self._uses = self._uses, {}
+        if not uses:
+            return
+        try:
+            with session_scope() as session:
+                update_total_uses(session, uses)
+        except Exception as exc:
+            logger.error(f"Error updating the uses of {len(uses)} API keys: {exc}")
+            with self._lock:
+                for api_key_id, (count, used_at) in uses.items():
+                    newer_count, newer_used_at = self._uses.get(api_key_id, (0, used_at))
+                    self._uses[api_key_id] = (count + newer_count, max(used_at, newer_used_at))
+
+    def stop(self):
+        """Writes the counted uses and stops the thread."""
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self.flush()
+        self.flush()
+
+
+_usage_counter: ApiKeyUsageCounter | None = None
+_usage_counter_lock = threading.Lock()
+
+
+def get_api_key_usage_counter() -> ApiKeyUsageCounter:
+    global _usage_counter
+    with _usage_counter_lock:
+        if _usage_counter is None:
+            interval = get_settings_service().settings.api_key_usage_flush_interval
+            _usage_counter = ApiKeyUsageCounter(interval=interval)
+        return _usage_counter
+
+
+def flush_api_key_uses():
+    """Writes the counted uses of the API keys."""
+    if _usage_counter is not None:
+        _usage_counter.flush()
+
+
+def stop_api_key_usage_counter():
+    """Writes the counted uses and stops the counter. Called when the services are torn down."""
+    global _usage_counter
+    with _usage_counter_lock:
+        counter, _usage_counter = _usage_counter, None
+    if counter is not None:
+        counter.stop()
@@ -2,7 +2,7 @@ from typing import Optional
 
 from fastapi import Depends
 from langflow.utils.version import get_version_info
-from sqlmodel import Session
+from sqlmodel import Session, select
 from sqlalchemy import delete
 
 from langflow.services.deps import get_session
@@ -23,10 +23,20 @@ def get_flow_by_id(session: Session = Depends(get_session), flow_id: Optional[st
 
 def delete_flow_by_id(flow_id: str, session: Session) -> None:
     """Delete flow by id."""
+    from langflow.graph.utils import flush_logs
+    from langflow.memory import flush_messages, get_history_cache
+
+    # Logs and messages of the flow still queued would otherwise be written after it is deleted
+    flush_logs()
+    flush_messages()
+    session_ids = session.exec(select(MessageTable.session_id).where(MessageTable.flow_id == flow_id).distinct()).all()
     # Manually delete flow, transactions and messages because foreign key constraints might be disabled
     session.exec(delete(Flow).where(Flow.id == flow_id))  # type: ignore
     session.exec(delete(TransactionTable).where(TransactionTable.flow_id == flow_id))  #  type: ignore
     session.exec(delete(MessageTable).where(MessageTable.flow_id == flow_id))  #  type: ignore
+    if history_cache := get_history_cache():
+        for session_id in session_ids:
+            history_cache.invalidate(session_id)
     logger.info(f"Deleted flow {flow_id}")
 
 
@@ -1,9 +1,11 @@
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, List, Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from pydantic import field_validator
-from sqlmodel import JSON, Column, Field, Relationship, SQLModel
+from sqlmodel import JSON, Column, Field, Index, Relationship, SQLModel
+
+from langflow.services.database.pagination import time_ordered_uuid
 
 if TYPE_CHECKING:
     from langflow.schema.message import Message
@@ -49,11 +51,17 @@ class MessageBase(SQLModel):
 
 class MessageTable(MessageBase, table=True):  # type: ignore
     __tablename__ = "message"
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    # Time ordered, so messages stored in the same second page in the order they were stored
+    id: UUID = Field(default_factory=time_ordered_uuid, primary_key=True)
     flow_id: Optional[UUID] = Field(default=None, foreign_key="flow.id")
     flow: "Flow" = Relationship(back_populates="messages")
     files: List[str] = Field(sa_column=Column(JSON))
 
+    __table_args__ = (
+        Index("ix_message_session_id_timestamp_id", "session_id", "timestamp", "id"),
+        Index("ix_message_flow_id_session_id_timestamp_id", "flow_id", "session_id", "timestamp", "id"),
+    )
+
     @field_validator("flow_id", mode="before")
     @classmethod
     def validate_flow_id(cls, value):
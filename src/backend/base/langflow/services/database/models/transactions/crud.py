@@ -3,19 +3,28 @@ from uuid import UUID
 
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select, col
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.services.database.models.transactions.model import TransactionBase, TransactionTable
+from langflow.services.database.pagination import Cursor, paginate
 
 
-def get_transactions_by_flow_id(db: Session, flow_id: UUID, limit: Optional[int] = 1000) -> list[TransactionTable]:
-    stmt = (
-        select(TransactionTable)
-        .where(TransactionTable.flow_id == flow_id)
-        .order_by(col(TransactionTable.timestamp))
-        .limit(limit)
-    )
+def _select_transactions_by_flow_id(flow_id: UUID, limit: Optional[int], cursor: Optional[Cursor]):
+    stmt = select(TransactionTable).where(TransactionTable.flow_id == flow_id)
+    return paginate(stmt, col(TransactionTable.timestamp), col(TransactionTable.id), cursor=cursor, limit=limit)
 
-    transactions = db.exec(stmt)
+
+def get_transactions_by_flow_id(
+    db: Session, flow_id: UUID, limit: Optional[int] = 1000, cursor: Optional[Cursor] = None
+) -> list[TransactionTable]:
+    transactions = db.exec(_select_transactions_by_flow_id(flow_id, limit, cursor))
+    return [t for t in transactions]
+
+
+async def aget_transactions_by_flow_id(
+    db: AsyncSession, flow_id: UUID, limit: Optional[int] = 1000, cursor: Optional[Cursor] = None
+) -> list[TransactionTable]:
+    transactions = await db.exec(_select_transactions_by_flow_id(flow_id, limit, cursor))
     return [t for t in transactions]
 
 
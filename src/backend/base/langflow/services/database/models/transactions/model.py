@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
 
 from pydantic import field_validator
-from sqlmodel import JSON, Column, Field, Relationship, SQLModel
+from sqlmodel import JSON, Column, Field, Index, Relationship, SQLModel
 
 if TYPE_CHECKING:
     from langflow.services.database.models.flow.model import Flow
@@ -38,6 +38,8 @@ class TransactionTable(TransactionBase, table=True):  # type: ignore
     id: Optional[UUID] = Field(default_factory=uuid4, primary_key=True)
     flow: "Flow" = Relationship(back_populates="transactions")
 
+    __table_args__ = (Index("ix_transaction_flow_id_timestamp_id", "flow_id", "timestamp", "id"),)
+
 
 class TransactionReadResponse(TransactionBase):
     transaction_id: UUID
@@ -6,7 +6,9 @@ from fastapi import Depends, HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm.attributes import flag_modified
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from langflow.services.auth.cache import invalidate_user
 from langflow.services.database.models.user.model import User, UserUpdate
 from langflow.services.deps import get_session
 
@@ -19,6 +21,14 @@ def get_user_by_id(db: Session, id: UUID) -> Union[User, None]:
     return db.exec(select(User).where(User.id == id)).first()
 
 
+async def aget_user_by_username(db: AsyncSession, username: str) -> Union[User, None]:
+    return (await db.exec(select(User).where(User.username == username))).first()
+
+
+async def aget_user_by_id(db: AsyncSession, id: UUID) -> Union[User, None]:
+    return (await db.exec(select(User).where(User.id == id))).first()
+
+
 def update_user(user_db: Optional[User], user: UserUpdate, db: Session = Depends(get_session)) -> User:
     if not user_db:
         raise HTTPException(status_code=404, detail="User not found")
@@ -45,6 +55,7 @@ def update_user(user_db: Optional[User], user: UserUpdate, db: Session = Depends
     except IntegrityError as e:
         db.rollback()
         raise HTTPException(status_code=400, detail=str(e)) from e
+    invalidate_user(user_db.id)
 
     return user_db
 
@@ -3,19 +3,28 @@ from uuid import UUID
 
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, col, delete, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
+from langflow.services.database.pagination import Cursor, paginate
 
 
-def get_vertex_builds_by_flow_id(db: Session, flow_id: UUID, limit: Optional[int] = 1000) -> list[VertexBuildTable]:
-    stmt = (
-        select(VertexBuildTable)
-        .where(VertexBuildTable.flow_id == flow_id)
-        .order_by(col(VertexBuildTable.timestamp))
-        .limit(limit)
-    )
+def _select_vertex_builds_by_flow_id(flow_id: UUID, limit: Optional[int], cursor: Optional[Cursor]):
+    stmt = select(VertexBuildTable).where(VertexBuildTable.flow_id == flow_id)
+    return paginate(stmt, col(VertexBuildTable.timestamp), col(VertexBuildTable.build_id), cursor=cursor, limit=limit)
 
-    builds = db.exec(stmt)
+
+def get_vertex_builds_by_flow_id(
+    db: Session, flow_id: UUID, limit: Optional[int] = 1000, cursor: Optional[Cursor] = None
+) -> list[VertexBuildTable]:
+    builds = db.exec(_select_vertex_builds_by_flow_id(flow_id, limit, cursor))
+    return [t for t in builds]
+
+
+async def aget_vertex_builds_by_flow_id(
+    db: AsyncSession, flow_id: UUID, limit: Optional[int] = 1000, cursor: Optional[Cursor] = None
+) -> list[VertexBuildTable]:
+    builds = await db.exec(_select_vertex_builds_by_flow_id(flow_id, limit, cursor))
     return [t for t in builds]
 
 
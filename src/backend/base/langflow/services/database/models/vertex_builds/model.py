@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING, Optional
 from uuid import UUID, uuid4
 
 from pydantic import field_serializer, field_validator, BaseModel
-from sqlmodel import JSON, Column, Field, Relationship, SQLModel
+from sqlmodel import JSON, Column, Field, Index, Relationship, SQLModel
 
 
 if TYPE_CHECKING:
@@ -45,6 +45,8 @@ class VertexBuildTable(VertexBuildBase, table=True):  # type: ignore
     build_id: Optional[UUID] = Field(default_factory=uuid4, primary_key=True)
     flow: "Flow" = Relationship(back_populates="vertex_builds")
 
+    __table_args__ = (Index("ix_vertex_build_flow_id_timestamp_build_id", "flow_id", "timestamp", "build_id"),)
+
 
 class VertexBuildMapModel(BaseModel):
     vertex_builds: dict[str, list[VertexBuildTable]]
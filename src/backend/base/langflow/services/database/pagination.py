@@ -0,0 +1,107 @@
+import base64
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Optional, Sequence
+from uuid import UUID
+
+import orjson
+from sqlalchemy import ColumnElement, and_, or_
+from sqlmodel.sql.expression import SelectOfScalar
+
+
+_uuid_lock = threading.Lock()
+_last_uuid_ms = 0
+_last_uuid_random = 0
+
+
+def time_ordered_uuid() -> UUID:
+    """
+    Returns a version 7 UUID, which starts with the time in milliseconds.
+
+    The UUIDs made by a process sort in the order they were made, so rows stored at the same
+    timestamp page in the order they were created when their ids break the tie.
+    """
+    global _last_uuid_ms, _last_uuid_random
+    with _uuid_lock:
+        ms = time.time_ns() // 1_000_000
+        # 74 random bits, incremented instead within the same millisecond to keep the order
+        random = int.from_bytes(os.urandom(10), "big") >> 6
+        if ms <= _last_uuid_ms:
+            ms, random = _last_uuid_ms, _last_uuid_random + 1
+            if random >> 74:
+                ms, random = ms + 1, 0
+        _last_uuid_ms, _last_uuid_random = ms, random
+    return UUID(int=ms << 80 | 0x7 << 76 | (random >> 62) << 64 | 0b10 << 62 | random & ((1 << 62) - 1))
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """
+    Position after the last row of a page ordered by timestamp.
+
+    Timestamps are not unique, so rows are ordered by timestamp and then id, and the cursor holds
+    both for the last row of the page. Rows stored at the same time come in the order of their ids,
+    which is the order they were created in for ids from `time_ordered_uuid`.
+    """
+
+    timestamp: datetime
+    id: UUID
+
+    def encode(self) -> str:
+        data = orjson.dumps({"timestamp": self.timestamp.isoformat(), "id": str(self.id)})
+        return base64.urlsafe_b64encode(data).decode()
+
+    @classmethod
+    def decode(cls, value: str) -> "Cursor":
+        """
+        Raises:
+            ValueError: If the value isn't a cursor returned by `encode`.
+        """
+        try:
+            data = orjson.loads(base64.urlsafe_b64decode(value.encode()))
+            return cls(timestamp=datetime.fromisoformat(data["timestamp"]), id=UUID(data["id"]))
+        except Exception as exc:
+            raise ValueError(f"Invalid cursor: {value}") from exc
+
+
+def paginate(
+    stmt: SelectOfScalar,
+    timestamp_column: ColumnElement,
+    id_column: ColumnElement,
+    cursor: Optional[Cursor] = None,
+    limit: Optional[int] = None,
+    descending: bool = False,
+) -> SelectOfScalar:
+    """Orders the statement by the timestamp and id columns and selects the page after the cursor."""
+    if descending:
+        stmt = stmt.order_by(timestamp_column.desc(), id_column.desc())
+    else:
+        stmt = stmt.order_by(timestamp_column.asc(), id_column.asc())
+    if cursor is not None:
+        if descending:
+            after = or_(
+                timestamp_column < cursor.timestamp, and_(timestamp_column == cursor.timestamp, id_column < cursor.id)
+            )
+        else:
+            after = or_(
+                timestamp_column > cursor.timestamp, and_(timestamp_column == cursor.timestamp, id_column > cursor.id)
+            )
+        stmt = stmt.where(after)
+    if limit:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def get_next_cursor(
+    rows: Sequence[Any],
+    get_timestamp: Callable[[Any], datetime],
+    get_id: Callable[[Any], UUID],
+    limit: Optional[int] = None,
+) -> Optional[Cursor]:
+    """Returns the cursor of the page after `rows`, or None if `rows` is the last page."""
+    if not limit or len(rows) < limit:
+        return None
+    return Cursor(timestamp=get_timestamp(rows[-1]), id=get_id(rows[-1]))
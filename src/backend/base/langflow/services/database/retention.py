@@ -0,0 +1,122 @@
+import asyncio
+import hashlib
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Optional
+
+from loguru import logger
+from sqlalchemy import String, cast, func
+from sqlmodel import col, delete, select
+
+from langflow.services.database.models.transactions.model import TransactionTable
+from langflow.services.database.models.vertex_builds.model import VertexBuildTable
+from langflow.services.deps import get_settings_service, session_scope
+
+if TYPE_CHECKING:
+    from langflow.services.settings.base import Settings
+
+# The log tables, with their primary key and the columns holding most of their size
+LOG_TABLES = {
+    TransactionTable: (TransactionTable.id, [TransactionTable.inputs, TransactionTable.outputs]),
+    VertexBuildTable: (
+        VertexBuildTable.build_id,
+        [VertexBuildTable.data, VertexBuildTable.artifacts, VertexBuildTable.params],
+    ),
+}
+# Number of most recent rows the average row size is estimated from
+SIZE_SAMPLE_ROWS = 100
+
+
+def compact_log_data(value: Any, storage: str, max_length: int) -> Any:
+    """
+    Shortens the texts of outputs stored in transactions and vertex builds, keeping their structure.
+
+    With `storage` 'truncated', texts longer than `max_length` are cut to that length. With 'hashed',
+    they are replaced by their SHA-256 hash, which still tells whether two outputs are the same.
+    """
+    if storage == "full":
+        return value
+    if isinstance(value, dict):
+        return {key: compact_log_data(item, storage, max_length) for key, item in value.items()}
+    if isinstance(value, list):
+        return [compact_log_data(item, storage, max_length) for item in value]
+    if isinstance(value, str) and len(value) > max_length:
+        if storage == "hashed":
+            return f"sha256:{hashlib.sha256(value.encode()).hexdigest()}"
+        return value[:max_length]
+    return value
+
+
+def _delete_in_batches(table, id_column, stmt, batch_size: int) -> int:
+    """Deletes the rows whose ids `stmt` selects, `batch_size` rows per transaction, so locks are held briefly."""
+    deleted = 0
+    while True:
+        with session_scope() as session:
+            ids = session.exec(stmt.limit(batch_size)).all()
+            if not ids:
+                return deleted
+            session.exec(delete(table).where(col(id_column).in_(ids)))  # type: ignore
+        deleted += len(ids)
+
+
+def _delete_beyond(table, id_column, keep: int, batch_size: int, flow_id=None) -> int:
+    """Deletes all but the `keep` most recent rows, of a flow if one is given."""
+    stmt = select(id_column)
+    if flow_id is not None:
+        stmt = stmt.where(table.flow_id == flow_id)
+    # The oldest rows are right after the kept ones, so each batch starts at the same offset
+    return _delete_in_batches(table, id_column, stmt.order_by(col(table.timestamp).desc()).offset(keep), batch_size)
+
+
+def _estimate_row_size(table, size_columns) -> Optional[float]:
+    size = sum(func.coalesce(func.length(cast(column, String)), 0) for column in size_columns)
+    sample = select(size.label("size")).order_by(col(table.timestamp).desc()).limit(SIZE_SAMPLE_ROWS).subquery()
+    with session_scope() as session:
+        return session.exec(select(func.avg(sample.c.size))).one()
+
+
+def enforce_log_retention(settings: "Settings") -> dict[str, int]:
+    """
+    Deletes the transactions and vertex builds beyond the retention limits of the settings.
+
+    Returns:
+        dict[str, int]: The number of deleted rows by table name.
+    """
+    batch_size = settings.logs_retention_batch_size
+    deleted: dict[str, int] = {}
+    for table, (id_column, size_columns) in LOG_TABLES.items():
+        count = 0
+        if settings.logs_retention_max_age is not None:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=settings.logs_retention_max_age)
+            stmt = select(id_column).where(table.timestamp < cutoff)
+            count += _delete_in_batches(table, id_column, stmt, batch_size)
+
+        if settings.logs_retention_max_rows_per_flow is not None:
+            keep = settings.logs_retention_max_rows_per_flow
+            with session_scope() as session:
+                flow_ids = session.exec(select(table.flow_id).group_by(table.flow_id).having(func.count() > keep)).all()
+            for flow_id in flow_ids:
+                count += _delete_beyond(table, id_column, keep, batch_size, flow_id=flow_id)
+
+        if settings.logs_retention_max_bytes is not None:
+            row_size = _estimate_row_size(table, size_columns)
+            if row_size:
+                keep = int(settings.logs_retention_max_bytes // row_size)
+                count += _delete_beyond(table, id_column, keep, batch_size)
+
+        deleted[table.__tablename__] = count
+    return deleted
+
+
+async def run_log_retention():
+    """Enforces the log retention limits every `logs_retention_interval` seconds, until cancelled."""
+    settings = get_settings_service().settings
+    if not settings.logs_retention_interval:
+        return
+    while True:
+        await asyncio.sleep(settings.logs_retention_interval)
+        try:
+            deleted = await asyncio.to_thread(enforce_log_retention, settings)
+            if any(deleted.values()):
+                logger.info(f"Deleted logs beyond the retention limits: {deleted}")
+        except Exception as exc:
+            logger.error(f"Error enforcing the log retention: {exc}")
@@ -1,7 +1,8 @@
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Type
+from typing import TYPE_CHECKING, Optional, Type, Union
 
 import sqlalchemy as sa
 from alembic import command, util
@@ -10,11 +11,14 @@ from loguru import logger
 from sqlalchemy import event, inspect
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import Session, SQLModel, create_engine, select, text
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.services.base import Service
 from langflow.services.database import models  # noqa
 from langflow.services.database.models.user.crud import get_user_by_username
+from langflow.services.database.threaded_session import ThreadedSession
 from langflow.services.database.utils import (
     Result,
     TableResults,
@@ -44,18 +48,24 @@ class DatabaseService(Service):
         self.script_location = langflow_dir / "alembic"
         self.alembic_cfg_path = langflow_dir / "alembic.ini"
         self.engine = self._create_engine()
+        # Created on first use, as the async driver of the database may not be installed
+        self._async_engine: Optional[AsyncEngine] = None
+        self._async_engine_lock = threading.Lock()
+        self._async_driver_missing = False
 
-    def _create_engine(self) -> "Engine":
-        """Create the engine for the database."""
+    def _get_connect_args(self) -> dict:
         if self.settings_service.settings.database_url and self.settings_service.settings.database_url.startswith(
             "sqlite"
         ):
-            connect_args = {
+            return {
                 "check_same_thread": False,
                 "timeout": self.settings_service.settings.db_connect_timeout,
             }
-        else:
-            connect_args = {}
+        return {}
+
+    def _create_engine(self) -> "Engine":
+        """Create the engine for the database."""
+        connect_args = self._get_connect_args()
         try:
             # register the event listener for sqlite as part of this class.
             # Using decorator will make the method not able to use self
@@ -77,10 +87,51 @@ class DatabaseService(Service):
                 return self._create_engine()
             raise RuntimeError("Error creating database engine") from exc
 
+    def _create_async_engine(self) -> AsyncEngine:
+        """
+        Create the engine for the endpoints that query the database without blocking the event loop.
+
+        It uses the async driver of the database of `database_url`: aiosqlite for SQLite and psycopg for
+        PostgreSQL. Its pool has the same `pool_size` and `max_overflow` as the sync engine.
+        """
+        url = sa.engine.make_url(self.database_url)
+        backend = url.get_backend_name()
+        if backend == "sqlite":
+            url = url.set(drivername="sqlite+aiosqlite")
+        elif backend == "postgresql" and url.get_driver_name() in ("psycopg2", "pg8000"):
+            url = url.set(drivername="postgresql+psycopg")
+        pool_args = {}
+        if url.database not in (None, "", ":memory:"):
+            # In-memory SQLite databases use a single connection, without a pool to size
+            pool_args = {
+                "pool_size": self.settings_service.settings.pool_size,
+                "max_overflow": self.settings_service.settings.max_overflow,
+            }
+        try:
+            return create_async_engine(url, connect_args=self._get_connect_args(), **pool_args)
+        except (ImportError, sa.exc.NoSuchModuleError, sa.exc.InvalidRequestError) as exc:
+            raise RuntimeError(
+                f"Error creating the async database engine, install an async driver for {backend}"
+            ) from exc
+
+    @property
+    def async_engine(self) -> Optional[AsyncEngine]:
+        """The async engine, or None if no async driver is installed for the database."""
+        with self._async_engine_lock:
+            if self._async_engine is None and not self._async_driver_missing:
+                try:
+                    self._async_engine = self._create_async_engine()
+                except RuntimeError as exc:
+                    logger.warning(f"{exc}. Async sessions will run their queries on the sync engine in a thread.")
+                    self._async_driver_missing = True
+            return self._async_engine
+
     def on_connection(self, dbapi_connection, connection_record):
         from sqlite3 import Connection as sqliteConnection
 
-        if isinstance(dbapi_connection, sqliteConnection):
+        from sqlalchemy.dialects.sqlite.aiosqlite import AsyncAdapt_aiosqlite_connection
+
+        if isinstance(dbapi_connection, (sqliteConnection, AsyncAdapt_aiosqlite_connection)):
             pragmas: Optional[dict] = self.settings_service.settings.sqlite_pragmas
             pragmas_list = []
             for key, val in pragmas.items() or {}:
@@ -113,6 +164,17 @@ class DatabaseService(Service):
         with Session(self.engine) as session:
             yield session
 
+    def create_async_session(self) -> Union[AsyncSession, ThreadedSession]:
+        # Loaded attributes stay readable after a commit, as lazy loads are not possible with async sessions
+        async_engine = self.async_engine
+        if async_engine is None:
+            return ThreadedSession(Session(self.engine, expire_on_commit=False))
+        return AsyncSession(async_engine, expire_on_commit=False)
+
+    async def get_async_session(self):
+        async with self.create_async_session() as session:
+            yield session
+
     def migrate_flows_if_auto_login(self):
         # if auto_login is enabled, we need to migrate the flows
         # to the default superuser if they don't have a user id
@@ -329,4 +391,5 @@ class DatabaseService(Service):
             logger.error(f"Error tearing down database: {exc}")
 
         self.engine.dispose()
-        self.engine.dispose()
+        if self._async_engine is not None:
+            await self._async_engine.dispose()
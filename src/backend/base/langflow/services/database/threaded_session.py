@@ -0,0 +1,52 @@
+import asyncio
+from typing import Any
+
+from sqlmodel import Session
+
+
+class ThreadedSession:
+    """
+    The async session used when no async driver is installed for the database.
+
+    It has the awaitable methods of `AsyncSession` that langflow uses, and runs them on a sync session in a
+    worker thread, so the queries don't block the event loop. Other attributes are those of the sync session.
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+    async def exec(self, *args, **kwargs):
+        return await asyncio.to_thread(self._session.exec, *args, **kwargs)
+
+    async def execute(self, *args, **kwargs):
+        return await asyncio.to_thread(self._session.execute, *args, **kwargs)
+
+    async def get(self, *args, **kwargs):
+        return await asyncio.to_thread(self._session.get, *args, **kwargs)
+
+    async def refresh(self, *args, **kwargs):
+        await asyncio.to_thread(self._session.refresh, *args, **kwargs)
+
+    async def delete(self, instance: Any):
+        await asyncio.to_thread(self._session.delete, instance)
+
+    async def flush(self):
+        await asyncio.to_thread(self._session.flush)
+
+    async def commit(self):
+        await asyncio.to_thread(self._session.commit)
+
+    async def rollback(self):
+        await asyncio.to_thread(self._session.rollback)
+
+    async def close(self):
+        await asyncio.to_thread(self._session.close)
+
+    async def __aenter__(self) -> "ThreadedSession":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
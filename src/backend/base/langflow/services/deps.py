@@ -1,10 +1,11 @@
-from contextlib import contextmanager
-from typing import TYPE_CHECKING, Generator
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, AsyncGenerator, Generator
 
 from langflow.services.schema import ServiceType
 
 if TYPE_CHECKING:
     from sqlmodel import Session
+    from sqlmodel.ext.asyncio.session import AsyncSession
 
     from langflow.services.cache.service import CacheService
     from langflow.services.chat.service import ChatService
@@ -205,6 +206,39 @@ def get_cache_service() -> "CacheService":
     return get_service(ServiceType.CACHE_SERVICE, CacheServiceFactory())  # type: ignore
 
 
+async def get_async_session() -> AsyncGenerator["AsyncSession", None]:
+    """
+    Retrieves an async session from the database service.
+
+    Queries made with it don't block the event loop, which makes it the session of choice for async endpoints.
+
+    Yields:
+        AsyncSession: An async session object.
+
+    """
+    db_service = get_db_service()
+    async with db_service.create_async_session() as session:
+        yield session
+
+
+@asynccontextmanager
+async def async_session_scope() -> AsyncGenerator["AsyncSession", None]:
+    """
+    Async context manager for managing a session scope, like `session_scope`.
+
+    Yields:
+        AsyncSession: The async session object.
+
+    """
+    async with get_db_service().create_async_session() as session:
+        try:
+            yield session
+            await session.commit()
+        except:
+            await session.rollback()
+            raise
+
+
 def get_session_service() -> "SessionService":
     """
     Retrieves the session service from the service manager.
@@ -51,6 +51,9 @@ class ServiceManager:
         """
         Get (or create) a service by its name.
         """
+        # Services are only created once, so the lock is only needed until then
+        if (service := self.services.get(service_name)) is not None:
+            return service
 
         with self.keyed_lock.lock(service_name):
             if service_name not in self.services:
@@ -77,9 +80,10 @@ class ServiceManager:
         # Collect the dependent services
         dependent_services = {dep.value: self.services[dep] for dep in factory.dependencies}
 
-        # Create the actual service
-        self.services[service_name] = self.factories[service_name].create(**dependent_services)
-        self.services[service_name].set_ready()
+        # Create the actual service. It is only added once ready, as `get` returns added services without locking.
+        service = self.factories[service_name].create(**dependent_services)
+        service.set_ready()
+        self.services[service_name] = service
 
     def _validate_service_creation(self, service_name: "ServiceType", default: Optional["ServiceFactory"] = None):
         """
@@ -256,3 +256,16 @@ class VertexBuildMapModel(BaseModel):
                 vertex_build_map[vertex_build.id] = []
             vertex_build_map[vertex_build.id].append(vertex_build)
         return cls(vertex_builds=vertex_build_map)
+
+
+class CacheStatsResponse(BaseModel):
+    cache_type: str
+    entries: int | None = None
+    bytes: int | None = None
+    max_size: int | None = None
+    max_bytes: int | None = None
+    hits: int | None = None
+    misses: int | None = None
+    evictions: int | None = None
+    expirations: int | None = None
+    invalidations: int | None = None
@@ -12,8 +12,14 @@ class SessionService(Service):
         self.cache_service: "CacheService" = cache_service
 
     async def load_session(self, key, flow_id: str, data_graph: Optional[dict] = None):
+        from langflow.services.cache.base import AsyncBaseCacheService
+
         # Check if the data is cached
-        if key in self.cache_service:
+        if isinstance(self.cache_service, AsyncBaseCacheService):
+            is_cached = await self.cache_service.contains(key)
+        else:
+            is_cached = key in self.cache_service
+        if is_cached:
             result = self.cache_service.get(key)
             if isinstance(result, Coroutine):
                 result = await result
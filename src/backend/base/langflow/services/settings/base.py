@@ -77,18 +77,75 @@ class Settings(BaseSettings):
     db_connect_timeout: int = 20
     """The number of seconds to wait before giving up on a lock to released or establishing a connection to the database."""
 
+    message_write_behind: bool = False
+    """If True, stored messages are written to the database by a background thread in batches, instead of
+    within the call that stores them. Pending messages are written before messages are read and on shutdown."""
+    message_write_batch_size: int = 100
+    """The maximum number of messages written to the database in one transaction by the background writer."""
+    message_write_interval: float = 0.05
+    """Seconds the background writer waits for more messages before writing a batch."""
+
+    message_history_cache_size: int = 1000
+    """The number of chat sessions whose most recent messages are kept in memory by each worker. 0 disables it."""
+    message_history_window: int = 200
+    """The number of most recent messages kept in memory per chat session."""
+    message_history_cache_ttl: int = 300
+    """Seconds before the cached messages of a session are reloaded, which is how long messages edited or
+    deleted by another worker can still be served."""
+    message_history_sync_interval: float = 1.0
+    """Seconds during which the cached messages of a session are served without checking the database for messages
+    stored by other workers. Messages stored by this worker are added to the cache when they are stored."""
+
     # sqlite configuration
     sqlite_pragmas: Optional[dict] = {"synchronous": "NORMAL", "journal_mode": "WAL"}
     """SQLite pragmas to use when connecting to the database."""
 
     # cache configuration
-    cache_type: Literal["async", "redis", "memory", "disk"] = "async"
-    """The cache type can be 'async' or 'redis'."""
+    cache_type: Literal["async", "redis", "memory", "disk", "tiered"] = "async"
+    """The cache type can be 'async', 'redis', 'memory', 'disk' or 'tiered'."""
     cache_expire: int = 3600
     """The cache expire in seconds."""
+    cache_max_bytes: Optional[int] = None
+    """Maximum estimated size in bytes of the 'async' and 'memory' caches. Least recently used items are evicted
+    beyond it. Unlimited when not set, which also skips estimating the size of every stored item."""
+    cache_sweep_interval: int = 60
+    """Seconds between sweeps removing expired items from the 'async' and 'memory' caches. 0 disables the sweeper."""
+    tiered_cache_l2: Literal["redis", "disk"] = "redis"
+    """The shared cache behind the in-process cache of the 'tiered' cache type. With 'redis', updates are also
+    propagated to the other workers through Redis pub/sub."""
+    tiered_cache_l1_max_size: Optional[int] = 100
+    """Maximum number of items kept in the in-process cache of the 'tiered' cache type."""
     variable_store: str = "db"
     """The store can be 'db' or 'kubernetes'."""
 
+    # graph execution
+    graph_scheduler: Literal["layered", "dataflow"] = "layered"
+    """How Graph.process schedules vertices. 'layered' waits for a whole layer to finish before starting the next one,
+    'dataflow' starts each vertex as soon as all of its predecessors are built."""
+    max_concurrent_vertices: int = 0
+    """Maximum number of vertices built at the same time across all flows in this process. 0 means no limit."""
+    max_concurrent_vertices_per_flow: int = 0
+    """Maximum number of vertices built at the same time within a single flow run. 0 means no limit."""
+    run_sync_outputs_in_thread: bool = False
+    """If True, the synchronous output methods of components run in a worker thread instead of blocking the event
+    loop. Components can also opt in, or out, with their `run_sync_outputs_in_thread` class attribute."""
+    component_class_cache_size: int = 256
+    """Number of component classes compiled from code to keep in memory. 0 disables the cache."""
+    prepared_graph_cache_size: int = 32
+    """Number of prepared graphs (per flow version and tweaks) kept in memory for the /run endpoints.
+    0 disables the cache."""
+    flow_cache_size: int = 100
+    """Number of flows kept in memory, with their parsed data, to resolve the /run and /webhook requests.
+    Each lookup still reads the `updated_at` of the flow, to reload it when it changed. 0 disables the cache."""
+    vertex_memoization: bool = False
+    """If set to True, a vertex whose code, params and upstream results did not change since a previous build
+    in the same flow and session reuses that build's result instead of being built again."""
+    vertex_memo_cache_size: int = 64 * 1024 * 1024
+    """Maximum size in bytes of the memoized vertex results kept in memory."""
+    sync_output_thread_pool_size: int = 32
+    """Number of threads used to run synchronous component output methods outside of the event loop.
+    0 runs them on the event loop."""
+
     prometheus_enabled: bool = False
     """If set to True, Langflow will expose Prometheus metrics."""
     prometheus_port: int = 9090
@@ -105,6 +162,8 @@ class Settings(BaseSettings):
     redis_db: int = 0
     redis_url: Optional[str] = None
     redis_cache_expire: int = 3600
+    redis_max_connections: Optional[int] = None
+    """Maximum number of connections in the Redis cache connection pool. Unlimited when not set."""
 
     # Sentry
     sentry_dsn: Optional[str] = None
@@ -153,6 +212,47 @@ class Settings(BaseSettings):
     """If set to True, Langflow will track transactions between flows."""
     vertex_builds_storage_enabled: bool = True
     """If set to True, Langflow will keep track of each vertex builds (outputs) in the UI for any flow."""
+    logs_ingest_batch_size: int = 500
+    """The maximum number of transactions and vertex builds written to the database in one transaction."""
+    logs_ingest_interval: float = 0.5
+    """Seconds the log writer waits for more transactions and vertex builds before writing a batch."""
+    logs_ingest_queue_size: int = 10000
+    """The number of transactions and vertex builds waiting to be written above which new ones are dropped."""
+    logs_outputs_storage: Literal["full", "truncated", "hashed"] = "full"
+    """How the outputs of transactions and vertex builds are stored. With 'truncated' or 'hashed', texts longer
+    than `logs_outputs_max_length` are cut to that length or replaced by their SHA-256 hash."""
+    logs_outputs_max_length: int = 1000
+    """The length above which texts in stored outputs are truncated or hashed."""
+    logs_retention_interval: int = 3600
+    """Seconds between runs of the job deleting transactions and vertex builds beyond the retention limits.
+    0 disables the job."""
+    logs_retention_max_age: Optional[int] = None
+    """Days after which transactions and vertex builds are deleted. Kept forever when not set."""
+    logs_retention_max_rows_per_flow: Optional[int] = None
+    """The number of most recent transactions, and of vertex builds, kept per flow. Unlimited when not set."""
+    logs_retention_max_bytes: Optional[int] = None
+    """Estimated size in bytes of the stored data above which the oldest transactions, and vertex builds, are
+    deleted. The size is estimated from the most recent rows. Unlimited when not set."""
+    logs_retention_batch_size: int = 1000
+    """The number of rows deleted per transaction by the retention job."""
+    api_key_cache_ttl: int = 30
+    """How many seconds an API key and its user are cached after being checked. Keys revoked through another
+    worker are accepted by this one for at most that long. 0 disables the cache."""
+    api_key_cache_size: int = 1000
+    """The maximum number of API keys cached."""
+    token_cache_ttl: int = 60
+    """How many seconds a verified access token and its user are cached, never beyond the expiry of the token.
+    Users changed through another worker are seen by this one after at most that long. 0 disables the cache."""
+    token_cache_size: int = 1000
+    """The maximum number of access tokens cached."""
+    variable_cache_ttl: int = 0
+    """How many seconds the decrypted variables of a user are kept in memory for the next runs. Each run loads
+    them at most once either way. Variables changed through another worker are seen by this one after at most
+    that long. 0 disables the cache."""
+    variable_cache_size: int = 1000
+    """The maximum number of users whose variables are cached."""
+    api_key_usage_flush_interval: float = 5.0
+    """How often, in seconds, the counted uses of the API keys are written to the database."""
 
     # Config
     auto_saving: bool = True
@@ -117,6 +117,19 @@ async def teardown_services():
         teardown_superuser(get_settings_service(), next(get_session()))
     except Exception as exc:
         logger.exception(exc)
+    try:
+        from langflow.graph.utils import stop_log_writer
+        from langflow.memory import stop_message_writer
+        from langflow.services.auth.cache import clear_authentication_caches
+        from langflow.services.database.models.api_key.crud import stop_api_key_usage_counter
+
+        # Before the services are torn down, as writing the messages, logs and uses needs the database service
+        stop_message_writer()
+        stop_log_writer()
+        stop_api_key_usage_counter()
+        clear_authentication_caches()
+    except Exception as exc:
+        logger.exception(exc)
     try:
         from langflow.services.manager import service_manager
 
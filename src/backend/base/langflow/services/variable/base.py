@@ -40,6 +40,19 @@ class VariableService(Service):
             The value of the variable.
         """
 
+    @abc.abstractmethod
+    def get_all_values(self, user_id: Union[UUID, str], session: Session) -> dict[str, tuple[str, str]]:
+        """
+        Get the values of all the variables of a user at once.
+
+        Args:
+            user_id: The user ID.
+            session: The database session.
+
+        Returns:
+            The type and decrypted value of each variable, by name.
+        """
+
     @abc.abstractmethod
     def list_variables(self, user_id: Union[UUID, str], session: Session) -> list[Optional[str]]:
         """
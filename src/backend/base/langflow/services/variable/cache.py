@@ -0,0 +1,109 @@
+import threading
+from typing import Union
+from uuid import UUID
+
+from cachetools import TTLCache
+
+from langflow.services.deps import get_settings_service, get_variable_service, session_scope
+from langflow.services.variable.constants import CREDENTIAL_TYPE
+
+# Type and value of each variable of a user, by name
+UserVariables = dict[str, tuple[str, str]]
+
+
+class UserVariablesCache:
+    """
+    The decrypted variables of the users who ran a flow in the last `ttl` seconds.
+
+    The variables of a user are dropped when one of them is created, updated or deleted through this process.
+    Changes made through another worker are seen by this one after at most `ttl` seconds.
+    """
+
+    def __init__(self, max_users: int = 1000, ttl: float = 5):
+        self._variables: TTLCache[str, UserVariables] = TTLCache(maxsize=max_users, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str) -> UserVariables | None:
+        with self._lock:
+            return self._variables.get(user_id)
+
+    def set(self, user_id: str, variables: UserVariables):
+        with self._lock:
+            self._variables[user_id] = variables
+
+    def invalidate(self, user_id: str):
+        with self._lock:
+            self._variables.pop(user_id, None)
+
+
+_user_variables_cache: UserVariablesCache | None = None
+_user_variables_cache_lock = threading.Lock()
+
+
+def get_user_variables_cache() -> UserVariablesCache | None:
+    """Returns the cache of variables by user, or None if `variable_cache_ttl` is 0."""
+    global _user_variables_cache
+    settings = get_settings_service().settings
+    if not settings.variable_cache_ttl:
+        return None
+    with _user_variables_cache_lock:
+        if _user_variables_cache is None:
+            _user_variables_cache = UserVariablesCache(
+                max_users=settings.variable_cache_size, ttl=settings.variable_cache_ttl
+            )
+        return _user_variables_cache
+
+
+def invalidate_user_variables(user_id: Union[UUID, str]):
+    """Drops the cached variables of a user whose variables changed."""
+    if _user_variables_cache is not None:
+        _user_variables_cache.invalidate(str(user_id))
+
+
+def load_user_variables(user_id: Union[UUID, str]) -> UserVariables:
+    """Returns the decrypted variables of a user, loading them all at once when they are not cached."""
+    cache = get_user_variables_cache()
+    if cache is not None and (variables := cache.get(str(user_id))) is not None:
+        return variables
+    with session_scope() as session:
+        variables = get_variable_service().get_all_values(user_id=user_id, session=session)
+    if cache is not None:
+        cache.set(str(user_id), variables)
+    return variables
+
+
+class RunVariables:
+    """
+    The variables used by a run, loaded on the first lookup and reused by every component of the run.
+
+    Without it, each field loaded from the database would query and decrypt its variable again.
+    """
+
+    def __init__(self):
+        self._variables: dict[str, UserVariables] = {}
+        self._lock = threading.Lock()
+
+    def get_variable(self, user_id: Union[UUID, str], name: str, field: str) -> str:
+        """
+        Returns the value of a variable like `VariableService.get_variable`.
+
+        Raises:
+            ValueError: If the user has no variable with that name.
+            TypeError: If a credential is used in a session ID field.
+        """
+        with self._lock:
+            variables = self._variables.get(str(user_id))
+            if variables is None:
+                variables = self._variables[str(user_id)] = load_user_variables(user_id)
+        if name not in variables or not variables[name][1]:
+            # `get_all_values` skips the variables it could not decrypt, so the variable is looked up
+            # on its own to raise the error that made it missing
+            with session_scope() as session:
+                return get_variable_service().get_variable(user_id=user_id, name=name, field=field, session=session)
+        _type, value = variables[name]
+        if _type == CREDENTIAL_TYPE and field == "session_id":
+            raise TypeError(
+                f"variable {name} of type 'Credential' cannot be used in a Session ID field "
+                "because its purpose is to prevent the exposure of values."
+            )
+        return value
@@ -0,0 +1,2 @@
+CREDENTIAL_TYPE = "Credential"
+GENERIC_TYPE = "Generic"
@@ -10,6 +10,7 @@ from langflow.services.base import Service
 from langflow.services.database.models.variable.model import Variable, VariableCreate
 from langflow.services.settings.service import SettingsService
 from langflow.services.variable.base import VariableService
+from langflow.services.variable.cache import invalidate_user_variables
 from langflow.services.variable.kubernetes_secrets import KubernetesSecretManager, encode_user_id
 from langflow.services.variable.service import CREDENTIAL_TYPE, GENERIC_TYPE
 
@@ -41,6 +42,7 @@ class KubernetesSecretService(VariableService, Service):
                     name=secret_name,
                     data=variables,
                 )
+                invalidate_user_variables(user_id)
             except Exception as e:
                 logger.error(f"Error creating {var} variable: {e}")
 
@@ -83,6 +85,25 @@ class KubernetesSecretService(VariableService, Service):
             )
         return value
 
+    def get_all_values(
+        self,
+        user_id: Union[UUID, str],
+        _session: Session,
+    ) -> dict[str, tuple[str, str]]:
+        variables = self.kubernetes_secrets.get_secret(name=encode_user_id(user_id))
+        if not variables:
+            return {}
+
+        values = {}
+        for key, value in variables.items():
+            if key.startswith(CREDENTIAL_TYPE + "_"):
+                name = key[len(CREDENTIAL_TYPE) + 1 :]
+                # As in resolve_variable, a generic variable with the same name takes precedence
+                values.setdefault(name, (CREDENTIAL_TYPE, value))
+            else:
+                values[key] = (GENERIC_TYPE, value)
+        return values
+
     def list_variables(
         self,
         user_id: Union[UUID, str],
@@ -109,13 +130,16 @@ class KubernetesSecretService(VariableService, Service):
     ):
         secret_name = encode_user_id(user_id)
         secret_key, _ = self.resolve_variable(secret_name, user_id, name)
-        return self.kubernetes_secrets.update_secret(name=secret_name, data={secret_key: value})
+        secret = self.kubernetes_secrets.update_secret(name=secret_name, data={secret_key: value})
+        invalidate_user_variables(user_id)
+        return secret
 
     def delete_variable(self, user_id: Union[UUID, str], name: str, _session: Session) -> None:
         secret_name = encode_user_id(user_id)
 
         secret_key, _ = self.resolve_variable(secret_name, user_id, name)
         self.kubernetes_secrets.delete_secret_key(name=secret_name, key=secret_key)
+        invalidate_user_variables(user_id)
         return
 
     def delete_variable_by_id(self, user_id: Union[UUID, str], variable_id: UUID | str, _session: Session) -> None:
@@ -138,6 +162,7 @@ class KubernetesSecretService(VariableService, Service):
             _type = GENERIC_TYPE
 
         self.kubernetes_secrets.upsert_secret(secret_name=secret_name, data={secret_key: value})
+        invalidate_user_variables(user_id)
 
         variable_base = VariableCreate(
             name=name,
@@ -12,13 +12,12 @@ from langflow.services.base import Service
 from langflow.services.database.models.variable.model import Variable, VariableCreate, VariableUpdate
 from langflow.services.deps import get_session
 from langflow.services.variable.base import VariableService
+from langflow.services.variable.cache import invalidate_user_variables
+from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
 
 if TYPE_CHECKING:
     from langflow.services.settings.service import SettingsService
 
-CREDENTIAL_TYPE = "Credential"
-GENERIC_TYPE = "Generic"
-
 
 class DatabaseVariableService(VariableService, Service):
     def __init__(self, settings_service: "SettingsService"):
@@ -46,6 +45,7 @@ class DatabaseVariableService(VariableService, Service):
                         found_variable.value = encrypted
                         session.add(found_variable)
                         session.commit()
+                        invalidate_user_variables(user_id)
                     else:
                         # Create it
                         try:
@@ -93,6 +93,21 @@ class DatabaseVariableService(VariableService, Service):
     def get_all(self, user_id: Union[UUID, str], session: Session = Depends(get_session)) -> list[Optional[Variable]]:
         return list(session.exec(select(Variable).where(Variable.user_id == user_id)).all())
 
+    def get_all_values(
+        self, user_id: Union[UUID, str], session: Session = Depends(get_session)
+    ) -> dict[str, tuple[str, str]]:
+        values = {}
+        for variable in self.get_all(user_id=user_id, session=session):
+            if not variable or not variable.value:
+                continue
+            try:
+                decrypted = auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
+            except Exception as e:
+                logger.error(f"Error decrypting {variable.name} variable: {e}")
+                continue
+            values[variable.name] = (variable.type or GENERIC_TYPE, decrypted)
+        return values
+
     def list_variables(self, user_id: Union[UUID, str], session: Session = Depends(get_session)) -> list[Optional[str]]:
         variables = self.get_all(user_id=user_id, session=session)
         return [variable.name for variable in variables if variable]
@@ -112,6 +127,7 @@ class DatabaseVariableService(VariableService, Service):
         session.add(variable)
         session.commit()
         session.refresh(variable)
+        invalidate_user_variables(user_id)
         return variable
 
     def update_variable_fields(
@@ -134,6 +150,7 @@ class DatabaseVariableService(VariableService, Service):
         session.add(db_variable)
         session.commit()
         session.refresh(db_variable)
+        invalidate_user_variables(user_id)
         return db_variable
 
     def delete_variable(
@@ -148,6 +165,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(f"{name} variable not found.")
         session.delete(variable)
         session.commit()
+        invalidate_user_variables(user_id)
 
     def delete_variable_by_id(self, user_id: Union[UUID, str], variable_id: UUID, session: Session):
         variable = session.exec(select(Variable).where(Variable.user_id == user_id, Variable.id == variable_id)).first()
@@ -155,6 +173,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(f"{variable_id} variable not found.")
         session.delete(variable)
         session.commit()
+        invalidate_user_variables(user_id)
 
     def create_variable(
         self,
@@ -175,4 +194,5 @@ class DatabaseVariableService(VariableService, Service):
         session.add(variable)
         session.commit()
         session.refresh(variable)
+        invalidate_user_variables(user_id)
         return variable
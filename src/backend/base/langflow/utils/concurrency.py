@@ -1,11 +1,51 @@
+import asyncio
+import contextvars
 import re
 import threading
-from contextlib import contextmanager
+import weakref
+from collections.abc import Callable, Hashable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from functools import partial
 from pathlib import Path
+from typing import Any, Generic, TypeVar
 from filelock import FileLock
 
 from platformdirs import user_cache_dir
 
+LockT = TypeVar("LockT")
+
+
+class WeakLockRegistry(Generic[LockT]):
+    """
+    Hands out one lock per key, keeping a lock only while something references it.
+
+    Callers hold on to the lock they got while they use it, so whoever holds or waits for a lock
+    gets the same one, and the locks of idle keys are garbage collected instead of piling up.
+
+    Example:
+
+        locks = WeakLockRegistry(asyncio.Lock)
+        async with locks[flow_id]:
+            ...
+    """
+
+    def __init__(self, lock_factory: Callable[[], LockT]):
+        self._lock_factory = lock_factory
+        self._locks: weakref.WeakValueDictionary[Hashable, LockT] = weakref.WeakValueDictionary()
+        self._guard = threading.Lock()
+
+    def __getitem__(self, key: Hashable) -> LockT:
+        with self._guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._lock_factory()
+                self._locks[key] = lock
+            return lock
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
 
 class KeyedMemoryLockManager:
     """
@@ -13,14 +53,10 @@ class KeyedMemoryLockManager:
     """
 
     def __init__(self):
-        self.locks = {}
-        self.global_lock = threading.Lock()
+        self.locks = WeakLockRegistry(threading.Lock)
 
     def _get_lock(self, key: str):
-        with self.global_lock:
-            if key not in self.locks:
-                self.locks[key] = threading.Lock()
-            return self.locks[key]
+        return self.locks[key]
 
     @contextmanager
     def lock(self, key: str):
@@ -32,6 +68,104 @@ class KeyedMemoryLockManager:
             lock.release()
 
 
+class AsyncConcurrencyLimiter:
+    """
+    Limits how many coroutines can be inside `acquire()` at the same time.
+
+    asyncio semaphores bind to the event loop they are first used in, so one
+    semaphore is kept per running loop. A limit of 0 (or less) disables limiting.
+    """
+
+    def __init__(self, limit: int = 0):
+        self.limit = limit
+        self._semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def set_limit(self, limit: int):
+        """Changes the limit. Coroutines already holding a slot keep it."""
+        if limit != self.limit:
+            self.limit = limit
+            self._semaphores = weakref.WeakKeyDictionary()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.limit)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    @asynccontextmanager
+    async def acquire(self):
+        if self.limit <= 0:
+            yield
+            return
+        async with self._get_semaphore():
+            yield
+
+
+T = TypeVar("T")
+
+_sync_executor: Executor | None = None
+_sync_executor_configured = False
+_sync_executor_lock = threading.Lock()
+
+
+def get_sync_executor() -> Executor | None:
+    """
+    Returns the executor used to run synchronous code outside of the event loop.
+
+    Unless one was set with `set_sync_executor`, a thread pool sized by the
+    `sync_output_thread_pool_size` setting is created on first use. A size of 0 returns None.
+    """
+    global _sync_executor, _sync_executor_configured
+    if _sync_executor_configured:
+        return _sync_executor
+    with _sync_executor_lock:
+        if not _sync_executor_configured:
+            from langflow.services.deps import get_settings_service
+
+            max_workers = get_settings_service().settings.sync_output_thread_pool_size
+            if max_workers > 0:
+                _sync_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="langflow-sync")
+            _sync_executor_configured = True
+    return _sync_executor
+
+
+def set_sync_executor(executor: Executor | None):
+    """Replaces the executor returned by `get_sync_executor`. None runs synchronous code on the event loop."""
+    global _sync_executor, _sync_executor_configured
+    with _sync_executor_lock:
+        _sync_executor = executor
+        _sync_executor_configured = True
+
+
+def shutdown_sync_executor():
+    """Shuts down the current executor. The next `get_sync_executor` call creates a new one from the settings."""
+    global _sync_executor, _sync_executor_configured
+    with _sync_executor_lock:
+        executor = _sync_executor
+        _sync_executor = None
+        _sync_executor_configured = False
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_sync_in_executor(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Runs `func` in the sync executor and waits for it without blocking the event loop.
+
+    Context variables are copied into the worker thread, so tracing and logging context is kept.
+    """
+    executor = get_sync_executor()
+    if executor is None:
+        return func(*args, **kwargs)
+    context = contextvars.copy_context()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(context.run, func, *args, **kwargs))
+
+
 class KeyedWorkerLockManager:
     """
     A manager for acquiring locks between workers based on a key
@@ -0,0 +1,64 @@
+import copy
+from collections.abc import Callable
+
+import pytest
+
+from langflow.graph import Graph
+from langflow.initial_setup.setup import load_starter_projects
+
+from .stub_component import StubComponent
+
+SYNTHETIC_GRAPH_SIZE = 1000
+
+
+@pytest.fixture(scope="session")
+def stub_node_and_edge() -> tuple[dict, dict]:
+    source = StubComponent(_id="Stub-source")
+    target = StubComponent(_id="Stub-target")
+    target.set(input_value=source.build_text)
+    data = Graph(source, target).dump()["data"]
+    return data["nodes"][0], data["edges"][0]
+
+
+@pytest.fixture(scope="session")
+def synthetic_payload(stub_node_and_edge) -> Callable[[int, int], dict]:
+    node, edge = stub_node_and_edge
+
+    def build_payload(size: int, fan_out: int) -> dict:
+        """Builds a tree of `size` stub vertices where every vertex has `fan_out` children, so 1 is a chain."""
+        nodes = []
+        edges = []
+        for index in range(size):
+            new_node = copy.deepcopy(node)
+            new_node["id"] = new_node["data"]["id"] = f"Stub-{index}"
+            nodes.append(new_node)
+            if index == 0:
+                continue
+            source_id, target_id = f"Stub-{(index - 1) // fan_out}", f"Stub-{index}"
+            new_edge = copy.deepcopy(edge)
+            new_edge["source"] = new_edge["data"]["sourceHandle"]["id"] = source_id
+            new_edge["target"] = new_edge["data"]["targetHandle"]["id"] = target_id
+            new_edge["id"] = f"{source_id}-{target_id}"
+            edges.append(new_edge)
+        return {"nodes": nodes, "edges": edges}
+
+    return build_payload
+
+
+STARTER_PROJECTS = {path.stem: project["data"] for path, project in load_starter_projects()}
+FLOWS = [*sorted(STARTER_PROJECTS), "synthetic-deep", "synthetic-wide"]
+
+
+@pytest.fixture(params=FLOWS)
+def flow_payload(request, synthetic_payload) -> dict:
+    """The data of a starter project, or of a synthetic chain (deep) or tree with 8 children per vertex (wide)."""
+    if request.param == "synthetic-deep":
+        return synthetic_payload(SYNTHETIC_GRAPH_SIZE, 1)
+    if request.param == "synthetic-wide":
+        return synthetic_payload(SYNTHETIC_GRAPH_SIZE, 8)
+    return copy.deepcopy(STARTER_PROJECTS[request.param])
+
+
+@pytest.fixture
+def flow_graph(flow_payload) -> Graph:
+    return Graph.from_payload(flow_payload)
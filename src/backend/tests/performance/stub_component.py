@@ -0,0 +1,14 @@
+from langflow.custom import Component
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+class StubComponent(Component):
+    display_name = "Stub"
+    description = "Passes its input through, so benchmarks measure the engine and not the component."
+
+    inputs = [MessageTextInput(name="input_value", display_name="Input")]
+    outputs = [Output(display_name="Text", name="text", method="build_text")]
+
+    def build_text(self) -> Message:
+        return Message(text=self.input_value)
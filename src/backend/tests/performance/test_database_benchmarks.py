@@ -0,0 +1,55 @@
+import asyncio
+import time
+
+import pytest
+
+from langflow.services.database.models.flow.model import Flow
+from langflow.services.deps import async_session_scope, session_scope
+
+# Lookups running at the same time, as concurrent requests would
+CONCURRENT_LOOKUPS = 50
+
+
+async def sync_lookup(flow_id):
+    """A lookup through the sync session, blocking the event loop as the endpoints used to."""
+    with session_scope() as session:
+        return session.get(Flow, flow_id)
+
+
+async def async_lookup(flow_id):
+    async with async_session_scope() as session:
+        return await session.get(Flow, flow_id)
+
+
+async def run_concurrently(lookup, flow_id) -> float:
+    """Runs the lookups concurrently and returns the longest time the event loop could not run another task."""
+    lag = 0.0
+    done = False
+
+    async def measure_lag():
+        nonlocal lag
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(0)
+            lag = max(lag, time.perf_counter() - start)
+
+    ticker = asyncio.create_task(measure_lag())
+    try:
+        flows = await asyncio.gather(*(lookup(flow_id) for _ in range(CONCURRENT_LOOKUPS)))
+    finally:
+        done = True
+        await ticker
+    assert all(flow is not None for flow in flows)
+    return lag
+
+
+@pytest.mark.benchmark(group="database_sessions")
+@pytest.mark.parametrize("lookup", [sync_lookup, async_lookup], ids=["sync", "async"])
+def test_concurrent_flow_lookups(benchmark, flow, lookup):
+    loop = asyncio.new_event_loop()
+    lags = []
+    try:
+        benchmark(lambda: lags.append(loop.run_until_complete(run_concurrently(lookup, flow.id))))
+    finally:
+        loop.close()
+    benchmark.extra_info["max_event_loop_lag"] = max(lags)
@@ -0,0 +1,102 @@
+import asyncio
+import copy
+import pickle
+
+import pytest
+
+from langflow.graph import Graph
+from langflow.graph.graph.serialization import dump_state, dump_structure, load_graph
+from langflow.processing.process import process_tweaks
+from langflow.services.cache.utils import dumps_payload
+from langflow.services.deps import get_chat_service
+
+
+def build_all_params(graph: Graph):
+    for vertex in graph.vertices:
+        vertex._build_params()
+
+
+def get_tweaks(flow_payload: dict) -> dict:
+    """Tweaks every string field of the first node, as a request to /run would."""
+    node = flow_payload["nodes"][0]
+    template = node["data"]["node"]["template"]
+    fields = {
+        name: "tweaked"
+        for name, field in template.items()
+        if isinstance(field, dict) and isinstance(field.get("value"), str) and name != "code"
+    }
+    return {node["id"]: fields}
+
+
+@pytest.mark.benchmark(group="from_payload")
+def test_from_payload(benchmark, flow_payload):
+    graph = benchmark(Graph.from_payload, flow_payload)
+    assert graph.vertices
+
+
+@pytest.mark.benchmark(group="build_params")
+def test_build_params(benchmark, flow_graph):
+    benchmark(build_all_params, flow_graph)
+
+
+@pytest.mark.benchmark(group="layered_topological_sort")
+def test_layered_topological_sort(benchmark, flow_graph):
+    # Sorting consumes the in-degree map, so it is rebuilt before every round
+    layers = benchmark.pedantic(
+        flow_graph.layered_topological_sort,
+        args=(flow_graph.vertices,),
+        setup=flow_graph.build_graph_maps,
+        rounds=20,
+    )
+    assert layers
+
+
+@pytest.mark.benchmark(group="sort_vertices")
+def test_sort_vertices(benchmark, flow_graph):
+    first_layer = benchmark.pedantic(flow_graph.sort_vertices, setup=flow_graph.build_graph_maps, rounds=20)
+    assert first_layer
+
+
+@pytest.mark.benchmark(group="process_tweaks")
+def test_process_tweaks(benchmark, flow_payload):
+    tweaks = get_tweaks(flow_payload)
+
+    def setup():
+        return (copy.deepcopy(flow_payload), tweaks), {}
+
+    benchmark.pedantic(process_tweaks, setup=setup, rounds=20)
+
+
+@pytest.mark.benchmark(group="pickle")
+def test_pickle_round_trip(benchmark, flow_graph):
+    graph = benchmark(lambda: pickle.loads(pickle.dumps(flow_graph)))
+    assert len(graph.vertices) == len(flow_graph.vertices)
+
+
+@pytest.mark.benchmark(group="pickle")
+def test_state_round_trip(benchmark, flow_graph):
+    """The run state written to the cache on every update, against a pickle of the whole graph."""
+    structure = dump_structure(flow_graph)
+    benchmark.extra_info["pickle_bytes"] = len(pickle.dumps(flow_graph))
+    benchmark.extra_info["payload_bytes"] = len(dumps_payload(flow_graph))
+    benchmark.extra_info["state_bytes"] = len(dump_state(flow_graph).state)
+    benchmark.extra_info["structure_bytes"] = len(structure)
+
+    graph = benchmark(lambda: load_graph(dump_state(flow_graph), structure))
+    assert len(graph.vertices) == len(flow_graph.vertices)
+
+
+@pytest.mark.benchmark(group="chat_service_cache")
+def test_chat_service_cache_round_trip(benchmark, flow_graph):
+    chat_service = get_chat_service()
+    loop = asyncio.new_event_loop()
+
+    async def round_trip():
+        await chat_service.set_cache("benchmark-flow", flow_graph)
+        return await chat_service.get_cache("benchmark-flow")
+
+    try:
+        benchmark(lambda: loop.run_until_complete(round_trip()))
+        loop.run_until_complete(chat_service.clear_cache("benchmark-flow"))
+    finally:
+        loop.close()
@@ -0,0 +1,40 @@
+import copy
+import gc
+import time
+
+import pytest
+
+from langflow.graph import Graph
+
+# Time(5k) / Time(1k) is about 5 when the work is linear and 25 when it is quadratic
+MAX_SCALING_RATIO = 15
+
+
+def time_build_and_sort(payload: dict) -> tuple[float, float]:
+    # As timeit does, the garbage collector is paused so its passes over the heap don't skew the ratio
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        graph = Graph.from_payload(payload)
+        built = time.perf_counter()
+        graph.topological_sort()
+        graph.sort_vertices()
+        return built - start, time.perf_counter() - built
+    finally:
+        gc.enable()
+
+
+@pytest.mark.parametrize("fan_out", [1, 4], ids=["deep", "wide"])
+def test_graph_build_and_sort_scale_linearly(synthetic_payload, fan_out):
+    timings = {}
+    for size in (1000, 5000):
+        payload = synthetic_payload(size, fan_out)
+        # The best of a few runs keeps the ratio stable on a noisy machine
+        runs = [time_build_and_sort(copy.deepcopy(payload)) for _ in range(3)]
+        timings[size] = (min(run[0] for run in runs), min(run[1] for run in runs))
+
+    build_ratio = timings[5000][0] / timings[1000][0]
+    sort_ratio = timings[5000][1] / timings[1000][1]
+    assert build_ratio < MAX_SCALING_RATIO, timings
+    assert sort_ratio < MAX_SCALING_RATIO, timings
@@ -673,6 +673,51 @@ def test_invalid_flow_id(client, created_api_key):
     # Check if the error detail is as expected
 
 
+def test_run_reloads_updated_and_deleted_flows(client, simple_api_test, created_api_key, logged_in_headers):
+    from langflow.processing.flow_cache import get_flow_cache
+
+    headers = {"x-api-key": created_api_key.api_key}
+    flow_id = simple_api_test["id"]
+    hits = get_flow_cache().hits
+    for _ in range(2):
+        response = client.post(f"/api/v1/run/{flow_id}", headers=headers)
+        assert response.status_code == status.HTTP_200_OK, response.text
+    assert get_flow_cache().hits == hits + 1
+
+    response = client.patch(f"api/v1/flows/{flow_id}", json={"endpoint_name": "renamed"}, headers=logged_in_headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    response = client.post("/api/v1/run/renamed", headers=headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+
+    response = client.delete(f"api/v1/flows/{flow_id}", headers=logged_in_headers)
+    assert response.status_code == status.HTTP_200_OK, response.text
+    for flow_id_or_name in (flow_id, "renamed"):
+        response = client.post(f"/api/v1/run/{flow_id_or_name}", headers=headers)
+        assert response.status_code == status.HTTP_404_NOT_FOUND, response.text
+
+
+def test_flow_lookup_reloads_flows_updated_by_another_worker(client, simple_api_test):
+    import asyncio
+    from datetime import datetime, timezone
+
+    from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
+    from langflow.services.database.models.flow import Flow
+    from langflow.services.deps import session_scope
+
+    flow_id = simple_api_test["id"]
+    flow = asyncio.run(get_flow_by_id_or_endpoint_name(flow_id))
+    flow.name = "Changed by the caller"
+    assert asyncio.run(get_flow_by_id_or_endpoint_name(flow_id)).name == "Simple API Test"
+
+    # Written straight to the database, so the cache is not invalidated
+    with session_scope() as session:
+        db_flow = session.get(Flow, UUID(flow_id))
+        db_flow.name = "Updated elsewhere"
+        db_flow.updated_at = datetime.now(timezone.utc)
+        session.add(db_flow)
+    assert asyncio.run(get_flow_by_id_or_endpoint_name(flow_id)).name == "Updated elsewhere"
+
+
 def test_starter_projects(client, created_api_key):
     headers = {"x-api-key": created_api_key.api_key}
     response = client.get("/api/v1/starter-projects/", headers=headers)
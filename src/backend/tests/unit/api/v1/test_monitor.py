@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from fastapi import status
+
+from langflow.memory import add_messages
+from langflow.schema.message import Message
+
+
+def test_get_cache_stats(client, active_user, logged_in_headers):
+    response = client.get("api/v1/monitor/cache", headers=logged_in_headers)
+    result = response.json()
+
+    assert status.HTTP_200_OK == response.status_code
+    assert result["cache_type"] == "AsyncInMemoryCache"
+    assert result["entries"] >= 0
+    assert result["bytes"] >= 0
+
+
+def test_get_component_cache_stats(client, logged_in_headers):
+    response = client.get("api/v1/monitor/component_cache", headers=logged_in_headers)
+    result = response.json()
+
+    assert status.HTTP_200_OK == response.status_code
+    assert result["cache_type"] == "ComponentClassCache"
+    assert result["entries"] >= 0
+    assert result["hits"] >= 0
+    assert result["misses"] >= 0
+
+
+def test_get_cache_stats__requires_login(client):
+    response = client.get("api/v1/monitor/cache")
+
+    assert status.HTTP_403_FORBIDDEN == response.status_code
+
+
+def test_get_messages__pages_with_cursor(client, logged_in_headers):
+    session_id = str(uuid4())
+    start = datetime.now(timezone.utc) - timedelta(minutes=1)
+    # Messages stored in the same second must not be skipped or repeated across pages
+    timestamps = [start, start, start, start + timedelta(seconds=1), start + timedelta(seconds=2)]
+    stored = add_messages(
+        [
+            Message(text=f"Message {i}", sender="User", sender_name="User", session_id=session_id, timestamp=timestamp)
+            for i, timestamp in enumerate(timestamps)
+        ]
+    )
+
+    texts = []
+    cursor = None
+    for _ in range(len(stored)):
+        params = {"session_id": session_id, "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("api/v1/monitor/messages", params=params, headers=logged_in_headers)
+        assert status.HTTP_200_OK == response.status_code
+        texts.extend(message["text"] for message in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+
+    assert sorted(texts) == sorted(message.text for message in stored)
+    assert texts[3:] == ["Message 3", "Message 4"]
+
+
+def test_get_messages__rejects_invalid_cursor(client, logged_in_headers):
+    response = client.get("api/v1/monitor/messages", params={"cursor": "invalid"}, headers=logged_in_headers)
+
+    assert status.HTTP_400_BAD_REQUEST == response.status_code
+
+
+def test_get_messages__returns_all_messages_without_limit(client, logged_in_headers):
+    session_id = str(uuid4())
+    stored = add_messages(
+        [Message(text=f"Message {i}", sender="User", sender_name="User", session_id=session_id) for i in range(3)]
+    )
+
+    response = client.get("api/v1/monitor/messages", params={"session_id": session_id}, headers=logged_in_headers)
+
+    assert status.HTTP_200_OK == response.status_code
+    assert [message["text"] for message in response.json()] == [message.text for message in stored]
+    assert "X-Next-Cursor" not in response.headers
@@ -0,0 +1,70 @@
+from collections.abc import AsyncIterator
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from langflow.base.models.model import LCModelComponent
+from langflow.field_typing import LanguageModel
+from langflow.schema.message import Message
+
+
+@pytest.fixture
+def client():
+    pass
+
+
+class FakeModelComponent(LCModelComponent):
+    inputs = LCModelComponent._base_inputs
+
+    def build_model(self) -> LanguageModel:  # type: ignore[type-var]
+        return FakeListChatModel(responses=["Hello from the model"])
+
+
+def test_text_response_uses_invoke():
+    component = FakeModelComponent(input_value="Hi")
+    assert component.text_response() == "Hello from the model"
+
+
+@pytest.mark.asyncio
+async def test_atext_response_uses_ainvoke():
+    component = FakeModelComponent(input_value="Hi")
+    result = await component.atext_response()
+    assert result == "Hello from the model"
+
+
+@pytest.mark.asyncio
+async def test_atext_response_streams_async_iterator():
+    component = FakeModelComponent(input_value="Hi", stream=True)
+    result = await component.atext_response()
+    assert isinstance(result, AsyncIterator)
+    chunks = [chunk.content async for chunk in result]
+    assert "".join(chunks) == "Hello from the model"
+
+
+@pytest.mark.asyncio
+async def test_get_chat_result_empty_message():
+    component = FakeModelComponent()
+    with pytest.raises(ValueError, match="empty"):
+        await component.aget_chat_result(component.build_model(), False, "")
+
+
+@pytest.mark.asyncio
+async def test_text_output_is_built_with_the_async_method(monkeypatch):
+    component = FakeModelComponent(input_value="Hi")
+
+    def text_response():
+        raise AssertionError("The text output is built with atext_response")
+
+    monkeypatch.setattr(component, "text_response", text_response)
+    results, _ = await component.build_results()
+    assert results["text_output"] == "Hello from the model"
+
+
+@pytest.mark.asyncio
+async def test_overridden_text_response_builds_the_text_output():
+    class OverridingModelComponent(FakeModelComponent):
+        def text_response(self) -> Message:
+            return Message(text="Overridden")
+
+    results, _ = await OverridingModelComponent(input_value="Hi").build_results()
+    assert results["text_output"].text == "Overridden"
@@ -1,9 +1,20 @@
+import threading
+
 import pytest
 
 from langflow.components.agents.CrewAIAgent import CrewAIAgentComponent
 from langflow.components.helpers.SequentialTask import SequentialTaskComponent
 from langflow.components.inputs.ChatInput import ChatInput
 from langflow.components.outputs import ChatOutput
+from langflow.custom import Component
+from langflow.template.field.base import Output
+
+
+class ThreadIdComponent(Component):
+    outputs = [Output(display_name="Thread ID", name="thread_id", method="get_thread_id")]
+
+    def get_thread_id(self) -> int:
+        return threading.get_ident()
 
 
 @pytest.fixture
@@ -24,3 +35,36 @@ def test_set_component():
     task.set(agent=crewai_agent)
     assert task._edges[0]["source"] == crewai_agent._id
     assert crewai_agent in task._components
+
+
+@pytest.mark.asyncio
+async def test_sync_output_runs_on_event_loop_by_default():
+    component = ThreadIdComponent()
+    results, _ = await component.build_results()
+    assert results["thread_id"] == threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_sync_output_runs_in_thread_when_enabled():
+    class ThreadedComponent(ThreadIdComponent):
+        run_sync_outputs_in_thread = True
+
+    component = ThreadedComponent()
+    results, _ = await component.build_results()
+    assert results["thread_id"] != threading.get_ident()
+
+
+@pytest.mark.asyncio
+async def test_sync_output_runs_in_thread_when_enabled_by_the_setting(monkeypatch):
+    from langflow.services.deps import get_settings_service
+
+    monkeypatch.setattr(get_settings_service().settings, "run_sync_outputs_in_thread", True)
+    component = ThreadIdComponent()
+    results, _ = await component.build_results()
+    assert results["thread_id"] != threading.get_ident()
+
+    class EventLoopComponent(ThreadIdComponent):
+        run_sync_outputs_in_thread = False
+
+    results, _ = await EventLoopComponent().build_results()
+    assert results["thread_id"] == threading.get_ident()
@@ -1,4 +1,8 @@
+import asyncio
+import json
+import time
 from collections import deque
+from uuid import uuid4
 
 import pytest
 
@@ -9,6 +13,7 @@ from langflow.components.outputs.TextOutput import TextOutputComponent
 from langflow.components.tools.YfinanceTool import YfinanceToolComponent
 from langflow.graph.graph.base import Graph
 from langflow.graph.graph.constants import Finish
+from langflow.graph.vertex.base import VertexStates
 
 
 @pytest.fixture
@@ -92,6 +97,22 @@ async def test_graph_functional_async_start():
     assert results[-1] == Finish()
 
 
+@pytest.mark.asyncio
+async def test_run_variables_are_dropped_when_the_run_ends():
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(input_value="test", _id="chat_output")
+    chat_output.set(sender_name=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+    run_variables = graph.get_run_variables()
+
+    async for result in graph.async_start():
+        if not isinstance(result, Finish):
+            assert graph.get_run_variables() is run_variables
+    await graph.end_all_traces()
+
+    assert graph._run_variables is None
+
+
 def test_graph_functional_start():
     chat_input = ChatInput(_id="chat_input")
     chat_output = ChatOutput(input_value="test", _id="chat_output")
@@ -154,3 +175,220 @@ def test_graph_set_with_valid_component():
     tool = YfinanceToolComponent()
     tool_calling_agent = ToolCallingAgentComponent()
     tool_calling_agent.set(tools=[tool])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("scheduler", ["layered", "dataflow"])
+async def test_graph_process_schedulers(scheduler):
+    chat_input = ChatInput(_id="chat_input")
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=chat_input.message_response)
+    chat_output = ChatOutput(input_value="test", _id="chat_output")
+    chat_output.set(sender_name=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+    graph.add_component("text_output", text_output)
+    graph.prepare()
+
+    await graph.process(fallback_to_env_vars=False, scheduler=scheduler, max_concurrency=1)
+
+    assert all(vertex._built for vertex in graph.vertices)
+
+
+def build_instrumented_graph(slow_vertex_ids: set[str], record: dict | None = None) -> tuple[Graph, dict]:
+    """
+    A graph where `fast` feeds `successor` and `slow_1`, `slow_2` and `slow_3` don't depend on anything.
+
+    Builds of the vertices in `slow_vertex_ids` are slowed down, and the builds record when they start and finish,
+    and how many were running at most at the same time, in `record` if one is given to share it between graphs.
+    """
+    fast = ChatInput(_id="fast")
+    successor = TextOutputComponent(_id="successor")
+    successor.set(input_value=fast.message_response)
+    graph = Graph(fast, successor)
+    for index in range(1, 4):
+        graph.add_component(f"slow_{index}", TextOutputComponent(_id=f"slow_{index}", input_value="test"))
+    graph.prepare()
+
+    if record is None:
+        record = {"started": {}, "finished": {}, "running": 0, "peak": 0}
+    build_vertex = graph.build_vertex
+
+    async def instrumented_build_vertex(vertex_id, *args, **kwargs):
+        record["started"][vertex_id] = time.monotonic()
+        record["running"] += 1
+        record["peak"] = max(record["peak"], record["running"])
+        try:
+            await asyncio.sleep(0.3 if vertex_id in slow_vertex_ids else 0.01)
+            return await build_vertex(vertex_id, *args, **kwargs)
+        finally:
+            record["running"] -= 1
+            record["finished"][vertex_id] = time.monotonic()
+
+    graph.build_vertex = instrumented_build_vertex  # type: ignore
+    return graph, record
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("scheduler", ["layered", "dataflow"])
+async def test_graph_process_starts_successors_before_the_layer_finishes(scheduler):
+    graph, record = build_instrumented_graph(slow_vertex_ids={"slow_1"})
+
+    await graph.process(fallback_to_env_vars=False, scheduler=scheduler, max_concurrency=0)
+
+    successor_started_early = record["started"]["successor"] < record["finished"]["slow_1"]
+    assert successor_started_early is (scheduler == "dataflow")
+    assert all(vertex._built for vertex in graph.vertices)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("scheduler", ["layered", "dataflow"])
+async def test_graph_process_limits_concurrent_vertices_per_flow(scheduler):
+    graph, record = build_instrumented_graph(slow_vertex_ids={"slow_1", "slow_2", "slow_3"})
+
+    await graph.process(fallback_to_env_vars=False, scheduler=scheduler, max_concurrency=2)
+
+    assert record["peak"] == 2
+    assert all(vertex._built for vertex in graph.vertices)
+
+
+@pytest.mark.asyncio
+async def test_graph_process_dataflow_cancels_running_vertices_on_error():
+    graph, record = build_instrumented_graph(slow_vertex_ids={"slow_1", "slow_2", "slow_3"})
+    instrumented_build_vertex = graph.build_vertex
+
+    async def failing_build_vertex(vertex_id, *args, **kwargs):
+        if vertex_id == "fast":
+            raise ValueError("Build failed")
+        return await instrumented_build_vertex(vertex_id, *args, **kwargs)
+
+    graph.build_vertex = failing_build_vertex  # type: ignore
+    with pytest.raises(ValueError, match="Build failed"):
+        await graph.process(fallback_to_env_vars=False, scheduler="dataflow", max_concurrency=0)
+
+    # The slow builds were cancelled and had unwound by the time the error was raised
+    assert record["running"] == 0
+    assert not any(graph.get_vertex(f"slow_{index}")._built for index in range(1, 4))
+
+
+@pytest.mark.asyncio
+async def test_graph_process_limits_concurrent_vertices_across_flows(monkeypatch):
+    from langflow.services.deps import get_settings_service
+
+    monkeypatch.setattr(get_settings_service().settings, "max_concurrent_vertices", 3)
+    graph, record = build_instrumented_graph(slow_vertex_ids={"slow_1", "slow_2", "slow_3"})
+    other_graph, _ = build_instrumented_graph(slow_vertex_ids={"slow_1", "slow_2", "slow_3"}, record=record)
+
+    # Both runs start their 4 first vertices at once, so only the process-wide limit holds them back
+    await asyncio.gather(
+        graph.process(fallback_to_env_vars=False, scheduler="dataflow", max_concurrency=0),
+        other_graph.process(fallback_to_env_vars=False, scheduler="dataflow", max_concurrency=0),
+    )
+
+    assert record["peak"] == 3
+    assert all(vertex._built for vertex in [*graph.vertices, *other_graph.vertices])
+
+
+@pytest.mark.asyncio
+async def test_graph_process_invalid_scheduler():
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(input_value="test", _id="chat_output")
+    chat_output.set(sender_name=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+    with pytest.raises(ValueError, match="Invalid scheduler"):
+        await graph.process(fallback_to_env_vars=False, scheduler="unknown")  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_graph_arun_batch_keeps_input_order(json_memory_chatbot_no_llm):
+    graph = Graph.from_payload(json.loads(json_memory_chatbot_no_llm)["data"])
+
+    inputs = [{"input_value": f"message {i}"} for i in range(5)]
+    results = await graph.arun(inputs=inputs, session_id=str(uuid4()), max_parallel_runs=2)
+
+    assert [result.inputs for result in results] == inputs
+    assert all(result.error is None for result in results)
+    for i, result in enumerate(results):
+        assert result.outputs[0].results["message"].text.endswith(f"User: message {i}\nAI: ")
+    # The batch runs on copies, so the graph itself is left untouched
+    assert not any(vertex._built for vertex in graph.vertices)
+
+
+@pytest.mark.asyncio
+async def test_graph_arun_batch_reports_errors_per_input(json_memory_chatbot_no_llm):
+    graph = Graph.from_payload(json.loads(json_memory_chatbot_no_llm)["data"])
+
+    results = await graph.arun(inputs=[{"input_value": 1}, {"input_value": "hello"}], max_parallel_runs=0)
+
+    assert "Invalid input value" in results[0].error
+    assert results[1].error is None
+    assert results[1].outputs
+
+
+@pytest.mark.asyncio
+async def test_build_vertex_memoization(monkeypatch):
+    from langflow.graph.graph import memo
+    from langflow.services.deps import get_settings_service
+
+    monkeypatch.setattr(get_settings_service().settings, "vertex_memoization", True)
+    monkeypatch.setattr(memo, "_vertex_memo_cache", memo.VertexMemoCache())
+
+    async def build(input_value: str):
+        chat_input = ChatInput(_id="ChatInput-memo")
+        text_output = TextOutputComponent(_id="TextOutput-memo")
+        text_output.set(input_value=chat_input.message_response)
+        graph = Graph(chat_input, text_output)
+        graph.prepare()
+        await graph.build_vertex("ChatInput-memo", inputs_dict={"input_value": input_value})
+        return await graph.build_vertex("TextOutput-memo", inputs_dict={"input_value": input_value})
+
+    assert not (await build("hello")).memoized
+    result = await build("hello")
+    assert result.memoized
+    assert result.result_dict.results["text"].text == "hello"
+    assert not (await build("bye")).memoized
+    assert memo.get_vertex_memo_cache().vertex_stats("", "TextOutput-memo") == {"hits": 1, "misses": 2}
+
+
+@pytest.mark.asyncio
+async def test_graph_astep_records_run_state_deltas():
+    chat_input = ChatInput(_id="chat_input")
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=chat_input.message_response)
+    chat_output = ChatOutput(input_value="test", _id="chat_output")
+    chat_output.set(sender_name=text_output.text_response)
+    graph = Graph(chat_input, chat_output)
+    graph.prepare()
+
+    def current_state():
+        snapshot = graph.get_snapshot()
+        snapshot["run_queue"] = list(snapshot["run_queue"])
+        return snapshot
+
+    states = [current_state()]
+    while not isinstance(await graph.astep(), Finish):
+        states.append(current_state())
+
+    assert graph._call_order == ["chat_input", "text_output", "chat_output"]
+    for index, state in enumerate(states):
+        assert graph.get_recorded_snapshot(index) == state
+    assert graph._run_state_log.deltas_since(1)[0].vertex_id == "chat_input"
+
+
+def test_run_state_log_compares_only_the_touched_vertices(monkeypatch):
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+    graph.prepare()
+    log = graph.run_state_log
+    log.start(graph)
+
+    class Untouchable(list):
+        def __iter__(self):
+            raise AssertionError("All the vertices were compared")
+
+    graph.vertex_map["chat_output"].set_state("INACTIVE")
+    monkeypatch.setattr(graph, "vertices", Untouchable(graph.vertices))
+    delta = log.record(graph, None)
+
+    assert delta.vertex_states == {"chat_output": VertexStates.INACTIVE}
@@ -0,0 +1,75 @@
+import json
+import pickle
+
+import pytest
+
+from langflow.graph.graph.base import Graph
+from langflow.graph.graph.serialization import (
+    SerializedGraph,
+    dump_state,
+    dump_structure,
+    get_flow_version,
+    has_template,
+    load_graph,
+)
+
+
+@pytest.fixture
+def client():
+    pass
+
+
+@pytest.fixture
+def graph(json_memory_chatbot_no_llm):
+    graph = Graph.from_payload(json.loads(json_memory_chatbot_no_llm)["data"], flow_id="flow", flow_name="Memory")
+    graph.set_run_id("run")
+    return graph
+
+
+def test_load_graph_restores_run_state(graph):
+    vertex = graph.vertices[0]
+    vertex._built = True
+    vertex.results = {"text": "result " * 1000}
+    vertex.params["extra"] = "value"
+    graph.inactivated_vertices.add(vertex.id)
+
+    loaded = load_graph(dump_state(graph), dump_structure(graph))
+
+    assert [v.id for v in loaded.vertices] == [v.id for v in graph.vertices]
+    loaded_vertex = loaded.get_vertex(vertex.id)
+    assert loaded_vertex._built
+    assert loaded_vertex.results == vertex.results
+    assert loaded_vertex.params["extra"] == "value"
+    assert loaded_vertex.graph is loaded
+    assert loaded.inactivated_vertices == {vertex.id}
+    assert loaded.flow_id == "flow"
+    assert len(loaded.edges) == len(graph.edges)
+
+
+def test_state_is_smaller_than_the_pickled_graph(graph):
+    serialized = dump_state(graph)
+
+    assert serialized.version == get_flow_version(graph)
+    assert len(serialized.state) * 4 < len(pickle.dumps(graph))
+
+
+def test_structure_is_only_needed_once_per_version(graph):
+    serialized = dump_state(graph)
+    first = load_graph(serialized, dump_structure(graph))
+
+    assert has_template(serialized.version)
+    second = load_graph(serialized)
+    assert second is not first
+    assert second.get_vertex(graph.vertices[0].id) is not first.get_vertex(graph.vertices[0].id)
+
+
+def test_load_graph_rejects_unknown_versions_and_mismatched_state(graph):
+    with pytest.raises(KeyError):
+        load_graph(SerializedGraph(version="unknown", state=b""))
+
+    structure = dump_structure(graph)
+    removed = graph.vertices.pop()
+    mismatched = dump_state(graph)
+    graph.vertices.append(removed)
+    with pytest.raises(ValueError):
+        load_graph(mismatched, structure)
@@ -416,3 +416,23 @@ async def test_pickle_graph():
     assert pickled is not None
     unpickled = pickle.loads(pickled)
     assert unpickled is not None
+
+
+def test_edge_indexes_follow_remove_vertex(basic_graph):
+    def scan(vertex_id):
+        return [edge for edge in basic_graph.edges if vertex_id in (edge.source_id, edge.target_id)]
+
+    for vertex in basic_graph.vertices:
+        assert basic_graph.get_vertex_edges(vertex.id) == scan(vertex.id)
+    edge = basic_graph.edges[0]
+    assert basic_graph.get_edge(edge.source_id, edge.target_id) is edge
+
+    basic_graph.remove_vertex(edge.source_id)
+
+    assert basic_graph.get_edge(edge.source_id, edge.target_id) is None
+    assert all(edge.source_id not in (_edge.source_id, _edge.target_id) for _edge in basic_graph.edges)
+    for vertex in basic_graph.vertices:
+        assert basic_graph.get_vertex_edges(vertex.id) == scan(vertex.id)
+        assert basic_graph.get_vertex_edges(vertex.id, is_target=False) == [
+            _edge for _edge in scan(vertex.id) if _edge.source_id == vertex.id
+        ]
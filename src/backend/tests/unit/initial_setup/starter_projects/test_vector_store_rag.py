@@ -54,6 +54,9 @@ def ingestion_graph():
 def rag_graph():
     # RAG Graph
     openai_embeddings = OpenAIEmbeddingsComponent(_id="openai-embeddings-124")
+    openai_embeddings.set(
+        openai_api_key="sk-123", openai_api_base="https://api.openai.com/v1", openai_api_type="openai"
+    )
     chat_input = ChatInput(_id="chatinput-123")
     chat_input.get_output("message").value = "What is the meaning of life?"
     rag_vector_store = AstraVectorStoreComponent(_id="rag-vector-store-123")
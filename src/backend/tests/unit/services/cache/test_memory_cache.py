@@ -0,0 +1,139 @@
+import asyncio
+import pickle
+import time
+from unittest.mock import patch
+
+import pytest
+
+from langflow.services.cache.service import AsyncInMemoryCache, ThreadingInMemoryCache
+from langflow.services.cache.utils import CACHE_MISS, get_object_size
+
+
+@pytest.fixture
+def client():
+    pass
+
+
+def test_get_object_size_counts_nested_objects_once():
+    shared = "x" * 1000
+    assert get_object_size([shared, shared]) < 2 * get_object_size(shared)
+    assert get_object_size({"a": [shared]}) > get_object_size(shared)
+
+
+def test_threading_cache_evicts_least_recently_used_over_max_bytes():
+    value = pickle.dumps("x" * 100)
+    cache = ThreadingInMemoryCache(max_bytes=len(value) * 2)
+    cache.set("a", value)
+    cache.set("b", value)
+    assert cache.get("a") == "x" * 100
+
+    cache.set("c", value)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "x" * 100
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["bytes"] == len(value) * 2
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+
+
+def test_threading_cache_skips_values_larger_than_max_bytes():
+    cache = ThreadingInMemoryCache(max_bytes=10)
+    cache.set("a", b"0123456789abc")
+
+    assert "a" not in cache
+    assert cache.stats()["bytes"] == 0
+
+
+def test_threading_cache_does_not_estimate_sizes_without_max_bytes():
+    cache = ThreadingInMemoryCache()
+    with patch("langflow.services.cache.service.get_object_size") as get_size:
+        cache.set("a", {"value": 1})
+
+    assert cache.get("a") == {"value": 1}
+    get_size.assert_not_called()
+
+
+def test_threading_cache_sweeper_removes_expired_items():
+    cache = ThreadingInMemoryCache(expiration_time=0.05, sweep_interval=0.05)
+    try:
+        cache.set("a", 1)
+        deadline = time.time() + 5
+        while "a" in cache and time.time() < deadline:
+            time.sleep(0.05)
+
+        assert "a" not in cache
+        assert cache.stats()["expirations"] == 1
+        assert cache.stats()["bytes"] == 0
+    finally:
+        asyncio.run(cache.teardown())
+
+
+@pytest.mark.asyncio
+async def test_async_cache_accounts_bytes_and_max_size():
+    cache = AsyncInMemoryCache(max_size=2, max_bytes=1024 * 1024)
+    await cache.set("a", {"value": 1})
+    await cache.set("b", {"value": 2})
+    await cache.set("c", {"value": 3})
+
+    assert await cache.get("a") is CACHE_MISS
+    assert await cache.get("c") == {"value": 3}
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["bytes"] == 2 * get_object_size({"value": 1})
+
+    await cache.delete("b")
+    assert cache.stats()["bytes"] == get_object_size({"value": 3})
+    await cache.clear()
+    assert cache.stats()["bytes"] == 0
+
+
+@pytest.mark.asyncio
+async def test_async_cache_sweeper_removes_expired_items():
+    cache = AsyncInMemoryCache(expiration_time=0.05, sweep_interval=0.05)
+    try:
+        await cache.set("a", 1)
+        for _ in range(100):
+            if "a" not in cache:
+                break
+            await asyncio.sleep(0.05)
+
+        assert "a" not in cache
+        assert cache.stats()["expirations"] == 1
+    finally:
+        await cache.teardown()
+
+
+@pytest.mark.asyncio
+async def test_async_cache_keeps_a_single_sweeper_across_loops():
+    cache = AsyncInMemoryCache(sweep_interval=60)
+    try:
+        await cache.set("a", 1)
+        sweeper = cache._sweeper_task
+        # As components run in worker threads write to the cache from their own loops
+        await asyncio.to_thread(asyncio.run, cache.set("b", 2))
+
+        assert cache._sweeper_task is sweeper
+        assert not sweeper.done()
+    finally:
+        await cache.teardown()
+
+
+def test_async_cache_moves_the_sweeper_off_a_closed_loop():
+    cache = AsyncInMemoryCache(sweep_interval=60)
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(cache.set("a", 1))
+    loop.close()
+
+    async def set_and_get_sweeper():
+        await cache.set("b", 2)
+        sweeper = cache._sweeper_task
+        await cache.teardown()
+        return sweeper
+
+    sweeper = asyncio.run(set_and_get_sweeper())
+
+    assert sweeper.get_loop() is not loop
@@ -0,0 +1,233 @@
+import asyncio
+import json
+import pickle
+import uuid
+from functools import partial
+
+import fakeredis
+import numpy as np
+import pytest
+
+from langflow.graph.graph.base import Graph
+from langflow.graph.graph.serialization import SerializedGraph, get_flow_version, get_structure_key
+from langflow.services.cache.service import AsyncInMemoryCache, RedisCache
+from langflow.services.cache.tiered import LocalInvalidationBus, TieredCache
+from langflow.services.cache.utils import COMPRESSION_THRESHOLD, dumps_payload, loads_payload
+from langflow.services.chat.service import ChatService
+
+
+@pytest.fixture
+def client():
+    pass
+
+
+@pytest.fixture
+def redis_cache(monkeypatch):
+    server = fakeredis.FakeServer()
+    cache = RedisCache(expiration_time=60)
+    monkeypatch.setattr(cache, "_create_client", lambda: fakeredis.FakeAsyncRedis(server=server))
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_set_get_and_delete(redis_cache):
+    await redis_cache.set("a", {"value": 1})
+
+    assert await redis_cache.get("a") == {"value": 1}
+    assert await redis_cache.contains("a")
+    assert await redis_cache.get("missing") is None
+
+    await redis_cache.delete("a")
+    assert not await redis_cache.contains("a")
+    with pytest.raises(TypeError):
+        "a" in redis_cache  # noqa: B015
+
+
+@pytest.mark.asyncio
+async def test_set_many_get_many_and_delete_many(redis_cache):
+    await redis_cache.set_many({"a": 1, "b": [2], "c": "3"})
+
+    assert await redis_cache.get_many(["c", "missing", "a", "b"]) == ["3", None, 1, [2]]
+    assert 0 < await redis_cache._client.ttl("a") <= 60
+
+    await redis_cache.delete_many(["a", "b"])
+    assert await redis_cache.get_many(["a", "b", "c"]) == [None, None, "3"]
+
+    await redis_cache.clear()
+    assert await redis_cache.get("c") is None
+
+
+@pytest.mark.asyncio
+async def test_upsert_merges_dicts(redis_cache):
+    await redis_cache.upsert("key", {"a": 1})
+    await redis_cache.upsert("key", {"b": 2})
+    assert await redis_cache.get("key") == {"a": 1, "b": 2}
+
+    await redis_cache.upsert("key", "not a dict")
+    assert await redis_cache.get("key") == "not a dict"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_upserts_are_not_lost(redis_cache):
+    await asyncio.gather(*[redis_cache.upsert("key", {f"field-{i}": i}) for i in range(20)])
+
+    assert await redis_cache.get("key") == {f"field-{i}": i for i in range(20)}
+
+
+def test_client_per_event_loop(redis_cache):
+    async def get_client():
+        return redis_cache._client, redis_cache._client
+
+    # Not asyncio.run, which reuses its loop once nest_asyncio is applied
+    loops = [asyncio.new_event_loop(), asyncio.new_event_loop()]
+    try:
+        first, same = loops[0].run_until_complete(get_client())
+        other, _ = loops[1].run_until_complete(get_client())
+    finally:
+        for loop in loops:
+            loop.close()
+
+    assert first is same
+    assert first is not other
+
+
+def test_payload_compresses_large_text():
+    value = {"text": "result " * COMPRESSION_THRESHOLD}
+
+    data = dumps_payload(value)
+
+    assert len(data) * 10 < len(pickle.dumps(value))
+    assert loads_payload(data) == value
+
+
+def test_payload_keeps_arrays_out_of_band():
+    embeddings = np.arange(4096, dtype=np.float32).reshape(64, 64)
+
+    data = dumps_payload({"embeddings": embeddings})
+    loaded = loads_payload(data)["embeddings"]
+
+    np.testing.assert_array_equal(loaded, embeddings)
+    assert embeddings.tobytes() in data
+    loaded[0, 0] = 1
+
+
+def test_plain_pickles_are_still_loaded():
+    assert loads_payload(pickle.dumps({"a": 1})) == {"a": 1}
+
+
+@pytest.mark.asyncio
+async def test_chat_service_stores_the_graph_structure_once(redis_cache, json_memory_chatbot_no_llm):
+    chat_service = ChatService()
+    chat_service.cache_service = redis_cache
+    graph = Graph.from_payload(json.loads(json_memory_chatbot_no_llm)["data"], flow_id="flow")
+    structure_key = get_structure_key(get_flow_version(graph))
+
+    assert await chat_service.set_cache("run-1", graph)
+    structure = await redis_cache._client.get(structure_key)
+    assert await chat_service.set_cache("run-2", graph)
+
+    assert await redis_cache._client.get(structure_key) == structure
+    assert isinstance((await redis_cache.get("run-1"))["result"], SerializedGraph)
+    cached = (await chat_service.get_cache("run-2"))["result"]
+    assert isinstance(cached, Graph)
+    assert [vertex.id for vertex in cached.vertices] == [vertex.id for vertex in graph.vertices]
+
+
+def build_text_chain() -> Graph:
+    """A prepared graph of a text input followed by three text outputs, built from its flow data."""
+    from langflow.components.inputs.TextInput import TextInputComponent
+    from langflow.components.outputs.TextOutput import TextOutputComponent
+
+    text_input = TextInputComponent(_id="text_input", input_value="hello")
+    previous = text_input
+    for index in range(3):
+        text_output = TextOutputComponent(_id=f"text_output_{index}")
+        text_output.set(input_value=previous.text_response)
+        previous = text_output
+    payload = Graph(text_input, previous).dump()["data"]
+    graph = Graph.from_payload(payload, flow_id=str(uuid.uuid4()))
+    graph.prepare()
+    return graph
+
+
+@pytest.mark.asyncio
+async def test_chat_service_stores_the_steps_of_a_run(redis_cache):
+    from langflow.graph.graph.constants import Finish
+    from langflow.graph.graph.serialization import _StateUnpickler, get_steps_key
+
+    graph = build_text_chain()
+    chat_service = ChatService()
+    chat_service.cache_service = redis_cache
+
+    step_vertices = []
+    while not isinstance(await graph.astep(), Finish):
+        if len(graph._call_order) == 1:
+            await chat_service.set_cache("run", graph)
+        else:
+            await chat_service.set_cache_steps("run", graph)
+            steps = await redis_cache.get(get_steps_key("run", len(step_vertices) + 1))
+            data = loads_payload(steps, unpickler_factory=partial(_StateUnpickler, graph=graph))
+            step_vertices.append(set(data["vertices"]))
+
+        cached = (await chat_service.get_cache("run"))["result"]
+        assert cached.get_snapshot() == graph.get_snapshot()
+        assert {vertex.id: vertex._built for vertex in cached.vertices} == {
+            vertex.id: vertex._built for vertex in graph.vertices
+        }
+
+    # A step only carries the vertex it built, not the state of the whole graph
+    assert step_vertices == [{vertex_id} for vertex_id in graph._call_order[1:]]
+    # Storing the graph in full again supersedes the steps written after the previous state
+    await chat_service.set_cache("run", graph)
+    assert (await chat_service.get_cache("run"))["result"].get_snapshot() == graph.get_snapshot()
+
+
+@pytest.mark.asyncio
+async def test_chat_service_fetches_the_steps_at_once_and_clears_them(redis_cache, monkeypatch):
+    from langflow.graph.graph.constants import Finish
+    from langflow.graph.graph.serialization import get_steps_key
+
+    graph = build_text_chain()
+    chat_service = ChatService()
+    chat_service.cache_service = redis_cache
+    while not isinstance(await graph.astep(), Finish):
+        if len(graph._call_order) == 1:
+            await chat_service.set_cache("run", graph)
+        else:
+            await chat_service.set_cache_steps("run", graph)
+    steps_count = len(graph._call_order) - 1
+
+    async def get(*args, **kwargs):
+        raise AssertionError("The steps are fetched with get_many")
+
+    monkeypatch.setattr(redis_cache, "get", get)
+    steps = await chat_service._get_steps("run")
+    assert len(steps) == steps_count
+    monkeypatch.undo()
+
+    await chat_service.clear_cache("run")
+    keys = [get_steps_key("run", index) for index in range(1, steps_count + 1)]
+    assert await redis_cache.get_many(["run", *keys]) == [None] * (steps_count + 1)
+
+
+@pytest.mark.asyncio
+async def test_chat_service_keeps_live_graphs_in_the_first_tier(redis_cache):
+    from langflow.graph.graph.constants import Finish
+
+    graph = build_text_chain()
+    bus = LocalInvalidationBus()
+    worker_a, worker_b = ChatService(), ChatService()
+    worker_a.cache_service = TieredCache(l1=AsyncInMemoryCache(), l2=redis_cache, bus=bus)
+    worker_b.cache_service = TieredCache(l1=AsyncInMemoryCache(), l2=redis_cache, bus=bus)
+
+    while not isinstance(await graph.astep(), Finish):
+        if len(graph._call_order) == 1:
+            await worker_a.set_cache("run", graph)
+        else:
+            await worker_a.set_cache_steps("run", graph)
+
+        # The writing worker gets the graph itself, other workers rebuild it from the shared tier
+        assert (await worker_a.get_cache("run"))["result"] is graph
+        assert isinstance((await redis_cache.get("run"))["result"], SerializedGraph)
+        cached = (await worker_b.get_cache("run"))["result"]
+        assert cached.get_snapshot() == graph.get_snapshot()
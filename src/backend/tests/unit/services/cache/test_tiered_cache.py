@@ -0,0 +1,138 @@
+import asyncio
+
+import fakeredis
+import pytest
+
+from langflow.services.cache.service import AsyncInMemoryCache, RedisCache
+from langflow.services.cache.tiered import LocalInvalidationBus, RedisInvalidationBus, TieredCache
+from langflow.services.cache.utils import CACHE_MISS
+
+
+@pytest.fixture
+def client():
+    pass
+
+
+class CountingCache(AsyncInMemoryCache):
+    def __init__(self):
+        super().__init__()
+        self.gets = 0
+
+    async def get(self, key, lock=None):
+        self.gets += 1
+        return await super().get(key, lock=lock)
+
+
+async def wait_for_listeners():
+    # Lets the listener tasks subscribe and process pending messages
+    for _ in range(10):
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_reads_are_served_from_the_first_tier():
+    l2 = CountingCache()
+    cache = TieredCache(l1=AsyncInMemoryCache(), l2=l2)
+    await l2.set("graph", {"vertices": [1, 2]})
+
+    assert await cache.get("graph") == {"vertices": [1, 2]}
+    assert await cache.get("graph") == {"vertices": [1, 2]}
+    assert await cache.get("missing") is CACHE_MISS
+    assert l2.gets == 2
+    await cache.teardown()
+
+
+@pytest.mark.asyncio
+async def test_contains_is_only_available_async():
+    l2 = AsyncInMemoryCache()
+    cache = TieredCache(l1=AsyncInMemoryCache(), l2=l2)
+    await l2.set("graph", {"vertices": [1, 2]})
+
+    assert await cache.contains("graph")
+    assert not await cache.contains("missing")
+    with pytest.raises(TypeError, match="await cache.contains"):
+        "missing" in cache  # noqa: B015
+    await cache.teardown()
+
+
+@pytest.mark.asyncio
+async def test_upserts_are_written_to_the_first_tier():
+    l2 = AsyncInMemoryCache()
+    cache = TieredCache(l1=AsyncInMemoryCache(), l2=l2)
+
+    await cache.upsert("run", {"result": 1})
+    await cache.upsert("run", {"type": int})
+    assert await cache.l1.get("run") == {"result": 1, "type": int}
+    await cache.upsert("steps", b"steps")
+    assert await cache.get("steps") == b"steps"
+
+    # The first tier can't merge with a value it doesn't hold, so it reads the merged one back
+    await l2.set("other", {"result": 1})
+    await cache.upsert("other", {"type": int})
+    assert await cache.l1.get("other") is CACHE_MISS
+    assert await cache.get("other") == {"result": 1, "type": int}
+    await cache.teardown()
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_other_workers():
+    l2 = AsyncInMemoryCache()
+    bus = LocalInvalidationBus()
+    worker_a = TieredCache(l1=AsyncInMemoryCache(), l2=l2, bus=bus)
+    worker_b = TieredCache(l1=AsyncInMemoryCache(), l2=l2, bus=bus)
+    await worker_a.set("a", 1)
+    assert await worker_b.get("a") == 1
+    await wait_for_listeners()
+
+    await worker_a.set("a", 2)
+    await wait_for_listeners()
+    assert await worker_b.get("a") == 2
+
+    await worker_a.upsert("a", {"x": 1})
+    await worker_a.upsert("a", {"y": 2})
+    await wait_for_listeners()
+    assert await worker_b.get("a") == {"x": 1, "y": 2}
+
+    await worker_a.delete("a")
+    await wait_for_listeners()
+    assert await worker_b.get("a") is CACHE_MISS
+    assert not await worker_b.contains("a")
+
+    await worker_a.teardown()
+    await worker_b.teardown()
+
+
+@pytest.mark.asyncio
+async def test_redis_pubsub_invalidates_other_workers(monkeypatch):
+    server = fakeredis.FakeServer()
+
+    def redis_cache():
+        cache = RedisCache(expiration_time=60)
+        monkeypatch.setattr(cache, "_create_client", lambda: fakeredis.FakeAsyncRedis(server=server))
+        return cache
+
+    workers = []
+    for _ in range(2):
+        l2 = redis_cache()
+        workers.append(TieredCache(l1=AsyncInMemoryCache(), l2=l2, bus=RedisInvalidationBus(l2)))
+    worker_a, worker_b = workers
+
+    await worker_a.set("flow", {"name": "old"})
+    assert await worker_b.get("flow") == {"name": "old"}
+    await wait_for_listeners()
+
+    await worker_a.set("flow", {"name": "new"})
+    await wait_for_listeners()
+    assert await worker_b.get("flow") == {"name": "new"}
+
+    # Bytes, such as serialized graphs, come back as they were from both tiers
+    await worker_a.set("structure", b"structure")
+    assert await worker_b.get("structure") == b"structure"
+    assert await worker_b.get("structure") == b"structure"
+
+    await worker_a.clear()
+    await wait_for_listeners()
+    assert await worker_b.get("flow") is CACHE_MISS
+
+    for worker in workers:
+        await worker.teardown()
@@ -0,0 +1,43 @@
+from unittest.mock import patch
+
+import pytest
+from sqlmodel import Session, select
+
+from langflow.services.database.models.flow.model import Flow
+from langflow.services.database.service import DatabaseService
+from langflow.services.database.threaded_session import ThreadedSession
+from langflow.services.settings.auth import AuthSettings
+from langflow.services.settings.base import Settings
+from langflow.services.settings.service import SettingsService
+
+
+@pytest.fixture
+def client():
+    pass
+
+
+@pytest.fixture
+def settings_service(tmp_path):
+    # A database of its own, so the test doesn't depend on the state other tests leave in the shared one
+    settings = Settings(config_dir=str(tmp_path), database_url=f"sqlite:///{tmp_path / 'langflow.db'}")
+    return SettingsService(settings, AuthSettings(CONFIG_DIR=str(tmp_path)))
+
+
+@pytest.mark.asyncio
+async def test_async_sessions_use_the_sync_engine_without_an_async_driver(settings_service):
+    db_service = DatabaseService(settings_service)
+    db_service.create_db_and_tables()
+    with Session(db_service.engine) as session:
+        flow = Flow(name="Async sessions", data={})
+        session.add(flow)
+        session.commit()
+        session.refresh(flow)
+
+    with patch("langflow.services.database.service.create_async_engine", side_effect=ImportError):
+        assert db_service.async_engine is None
+        async with db_service.create_async_session() as session:
+            assert isinstance(session, ThreadedSession)
+            assert (await session.get(Flow, flow.id)).name == flow.name
+            assert (await session.exec(select(Flow.id).where(Flow.id == flow.id))).first() == flow.id
+
+    db_service.engine.dispose()
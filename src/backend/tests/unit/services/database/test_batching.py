@@ -0,0 +1,75 @@
+import threading
+
+import pytest
+
+from langflow.services.database.batching import BatchWriter
+
+
+@pytest.fixture
+def client():
+    pass
+
+
+class RecordingWriter(BatchWriter[int]):
+    name = "recording writer"
+
+    def __init__(self, *args, **kwargs):
+        self.batches: list[list[int]] = []
+        self.release = threading.Event()
+        self.release.set()
+        super().__init__(*args, **kwargs)
+
+    def _write(self, batch):
+        self.release.wait()
+        if -1 in batch:
+            raise ValueError("Cannot write -1")
+        self.batches.append(batch)
+
+
+def test_coalesces_items_in_batches():
+    writer = RecordingWriter(batch_size=3, interval=0.5)
+    try:
+        writer.release.clear()
+        writer.submit([0])
+        writer.submit([1, 2, 3, 4])
+        writer.release.set()
+        writer.flush()
+        assert [item for batch in writer.batches for item in batch] == [0, 1, 2, 3, 4]
+        assert all(len(batch) <= 3 for batch in writer.batches)
+        assert writer.stats() == {"queued": 0, "written": 5, "dropped": 0}
+    finally:
+        writer.stop()
+
+
+def test_drops_items_when_the_queue_is_full():
+    writer = RecordingWriter(batch_size=1, interval=0, max_queue_size=2)
+    try:
+        writer.release.clear()
+        writer.submit([0])
+        # Wait for the writer to take the first item, so the queue holds the next ones only
+        while writer.stats()["queued"]:
+            pass
+        assert writer.submit([1, 2, 3, 4]) == 2
+        writer.release.set()
+        writer.flush()
+        assert writer.batches == [[0], [1], [2]]
+        assert writer.stats() == {"queued": 0, "written": 3, "dropped": 2}
+    finally:
+        writer.stop()
+
+
+def test_keeps_writing_after_a_failed_batch():
+    writer = RecordingWriter(batch_size=1, interval=0)
+    writer.submit([-1, 1])
+    writer.flush()
+    assert writer.batches == [[1]]
+    assert writer.stats()["written"] == 1
+
+
+def test_stop_writes_pending_items():
+    writer = RecordingWriter(batch_size=10, interval=1)
+    writer.submit([0, 1])
+    writer.stop()
+    assert writer.batches == [[0, 1]]
+    with pytest.raises(RuntimeError):
+        writer.submit([2])
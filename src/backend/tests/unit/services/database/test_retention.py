@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlmodel import select
+
+from langflow.services.database import retention
+from langflow.services.database.models.transactions.model import TransactionTable
+from langflow.services.database.retention import compact_log_data, enforce_log_retention
+from langflow.services.deps import get_settings_service, session_scope
+
+
+def add_transactions(flow_id, count, start=None, output="output"):
+    start = start or datetime.now(timezone.utc) - timedelta(minutes=10)
+    with session_scope() as session:
+        session.add_all(
+            [
+                TransactionTable(
+                    vertex_id=f"vertex-{i}",
+                    status="success",
+                    outputs={"text": output},
+                    flow_id=flow_id,
+                    timestamp=start + timedelta(seconds=i),
+                )
+                for i in range(count)
+            ]
+        )
+
+
+def get_vertex_ids(flow_id):
+    with session_scope() as session:
+        stmt = select(TransactionTable.vertex_id).where(TransactionTable.flow_id == flow_id)
+        return sorted(session.exec(stmt).all())
+
+
+def retention_settings(**kwargs):
+    return get_settings_service().settings.model_copy(update={"logs_retention_batch_size": 2, **kwargs})
+
+
+def test_deletes_rows_older_than_max_age():
+    flow_id = uuid4()
+    add_transactions(flow_id, 3, start=datetime.now(timezone.utc) - timedelta(days=3))
+    add_transactions(flow_id, 1)
+
+    deleted = enforce_log_retention(retention_settings(logs_retention_max_age=2))
+
+    assert deleted["transaction"] >= 3
+    assert get_vertex_ids(flow_id) == ["vertex-0"]
+
+
+def test_keeps_the_most_recent_rows_per_flow():
+    flow_id, other_flow_id = uuid4(), uuid4()
+    add_transactions(flow_id, 5)
+    add_transactions(other_flow_id, 2)
+
+    enforce_log_retention(retention_settings(logs_retention_max_rows_per_flow=2))
+
+    assert get_vertex_ids(flow_id) == ["vertex-3", "vertex-4"]
+    assert get_vertex_ids(other_flow_id) == ["vertex-0", "vertex-1"]
+
+
+def test_keeps_the_rows_within_max_bytes(monkeypatch):
+    # Only the newest rows, the ones added here, are sampled for the row size
+    monkeypatch.setattr(retention, "SIZE_SAMPLE_ROWS", 5)
+    flow_id = uuid4()
+    add_transactions(flow_id, 5, start=datetime.now(timezone.utc) + timedelta(days=1), output="x" * 1000)
+
+    enforce_log_retention(retention_settings(logs_retention_max_bytes=3500))
+
+    assert get_vertex_ids(flow_id) == ["vertex-2", "vertex-3", "vertex-4"]
+
+
+def test_compact_log_data():
+    data = {"results": {"text": "x" * 20, "short": "x"}, "messages": [{"message": "y" * 20}], "count": 1}
+
+    assert compact_log_data(data, "full", 10) is data
+    assert compact_log_data(data, "truncated", 10) == {
+        "results": {"text": "x" * 10, "short": "x"},
+        "messages": [{"message": "y" * 10}],
+        "count": 1,
+    }
+    hashed = compact_log_data(data, "hashed", 10)
+    assert hashed["results"]["text"].startswith("sha256:")
+    assert hashed["results"]["short"] == "x"
@@ -1,10 +1,12 @@
 from langflow.services.database.models.variable.model import VariableUpdate
 import pytest
+from cryptography.fernet import InvalidToken
 from unittest.mock import patch
 from uuid import uuid4
 from datetime import datetime
 from sqlmodel import SQLModel, Session, create_engine
 from langflow.services.deps import get_settings_service
+from langflow.services.variable.cache import RunVariables, UserVariablesCache
 from langflow.services.variable.service import GENERIC_TYPE, CREDENTIAL_TYPE, DatabaseVariableService
 
 
@@ -95,6 +97,68 @@ def test_get_variable__TypeError(service, session):
     assert "purpose is to prevent the exposure of value" in str(exc.value)
 
 
+def test_get_all_values(service, session):
+    user_id = uuid4()
+    service.create_variable(user_id, "generic", "value1", session=session)
+    service.create_variable(user_id, "credential", "value2", _type=CREDENTIAL_TYPE, session=session)
+
+    result = service.get_all_values(user_id, session=session)
+
+    assert result == {"generic": (GENERIC_TYPE, "value1"), "credential": (CREDENTIAL_TYPE, "value2")}
+
+
+def test_run_variables__loads_variables_once(service, session):
+    user_id = uuid4()
+    with (
+        patch("langflow.services.variable.cache.load_user_variables") as m,
+        patch("langflow.services.variable.cache.get_variable_service", return_value=service),
+        patch("langflow.services.variable.cache.session_scope") as session_scope,
+    ):
+        m.return_value = {"name": (GENERIC_TYPE, "value"), "secret": (CREDENTIAL_TYPE, "value")}
+        session_scope.return_value.__enter__.return_value = session
+        run_variables = RunVariables()
+
+        assert run_variables.get_variable(user_id, "name", "") == "value"
+        assert run_variables.get_variable(user_id, "secret", "api_key") == "value"
+        with pytest.raises(ValueError):
+            run_variables.get_variable(user_id, "missing", "")
+        with pytest.raises(TypeError):
+            run_variables.get_variable(user_id, "secret", "session_id")
+
+    m.assert_called_once_with(user_id)
+
+
+def test_run_variables__raises_decryption_errors(service, session):
+    user_id = uuid4()
+    variable = service.create_variable(user_id, "name", "value", session=session)
+    variable.value = "not encrypted"
+    session.add(variable)
+    session.commit()
+    with (
+        patch("langflow.services.variable.cache.get_variable_service", return_value=service),
+        patch("langflow.services.variable.cache.session_scope") as session_scope,
+        patch("langflow.services.variable.cache.load_user_variables") as m,
+    ):
+        session_scope.return_value.__enter__.return_value = session
+        m.side_effect = lambda user_id: service.get_all_values(user_id, session=session)
+        run_variables = RunVariables()
+
+        with pytest.raises(InvalidToken):
+            run_variables.get_variable(user_id, "name", "")
+
+
+def test_update_variable__invalidates_cached_variables(service, session):
+    user_id = uuid4()
+    service.create_variable(user_id, "name", "value", session=session)
+    cache = UserVariablesCache()
+    with patch("langflow.services.variable.cache._user_variables_cache", cache):
+        cache.set(str(user_id), service.get_all_values(user_id, session=session))
+
+        service.update_variable(user_id, "name", "new_value", session=session)
+
+        assert cache.get(str(user_id)) is None
+
+
 def test_list_variables(service, session):
     user_id = uuid4()
     names = ["name1", "name2", "name3"]
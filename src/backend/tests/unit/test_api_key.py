@@ -43,3 +43,28 @@ def test_delete_api_key(client, logged_in_headers, active_user, api_key):
     data = response.json()
     assert data["detail"] == "API Key deleted"
     # Optionally, add a follow-up check to ensure that the key is actually removed from the database
+
+
+def test_deleted_api_key_is_rejected(client, logged_in_headers, api_key):
+    headers = {"x-api-key": api_key["api_key"]}
+    response = client.get("api/v1/users/whoami", headers=headers)
+    assert response.status_code == 200, response.text
+    # The key is cached now, deleting it must still revoke it at once
+    response = client.delete(f"api/v1/api_key/{api_key['id']}", headers=logged_in_headers)
+    assert response.status_code == 200
+    response = client.get("api/v1/users/whoami", headers=headers)
+    assert response.status_code == 403
+
+
+def test_api_key_uses_are_counted(client, logged_in_headers, api_key):
+    from langflow.services.database.models.api_key.crud import flush_api_key_uses
+
+    headers = {"x-api-key": api_key["api_key"]}
+    for _ in range(3):
+        response = client.get("api/v1/users/whoami", headers=headers)
+        assert response.status_code == 200, response.text
+    flush_api_key_uses()
+    response = client.get("api/v1/api_key", headers=logged_in_headers)
+    api_keys = {key["id"]: key for key in response.json()["api_keys"]}
+    assert api_keys[api_key["id"]]["total_uses"] == 3
+    assert api_keys[api_key["id"]]["last_used_at"] is not None
@@ -538,3 +538,34 @@ def test_build_config_field_value_keys(component):
 def test_custom_component_multiple_outputs(code_component_with_multiple_outputs, active_user):
     frontnd_node_dict, _ = build_custom_component_template(code_component_with_multiple_outputs, active_user.id)
     assert frontnd_node_dict["outputs"][0]["types"] == ["Text"]
+
+
+def test_component_class_cache_reuses_compiled_class():
+    from langflow.custom.eval import ComponentClassCache
+
+    cache = ComponentClassCache(max_size=2)
+    first = cache.get_or_create(code_default)
+    second = cache.get_or_create(code_default)
+
+    assert first is second
+    assert cache.stats() == {"entries": 1, "max_size": 2, "hits": 1, "misses": 1}
+
+    cache.invalidate(code_default)
+    assert cache.get_or_create(code_default) is not first
+    assert cache.stats()["misses"] == 2
+
+
+def test_component_instances_do_not_share_outputs(code_component_with_multiple_outputs):
+    from langflow.custom.eval import eval_custom_component_code
+
+    component_class = eval_custom_component_code(code_component_with_multiple_outputs._code)
+    first = component_class()
+    second = component_class()
+
+    assert first.outputs[0] is not second.outputs[0]
+    first.outputs[0].value = "first"
+    assert second.outputs[0].value != "first"
+    # Creating an instance resets the values of its own outputs, not those of the class
+    component_class.outputs[0].value = "class"
+    component_class()
+    assert component_class.outputs[0].value == "class"
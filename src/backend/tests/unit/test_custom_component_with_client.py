@@ -23,3 +23,38 @@ def test_list_flows_flow_objects(component):
     are_flows = [isinstance(flow, Data) for flow in flows]
     flow_types = [type(flow) for flow in flows]
     assert all(are_flows), f"Expected all flows to be Data objects, got {flow_types}"
+
+
+COMPONENT_CODE = """
+from langflow.custom import Component
+from langflow.io import MessageTextInput, Output
+
+
+class EditedComponent(Component):
+    display_name = "{display_name}"
+    inputs = [MessageTextInput(name="text", display_name="Text")]
+    outputs = [Output(display_name="Text", name="text_output", method="text_response")]
+
+    def text_response(self) -> str:
+        return self.text
+"""
+
+
+def test_custom_component_update_invalidates_the_previous_code(client, logged_in_headers):
+    from langflow.custom.eval import get_component_class_cache
+
+    cache = get_component_class_cache()
+    previous_code = COMPONENT_CODE.format(display_name="Before")
+    code = COMPONENT_CODE.format(display_name="After")
+    cache.get_or_create(previous_code)
+    assert cache.hash_code(previous_code) in cache._cache
+
+    response = client.post(
+        "api/v1/custom_component/update",
+        json={"code": code, "field": "text", "field_value": "Hi", "template": {"code": {"value": previous_code}}},
+        headers=logged_in_headers,
+    )
+
+    assert response.status_code == 200, response.text
+    assert cache.hash_code(previous_code) not in cache._cache
+    assert cache.hash_code(code) in cache._cache
@@ -1,5 +1,6 @@
 import json
 from collections import namedtuple
+from unittest.mock import patch
 from uuid import UUID, uuid4
 
 import orjson
@@ -195,6 +196,19 @@ async def test_delete_flows_with_transaction_and_build(
         assert response.json() == {"vertex_builds": {}}
 
 
+def test_log_vertex_build_serializes_the_build_when_called():
+    artifacts = {"items": [1]}
+    with patch("langflow.graph.utils.get_log_writer") as get_log_writer:
+        log_vertex_build(
+            flow_id=str(uuid4()), vertex_id="vid", valid=True, params={}, data=ResultDataResponse(), artifacts=artifacts
+        )
+        # Later builds can change the artifacts before the writer thread inserts the row
+        artifacts["items"].append(2)
+        [build_row] = get_log_writer.return_value.submit.call_args.args[0]
+
+    assert build_row().artifacts == {"items": [1]}
+
+
 def test_create_flows(client: TestClient, session: Session, json_flow: str, logged_in_headers):
     flow = orjson.loads(json_flow)
     data = flow["data"]
@@ -43,3 +43,57 @@ def test_login_unsuccessful_wrong_password(client, test_user, session):
     response = client.post("api/v1/login", data={"username": "testuser", "password": "wrongpassword"})
     assert response.status_code == 401
     assert response.json()["detail"] == "Incorrect username or password"
+
+
+def get_token_cache_stats(client, headers):
+    response = client.get("api/v1/monitor/auth_cache", headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()["tokens"]
+
+
+def test_verified_token_is_cached(client, logged_in_headers):
+    hits = get_token_cache_stats(client, logged_in_headers)["hits"]
+    for _ in range(3):
+        response = client.get("api/v1/users/whoami", headers=logged_in_headers)
+        assert response.status_code == 200
+        assert response.json()["username"] == "activeuser"
+    assert get_token_cache_stats(client, logged_in_headers)["hits"] >= hits + 3
+
+
+def test_verified_token_does_not_open_a_sync_session(client, logged_in_headers):
+    from langflow.services.deps import get_session
+
+    def get_session_override():
+        raise AssertionError("Authenticating a token doesn't need a sync session")
+
+    client.app.dependency_overrides[get_session] = get_session_override
+    try:
+        for _ in range(2):
+            response = client.get("api/v1/users/whoami", headers=logged_in_headers)
+            assert response.status_code == 200
+            assert response.json()["username"] == "activeuser"
+    finally:
+        client.app.dependency_overrides.clear()
+
+
+def test_deactivated_user_token_is_rejected(client, logged_in_headers, active_user):
+    from langflow.services.database.models.user.crud import get_user_by_id, update_user
+    from langflow.services.database.models.user.model import UserUpdate
+
+    response = client.get("api/v1/users/whoami", headers=logged_in_headers)
+    assert response.status_code == 200
+    with session_scope() as session:
+        update_user(get_user_by_id(session, active_user.id), UserUpdate(is_active=False), session)
+
+    response = client.get("api/v1/users/whoami", headers=logged_in_headers)
+    assert response.status_code == 401
+
+
+def test_logout_removes_cached_token(client, logged_in_headers):
+    response = client.get("api/v1/users/whoami", headers=logged_in_headers)
+    assert response.status_code == 200
+    invalidations = get_token_cache_stats(client, logged_in_headers)["invalidations"]
+
+    response = client.post("api/v1/logout", headers=logged_in_headers)
+    assert response.status_code == 200
+    assert get_token_cache_stats(client, logged_in_headers)["invalidations"] == invalidations + 1
@@ -1,12 +1,29 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
 import pytest
+from langchain_core.messages import AIMessage, HumanMessage
 
-from langflow.memory import add_messages, add_messagetables, delete_messages, get_messages, store_message
+from langflow.memory import (
+    LCBuiltinChatMemory,
+    MessageWriter,
+    SessionHistoryCache,
+    add_messages,
+    add_messagetables,
+    delete_messages,
+    get_history_cache,
+    get_messages,
+    get_next_messages_cursor,
+    stop_message_writer,
+    store_message,
+)
 from langflow.schema.message import Message
 
 # Assuming you have these imports available
 from langflow.services.database.models.message import MessageCreate, MessageRead
 from langflow.services.database.models.message.model import MessageTable
-from langflow.services.deps import session_scope
+from langflow.services.deps import get_settings_service, session_scope
 from langflow.services.tracing.utils import convert_to_langchain_type
 
 
@@ -45,8 +62,9 @@ def test_get_messages():
     )
     messages = get_messages(sender="User", session_id="session_id2", limit=2)
     assert len(messages) == 2
-    assert messages[0].text == "Test message 1"
-    assert messages[1].text == "Test message 2"
+    # Newest first, messages stored in the same second too
+    assert messages[0].text == "Test message 2"
+    assert messages[1].text == "Test message 1"
 
 
 def test_add_messages():
@@ -77,6 +95,171 @@ def test_store_message():
     assert stored_messages[0].text == "Stored message"
 
 
+@pytest.fixture
+def write_behind(monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "message_write_behind", True)
+    yield
+    stop_message_writer()
+
+
+def test_write_behind_messages_are_read_back(write_behind):
+    session_id = str(uuid4())
+    memory = LCBuiltinChatMemory(flow_id=None, session_id=session_id)
+
+    memory.add_messages([HumanMessage(content="Hello"), AIMessage(content="Hi")])
+    stored = store_message(Message(text="Bye", sender="User", sender_name="User", session_id=session_id))
+
+    assert stored[0].id is not None
+    messages = get_messages(session_id=session_id, order="ASC")
+    assert [message.text for message in messages] == ["Hello", "Hi", "Bye"]
+    delete_messages(session_id)
+    assert get_messages(session_id=session_id) == []
+
+
+def test_message_writer_coalesces_batches(monkeypatch):
+    batches = []
+    monkeypatch.setattr(MessageWriter, "_write", staticmethod(lambda batch: batches.append(len(batch))))
+    writer = MessageWriter(batch_size=3, interval=1)
+
+    writer.submit([MessageTable(text=str(i), sender="User", sender_name="User", session_id="writer") for i in range(7)])
+    writer.stop()
+
+    assert batches == [3, 3, 1]
+    with pytest.raises(RuntimeError):
+        writer.submit([])
+
+
+def test_message_writer_flushes_only_the_pending_session(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr("langflow.memory.add_messagetables", lambda batch, session: release.wait(5))
+    writer = MessageWriter(batch_size=10, interval=0)
+    writer.submit([MessageTable(text="Hi", sender="User", sender_name="User", session_id="busy")])
+
+    flushing = threading.Thread(target=writer.flush_session, args=("busy",))
+    flushing.start()
+    # Sessions without pending messages don't wait for the others
+    writer.flush_session("idle")
+    assert flushing.is_alive()
+
+    release.set()
+    flushing.join(5)
+    assert not flushing.is_alive()
+    writer.stop()
+
+
+def make_messages(session_id: str, count: int) -> list[Message]:
+    # Timestamps are stored to the second, so each message gets its own second to have a defined order
+    start = datetime.now(timezone.utc) - timedelta(minutes=1)
+    return [
+        Message(
+            text=f"Message {i}",
+            sender="User",
+            sender_name="User",
+            session_id=session_id,
+            timestamp=start + timedelta(seconds=i),
+        )
+        for i in range(count)
+    ]
+
+
+def test_history_cache_serves_the_most_recent_messages():
+    session_id = str(uuid4())
+    add_messages(make_messages(session_id, 5))
+    history_cache = SessionHistoryCache(window=3)
+
+    messages = history_cache.get_messages(session_id, order="DESC", limit=2)
+    assert [message.text for message in messages] == ["Message 4", "Message 3"]
+    # Older messages are only in the database
+    assert history_cache.get_messages(session_id, order="ASC") is None
+    assert history_cache.get_messages(session_id, order="DESC", limit=4) is None
+
+    store_message(Message(text="Message 5", sender="AI", sender_name="AI", session_id=session_id))
+    messages = history_cache.get_messages(session_id, sender="AI", order="DESC", limit=1)
+    assert [message.text for message in messages] == ["Message 5"]
+    messages[0].text = "changed"
+    assert history_cache.get_messages(session_id, order="DESC", limit=1)[0].text == "Message 5"
+
+    history_cache.invalidate(session_id)
+    delete_messages(session_id)
+    assert history_cache.get_messages(session_id, order="ASC") == []
+
+
+def test_history_cache_does_not_query_the_database_between_syncs(monkeypatch):
+    session_id = str(uuid4())
+    messages = make_messages(session_id, 3)
+    add_messages(messages[:2])
+    history_cache = SessionHistoryCache(window=3, sync_interval=60)
+    assert len(history_cache.get_messages(session_id, order="ASC")) == 2
+    stored = add_messages(messages[2:])
+
+    def session_scope():
+        raise AssertionError("The cached messages are served without a query")
+
+    monkeypatch.setattr("langflow.memory.session_scope", session_scope)
+    history_cache.append(stored)
+    messages = history_cache.get_messages(session_id, order="ASC")
+    assert [message.text for message in messages] == ["Message 0", "Message 1", "Message 2"]
+
+
+def test_deleting_a_flow_drops_its_cached_history(flow):
+    from langflow.services.database.models.flow.utils import delete_flow_by_id
+
+    session_id = str(uuid4())
+    add_messages(make_messages(session_id, 2), flow_id=str(flow.id))
+    history_cache = get_history_cache()
+    assert len(history_cache.get_messages(session_id, order="ASC")) == 2
+
+    with session_scope() as session:
+        delete_flow_by_id(str(flow.id), session)
+    assert history_cache.get_messages(session_id, order="ASC") == []
+
+
+def test_chat_memory_loads_a_window_of_messages():
+    session_id = str(uuid4())
+    add_messages(make_messages(session_id, 5))
+
+    memory = LCBuiltinChatMemory(flow_id=None, session_id=session_id, n_messages=2)
+    assert [message.content for message in memory.messages] == ["Message 4", "Message 3"]
+    memory.add_messages([AIMessage(content="Message 5")])
+    assert [message.content for message in memory.messages] == ["Message 5", "Message 4"]
+    assert len(get_messages(session_id=session_id, since=datetime.now(timezone.utc) - timedelta(hours=1))) == 6
+
+
+def test_get_messages_pages_with_cursor():
+    session_id = str(uuid4())
+    add_messages(make_messages(session_id, 5))
+
+    pages = []
+    cursor = None
+    while True:
+        page = get_messages(session_id=session_id, order="DESC", limit=2, cursor=cursor)
+        pages.append([message.text for message in page])
+        cursor = get_next_messages_cursor(page, limit=2)
+        if cursor is None:
+            break
+
+    assert pages == [["Message 4", "Message 3"], ["Message 2", "Message 1"], ["Message 0"]]
+
+
+def test_get_messages_pages_through_messages_stored_in_the_same_second():
+    session_id = str(uuid4())
+    messages = make_messages(session_id, 5)
+    for message in messages:
+        message.timestamp = messages[0].timestamp
+    add_messages(messages)
+
+    texts = []
+    cursor = None
+    while True:
+        page = get_messages(session_id=session_id, order="DESC", limit=2, cursor=cursor)
+        texts.extend(message.text for message in page)
+        cursor = get_next_messages_cursor(page, limit=2)
+        if cursor is None:
+            break
+
+    assert sorted(texts) == [f"Message {i}" for i in range(5)]
+
+
 @pytest.mark.parametrize("method_name", ["message", "convert_to_langchain_type"])
 def test_convert_to_langchain(method_name):
     def convert(value):
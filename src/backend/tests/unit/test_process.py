@@ -1,4 +1,7 @@
+import json
+
 import pytest
+from langflow.processing.graph_cache import PreparedGraphCache, fingerprint_tweaks
 from langflow.processing.process import process_tweaks
 from langflow.services.deps import get_session_service
 
@@ -301,3 +304,45 @@ async def test_load_langchain_object_without_session_id(client, basic_graph_data
     graph2, artifacts2 = await session_service.load_session(session_id1, data_graph=basic_graph_data, flow_id="flow_id")
 
     assert graph1 == graph2
+
+
+def test_fingerprint_tweaks_ignores_key_order():
+    assert fingerprint_tweaks({"a": {"x": 1, "y": 2}, "b": 1}) == fingerprint_tweaks({"b": 1, "a": {"y": 2, "x": 1}})
+    assert fingerprint_tweaks({"a": 1}) != fingerprint_tweaks({"a": 2})
+    assert fingerprint_tweaks({"a": 1}, stream=True) != fingerprint_tweaks({"a": 1}, stream=False)
+
+
+def test_prepared_graph_cache(json_memory_chatbot_no_llm):
+    flow_data = json.loads(json_memory_chatbot_no_llm)["data"]
+    cache = PreparedGraphCache(max_size=4)
+
+    graph1 = cache.get_graph("flow_id", flow_data, None, user_id="user1")
+    graph2 = cache.get_graph("flow_id", flow_data, None, user_id="user2")
+    assert cache.stats()["hits"] == 1
+    assert graph1 is not graph2
+    assert graph2.user_id == "user2"
+    assert sorted(vertex.id for vertex in graph1.vertices) == sorted(vertex.id for vertex in graph2.vertices)
+
+    cache.get_graph("flow_id", flow_data, None, tweaks={"unknown": {"value": 1}})
+    assert cache.stats()["size"] == 2
+
+    cache.invalidate("flow_id")
+    assert cache.stats()["size"] == 0
+
+
+def test_prepared_graph_cache_counts_unpicklable_flows(json_memory_chatbot_no_llm, monkeypatch):
+    from langflow.processing import graph_cache
+
+    def fail_to_pickle(obj):
+        raise TypeError("cannot pickle")
+
+    monkeypatch.setattr(graph_cache.pickle, "dumps", fail_to_pickle)
+    flow_data = json.loads(json_memory_chatbot_no_llm)["data"]
+    cache = PreparedGraphCache(max_size=4)
+
+    cache.get_graph("flow_id", flow_data, None)
+    cache.get_graph("flow_id", flow_data, None)
+    assert cache.stats() == {"size": 0, "max_size": 4, "hits": 0, "misses": 2, "unpicklable_flows": 1}
+
+    cache.invalidate("flow_id")
+    assert cache.stats()["unpicklable_flows"] == 0
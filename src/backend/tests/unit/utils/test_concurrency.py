@@ -0,0 +1,86 @@
+import asyncio
+import gc
+
+import pytest
+
+from langflow.utils.concurrency import KeyedMemoryLockManager, WeakLockRegistry
+
+
+@pytest.fixture
+def client():
+    pass
+
+
+def test_weak_lock_registry_shares_locks_in_use():
+    locks = WeakLockRegistry(asyncio.Lock)
+    lock = locks["flow"]
+
+    assert locks["flow"] is lock
+    assert locks["other"] is not lock
+
+
+def test_weak_lock_registry_frees_idle_locks():
+    locks = WeakLockRegistry(asyncio.Lock)
+    for i in range(100):
+        locks[f"run-{i}"]
+    gc.collect()
+
+    assert len(locks) == 0
+
+
+@pytest.mark.asyncio
+async def test_weak_lock_registry_excludes_concurrent_holders():
+    locks = WeakLockRegistry(asyncio.Lock)
+    inside = 0
+    max_inside = 0
+
+    async def critical_section():
+        nonlocal inside, max_inside
+        async with locks["flow"]:
+            inside += 1
+            max_inside = max(max_inside, inside)
+            await asyncio.sleep(0.01)
+            inside -= 1
+
+    await asyncio.gather(*(critical_section() for _ in range(5)))
+
+    assert max_inside == 1
+    gc.collect()
+    assert len(locks) == 0
+
+
+def test_keyed_memory_lock_manager_frees_released_locks():
+    manager = KeyedMemoryLockManager()
+    with manager.lock("service"):
+        assert len(manager.locks) == 1
+    gc.collect()
+
+    assert len(manager.locks) == 0
+
+
+def test_service_manager_only_returns_ready_services():
+    from langflow.services.base import Service
+    from langflow.services.manager import ServiceManager
+
+    manager = ServiceManager()
+    visible_before_ready = []
+
+    class SlowService(Service):
+        name = "slow_service"
+
+        def set_ready(self):
+            # A concurrent get would return whatever the unlocked fast path finds
+            visible_before_ready.append(manager.services.get(self.name) is not None)
+            super().set_ready()
+
+    class SlowServiceFactory:
+        service_class = SlowService
+        dependencies = []
+
+        def create(self):
+            return SlowService()
+
+    service = manager.get(SlowService.name, default=SlowServiceFactory())
+
+    assert service.ready
+    assert visible_before_ready == [False]